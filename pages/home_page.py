@@ -2,6 +2,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.waits import (
+    wait_until, scroll_into_view, settle, input_value_committed,
+    autocomplete_populated, overlay_gone, url_changed, document_ready
+)
+from utils.selector_probe import probe, is_clickable
+from utils.tracing import traced
+from utils.network_log import log_blocking_savings
 import time
 
 
@@ -21,6 +28,7 @@ class HomePage:
         self.search_button = (By.CSS_SELECTOR, "[data-testid='enuygun-homepage-flight-submitButton']")
         self.cookie_accept = (By.XPATH, "//button[contains(@id,'accept') or contains(@class,'cookie')]")
 
+    @traced()
     def open(self, url):
         """Siteyi açar, sayfanın yüklenmesini bekler ve popup'ları kapatır"""
         self.driver.get(url)
@@ -28,9 +36,10 @@ class HomePage:
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
         print("Site acildi:", url)
-        time.sleep(3)
+        settle(self.driver, quiet_ms=500, timeout=3)
         self._handle_cookies_and_popups()
-        time.sleep(2)
+        wait_until(self.driver, overlay_gone(), timeout=2)
+        log_blocking_savings(self.driver, "home")
 
     def _handle_cookies_and_popups(self):
         """Çerez popup'ları ve diğer popup'ları kapatır"""
@@ -47,18 +56,15 @@ class HomePage:
             ]
             
             cookie_closed = False
-            for i, selector in enumerate(cookie_selectors):
-                try:
-                    cookie_btn = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable(selector)
-                    )
+            try:
+                cookie_btn, selector = probe(self.driver, cookie_selectors, timeout=2, accept=is_clickable)
+                if cookie_btn:
                     self.driver.execute_script("arguments[0].click();", cookie_btn)
-                    print(f"[OK] Cookie popup kapatıldı (selector {i+1})")
-                    time.sleep(1)
+                    print(f"[OK] Cookie popup kapatıldı (selector {cookie_selectors.index(selector)+1})")
+                    wait_until(self.driver, overlay_gone(), timeout=1)
                     cookie_closed = True
-                    break
-                except:
-                    continue
+            except:
+                pass
             
             if not cookie_closed:
                 print("[INFO] Cookie popup bulunamadı")
@@ -72,18 +78,15 @@ class HomePage:
             ]
             
             popup_closed = False
-            for i, selector in enumerate(close_button_selectors):
-                try:
-                    close_btn = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable(selector)
-                    )
+            try:
+                close_btn, selector = probe(self.driver, close_button_selectors, timeout=2, accept=is_clickable)
+                if close_btn:
                     self.driver.execute_script("arguments[0].click();", close_btn)
-                    print(f"[OK] Popup kapatıldı (close button {i+1})")
-                    time.sleep(1)
+                    print(f"[OK] Popup kapatıldı (close button {close_button_selectors.index(selector)+1})")
+                    wait_until(self.driver, overlay_gone(), timeout=1)
                     popup_closed = True
-                    break
-                except:
-                    continue
+            except:
+                pass
             
             if not popup_closed:
                 print("[INFO] Kapatılacak popup bulunamadı")
@@ -98,12 +101,13 @@ class HomePage:
             except:
                 pass
             
-            time.sleep(2)
+            settle(self.driver, quiet_ms=300, timeout=2)
             print("[OK] Popup handling tamamlandı, sayfa hazır")
             
         except Exception as e:
             print(f"[WARNING] Popup handling error: {str(e)}")
 
+    @traced()
     def search_round_trip(self, departure, destination, departure_date, return_date):
         """Gidiş-dönüş uçuş araması yapar
         
@@ -127,19 +131,16 @@ class HomePage:
             ]
             
             roundtrip_clicked = False
-            for i, selector in enumerate(roundtrip_selectors):
-                try:
-                    roundtrip = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(selector))
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", roundtrip)
-                    time.sleep(0.5)
+            try:
+                roundtrip, selector = probe(self.driver, roundtrip_selectors, timeout=5, accept=is_clickable)
+                if roundtrip:
+                    scroll_into_view(self.driver, roundtrip)
                     self.driver.execute_script("arguments[0].click();", roundtrip)
-                    print(f"[OK] Gidiş-Dönüş butonu tıklandı (selector {i+1})")
-                    time.sleep(2)
+                    print(f"[OK] Gidiş-Dönüş butonu tıklandı (selector {roundtrip_selectors.index(selector)+1})")
+                    settle(self.driver, quiet_ms=300, timeout=2)
                     roundtrip_clicked = True
-                    break
-                except Exception as e:
-                    print(f"[WARNING] Selector {i+1} başarısız: {str(e)}")
-                    continue
+            except Exception as e:
+                print(f"[WARNING] Gidiş-Dönüş selector'ları başarısız: {str(e)}")
             
             if not roundtrip_clicked:
                 print("[WARNING] Gidiş-Dönüş butonu bulunamadı, varsayılan form kullanılacak")
@@ -147,8 +148,6 @@ class HomePage:
         except Exception as e:
             print(f"[WARNING] Gidiş-Dönüş butonu hatası: {str(e)}")
 
-        time.sleep(1)
-
         # Kalkış noktası
         origin = None
         try:
@@ -178,23 +177,20 @@ class HomePage:
         if not origin:
             raise Exception("Kalkış input alanı bulunamadı!")
         
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", origin)
-        time.sleep(0.5)
+        scroll_into_view(self.driver, origin)
         
         try:
             origin.click()
         except:
             self.driver.execute_script("arguments[0].click();", origin)
         
-        time.sleep(0.5)
-        
         try:
             origin.clear()
         except:
             self.driver.execute_script("arguments[0].value = '';", origin)
         
         origin.send_keys(departure)
-        time.sleep(1.2)
+        wait_until(self.driver, autocomplete_populated(), timeout=3)
         
         try:
             autocomplete_selectors = [
@@ -204,18 +200,14 @@ class HomePage:
             ]
             
             autocomplete_selected = False
-            for selector in autocomplete_selectors:
-                try:
-                    autocomplete_item = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable(selector)
-                    )
-                    if autocomplete_item and autocomplete_item.is_displayed():
-                        autocomplete_item.click()
-                        autocomplete_selected = True
-                        print(f"[OK] Autocomplete'ten seçildi: {departure}")
-                        break
-                except:
-                    continue
+            try:
+                autocomplete_item, _ = probe(self.driver, autocomplete_selectors, timeout=2, accept=is_clickable)
+                if autocomplete_item:
+                    autocomplete_item.click()
+                    autocomplete_selected = True
+                    print(f"[OK] Autocomplete'ten seçildi: {departure}")
+            except:
+                pass
             
             if not autocomplete_selected:
                 origin.send_keys(Keys.ENTER)
@@ -224,7 +216,7 @@ class HomePage:
             origin.send_keys(Keys.ENTER)
             print(f"[OK] Kalkış: {departure} (fallback ENTER)")
         
-        time.sleep(0.5)
+        wait_until(self.driver, input_value_committed(origin, departure), timeout=2)
 
         # Varış noktası
         dest = None
@@ -255,25 +247,23 @@ class HomePage:
         if not dest:
             raise Exception("Varış input alanı bulunamadı!")
         
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dest)
-        time.sleep(0.5)
+        scroll_into_view(self.driver, dest)
         
         try:
             dest.click()
         except:
             self.driver.execute_script("arguments[0].click();", dest)
         
-        time.sleep(0.5)
-        
         try:
             dest.clear()
         except:
             self.driver.execute_script("arguments[0].value = '';", dest)
         
         dest.send_keys(destination)
-        time.sleep(1.5)
+        wait_until(self.driver, autocomplete_populated(), timeout=3)
         
         autocomplete_selected = False
+        committed_names = [destination]
         try:
             autocomplete_list_selectors = [
                 (By.CSS_SELECTOR, "[role='listbox']"),
@@ -282,17 +272,12 @@ class HomePage:
                 (By.XPATH, "//div[contains(@class, 'autocomplete')]"),
             ]
             
-            autocomplete_list = None
-            for selector in autocomplete_list_selectors:
-                try:
-                    autocomplete_list = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    if autocomplete_list and autocomplete_list.is_displayed():
-                        print(f"[OK] Autocomplete listesi bulundu")
-                        break
-                except:
-                    continue
+            autocomplete_list, _ = probe(
+                self.driver, autocomplete_list_selectors, timeout=3,
+                accept=lambda element: element.is_displayed()
+            )
+            if autocomplete_list:
+                print(f"[OK] Autocomplete listesi bulundu")
             
             if autocomplete_list:
                 options = autocomplete_list.find_elements(By.CSS_SELECTOR, "li, div[role='option'], [class*='option'], [class*='item']")
@@ -311,6 +296,7 @@ class HomePage:
                                 'nicosia' in option_text.lower()):
                                 option.click()
                                 autocomplete_selected = True
+                                committed_names.append(option_text.split(',')[0].strip())
                                 print(f"[OK] Autocomplete'ten seçildi: {destination} (item: {option_text})")
                                 break
                         except:
@@ -321,6 +307,7 @@ class HomePage:
                             first_text = options[0].text.strip()
                             options[0].click()
                             autocomplete_selected = True
+                            committed_names.append(first_text.split(',')[0].strip())
                             print(f"[OK] İlk autocomplete seçeneği seçildi: {first_text}")
                         except:
                             pass
@@ -334,7 +321,7 @@ class HomePage:
             dest.send_keys(Keys.ENTER)
             print(f"[OK] Varış: {destination} (fallback ENTER)")
         
-        time.sleep(0.8)
+        wait_until(self.driver, input_value_committed(dest, committed_names), timeout=2)
 
         # Gidiş tarihi
         dep_date_input = None
@@ -365,29 +352,23 @@ class HomePage:
         if not dep_date_input:
             raise Exception("Gidiş tarihi input alanı bulunamadı!")
         
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dep_date_input)
-        time.sleep(0.5)
+        scroll_into_view(self.driver, dep_date_input)
         
         try:
             dep_date_input.click()
         except:
             self.driver.execute_script("arguments[0].click();", dep_date_input)
         
-        time.sleep(0.5)
-        
         # Stale element sorununu önlemek için JavaScript kullan
         try:
-            self.driver.execute_script("arguments[0].value = arguments[1];", dep_date_input, departure_date)
-            time.sleep(0.3)
-            self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", dep_date_input)
-            time.sleep(0.5)
+            self._commit_date_value(dep_date_input, departure_date)
         except Exception as e:
             try:
                 dep_date_input.send_keys(Keys.CONTROL + "a")
                 dep_date_input.send_keys(departure_date)
-                time.sleep(0.5)
+                wait_until(self.driver, input_value_committed(dep_date_input, departure_date), timeout=1)
                 dep_date_input.send_keys(Keys.ENTER)
-                time.sleep(0.5)
+                settle(self.driver, quiet_ms=200, timeout=1)
             except:
                 raise Exception(f"Gidiş tarihi ayarlanamadı: {str(e)}")
         
@@ -425,25 +406,19 @@ class HomePage:
         def set_return_date():
             """Dönüş tarihini ayarlar, stale element durumunda yeniden bulur"""
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ret_date_input)
-                time.sleep(0.5)
+                scroll_into_view(self.driver, ret_date_input)
                 
                 try:
                     ret_date_input.click()
                 except:
                     self.driver.execute_script("arguments[0].click();", ret_date_input)
                 
-                time.sleep(0.5)
-                
-                self.driver.execute_script("arguments[0].value = arguments[1];", ret_date_input, return_date)
-                time.sleep(0.3)
-                self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", ret_date_input)
-                time.sleep(0.5)
+                self._commit_date_value(ret_date_input, return_date)
                 
             except Exception as stale_error:
                 if "stale" in str(stale_error).lower():
                     print("[WARNING] Stale element detected, re-finding return date input...")
-                    time.sleep(1)
+                    settle(self.driver, quiet_ms=300, timeout=1)
                     try:
                         new_ret_date = self.wait.until(EC.element_to_be_clickable(self.return_date))
                     except:
@@ -457,14 +432,9 @@ class HomePage:
                             if not new_ret_date:
                                 raise Exception("Dönüş tarihi input yeniden bulunamadı!")
                     
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", new_ret_date)
-                    time.sleep(0.5)
+                    scroll_into_view(self.driver, new_ret_date)
                     self.driver.execute_script("arguments[0].click();", new_ret_date)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].value = arguments[1];", new_ret_date, return_date)
-                    time.sleep(0.3)
-                    self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", new_ret_date)
-                    time.sleep(0.5)
+                    self._commit_date_value(new_ret_date, return_date)
                 else:
                     raise
         
@@ -508,17 +478,19 @@ class HomePage:
         if not search_btn:
             raise Exception("Arama butonu bulunamadı!")
         
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", search_btn)
-        time.sleep(2)
+        scroll_into_view(self.driver, search_btn, timeout=2)
         
         try:
             popup_overlay = self.driver.find_element(By.CSS_SELECTOR, ".onetrust-pc-dark-filter")
             if popup_overlay.is_displayed():
                 self._handle_cookies_and_popups()
-                time.sleep(2)
+                wait_until(self.driver, overlay_gone(), timeout=2)
         except:
             pass
         
+        url_before_search = self.driver.current_url
+        handles_before_search = len(self.driver.window_handles)
+        
         try:
             search_btn.click()
             print("[OK] Arama başlatıldı")
@@ -528,7 +500,7 @@ class HomePage:
             print("[OK] Arama başlatıldı (JavaScript ile)")
 
         # Otel sekmesi kontrolü ve yönetimi
-        time.sleep(3)
+        wait_until(self.driver, url_changed(url_before_search, handles_before_search), timeout=10)
         print("[SEARCH] Arama sonuç sayfası yükleniyor...")
         
         try:
@@ -571,7 +543,7 @@ class HomePage:
                 if "otel" in current_url or "hotel" in current_url:
                     print("[ERROR] HATA: Otel sayfasına yönlendirildi! Uçuş sayfasına geri dönülüyor...")
                     self.driver.get("https://www.enuygun.com/ucak-bileti/")
-                    time.sleep(2)
+                    wait_until(self.driver, document_ready(), timeout=5)
                     raise Exception("Arama sonrası otel sayfasına yönlendirildi - bu bir hata!")
                 
         except Exception as e:
@@ -584,7 +556,126 @@ class HomePage:
         else:
             print(f"[WARNING] URL beklenmedik format: {current_url}")
         
-        time.sleep(2)
+        wait_until(self.driver, document_ready(), timeout=5)
+
+    @staticmethod
+    def _slugify(city):
+        """Şehir adını URL slug'ına çevirir (örn: 'İstanbul' -> 'istanbul')"""
+        table = str.maketrans("İIıŞşĞğÜüÖöÇç", "iiissgguuoocc")
+        slug = city.translate(table).lower().strip()
+        return "-".join(part for part in "".join(c if c.isalnum() else " " for c in slug).split())
+
+    def build_search_url(self, base_url, url_template, origin_code, destination_code,
+                         departure_date, return_date, departure="", destination=""):
+        """Sonuç sayfası URL'ini IATA kodları ve tarihlerden oluşturur
+        
+        Args:
+            base_url: Site kök adresi (config: site.url)
+            url_template: URL şablonu (config: search.url_template)
+            origin_code: Kalkış IATA kodu (örn: IST)
+            destination_code: Varış IATA kodu (örn: ESB)
+            departure_date: Gidiş tarihi (format: DD.MM.YYYY)
+            return_date: Dönüş tarihi (format: DD.MM.YYYY)
+            departure: Kalkış şehri (slug için, opsiyonel)
+            destination: Varış şehri (slug için, opsiyonel)
+            
+        Returns:
+            str: Doğrudan sonuç sayfasını açan URL
+        """
+        return url_template.format(
+            base=base_url.rstrip('/'),
+            origin_code=origin_code.lower(),
+            destination_code=destination_code.lower(),
+            origin_slug=self._slugify(departure or origin_code),
+            destination_slug=self._slugify(destination or destination_code),
+            departure_date=departure_date,
+            return_date=return_date,
+        )
+
+    def search_round_trip_deep_link(self, search_url, timeout=15):
+        """Formu kullanmadan sonuç sayfasını doğrudan açar
+        
+        Args:
+            search_url: build_search_url ile oluşturulan URL
+            timeout: Sonuç listesinin görünmesi için maksimum süre
+            
+        Returns:
+            bool: Uçuş sonuç sayfasına ulaşıldıysa True
+        """
+        print(f"[INFO] Deep-link ile arama: {search_url}")
+        self.driver.get(search_url)
+        
+        current_url = self.driver.current_url.lower()
+        if "otel" in current_url or "hotel" in current_url:
+            print(f"[WARNING] Deep-link otel sayfasına yönlendirdi: {current_url}")
+            return False
+        
+        results_ready = wait_until(self.driver, EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ".flight-list-body, [class*='flight-list-body']")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='summary-airports']")),
+        ), timeout=timeout)
+        
+        if results_ready:
+            print("[OK] Deep-link ile uçuş sonuç sayfasına ulaşıldı")
+            return True
+        
+        print(f"[WARNING] Deep-link sonrası uçuş listesi bulunamadı: {self.driver.current_url}")
+        return False
+
+    def search_with_config(self, config, departure, destination, departure_date, return_date,
+                           origin_code=None, destination_code=None):
+        """config.yaml `search.mode` değerine göre aramayı yapar
+        
+        "deep_link" modunda sonuç sayfası URL ile doğrudan açılır; başarısız olursa
+        veya IATA kodu yoksa ana sayfa + form akışına dönülür.
+        
+        Args:
+            config: load_config() çıktısı
+            departure: Kalkış şehri
+            destination: Varış şehri
+            departure_date: Gidiş tarihi (format: DD.MM.YYYY)
+            return_date: Dönüş tarihi (format: DD.MM.YYYY)
+            origin_code: Kalkış IATA kodu (varsayılan: test_data.airport_codes veya
+                defaults.airport_codes.departure)
+            destination_code: Varış IATA kodu (varsayılan: test_data.airport_codes veya
+                defaults.airport_codes.destination)
+        """
+        url = config['site']['url']
+        search_config = config.get('search', {})
+        defaults = config.get('defaults', {})
+        default_codes = defaults.get('airport_codes', {})
+        city_codes = config.get('test_data', {}).get('airport_codes', {})
+        if not origin_code:
+            origin_code = city_codes.get(departure) or (
+                default_codes.get('departure') if departure == defaults.get('departure_city') else None)
+        if not destination_code:
+            destination_code = city_codes.get(destination) or (
+                default_codes.get('destination') if destination == defaults.get('destination_city') else None)
+        
+        if search_config.get('mode') == 'deep_link' and origin_code and destination_code:
+            search_url = self.build_search_url(
+                url, search_config['url_template'], origin_code, destination_code,
+                departure_date, return_date, departure, destination
+            )
+            try:
+                if self.search_round_trip_deep_link(search_url):
+                    return
+            except Exception as e:
+                print(f"[WARNING] Deep-link arama hatası: {str(e)}")
+            
+            if not search_config.get('fallback_to_form', True):
+                raise Exception("Deep-link arama başarısız ve form fallback kapalı")
+            print("[INFO] Form akışına geri dönülüyor...")
+        
+        self.open(url)
+        self.search_round_trip(departure, destination, departure_date, return_date)
+
+    def _commit_date_value(self, date_input, date_value):
+        """Tarih input'una değeri JavaScript ile yazar ve değerin oturmasını bekler"""
+        self.driver.execute_script("arguments[0].value = arguments[1];", date_input, date_value)
+        wait_until(self.driver, input_value_committed(date_input, date_value), timeout=1)
+        self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", date_input)
+        settle(self.driver, quiet_ms=200, timeout=1)
 
     def capture_screenshot(self, name):
         """Ekran görüntüsü alır
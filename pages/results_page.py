@@ -3,21 +3,251 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import datetime
 import time
+import uuid
+from contextlib import nullcontext
 from selenium.webdriver.common.action_chains import ActionChains
+from utils.selector_cache import get_selector_cache
+from utils.selector_probe import probe, implicit_wait_disabled
+from utils.tracing import traced
+from utils.network_log import get_network_log, log_blocking_savings
+from utils.waits import wait_until, search_results_settled, settle
+from utils.flight_api import capture_search_payloads, map_api_flights
+from utils.html_extractor import extract_html
+
+
+def candidate_accepted(field, candidate):
+    """Aday (text, data-price) değerinin alan için kullanılabilir olup olmadığını döndürür
+
+    _build_flight_info bir alanda ilk kabul edilen adayı kullanır; selector
+    önbelleği de sadece kabul edilen adayın selector'ını kazanan sayar.
+    """
+    if candidate is None:
+        return False
+    text = (candidate[0] or "").strip()
+    if field in ('departure_time', 'arrival_time'):
+        return bool(text) and ':' in text
+    if field == 'airline':
+        return bool(text) and text.lower() != "unknown"
+    if field == 'price':
+        if candidate[1]:
+            try:
+                float(candidate[1])
+                return True
+            except (TypeError, ValueError):
+                pass
+        return any(char.isdigit() for char in text)
+    return bool(text)
 
 
 class ResultsPage:
     """Enuygun sonuç sayfası için Page Object Model sınıfı"""
+
+    # Uçuş kartı arama sırası (extract_all_flight_data)
+    FLIGHT_ITEM_SELECTORS = [
+        (By.CSS_SELECTOR, "div.flight-item"),
+        (By.CSS_SELECTOR, "div[id^='flight-']"),
+        (By.CSS_SELECTOR, "[class*='flight-item']"),
+        (By.XPATH, "//div[@class='flight-item' or starts-with(@id, 'flight-')]"),
+        (By.CSS_SELECTOR, ".flight-list-body"),
+        (By.CSS_SELECTOR, "[class*='flight-list-body']"),
+    ]
+    FLIGHT_ITEM_INNER_SELECTOR = "div.flight-item, div[id^='flight-']"
+    FLIGHT_CARD_LOCATOR = (By.CSS_SELECTOR, "div[class*='summary-airports']")
+
+    # Kart içi alan selector'ları - liste sırası fallback sırasıdır
+    FLIGHT_FIELD_SELECTORS = {
+        'departure_time': [
+            (By.CSS_SELECTOR, "[data-testid='departureTime']"),
+            (By.CSS_SELECTOR, ".flight-departure-time"),
+            (By.CSS_SELECTOR, "[data-testid*='departureTime']"),
+            (By.XPATH, ".//div[@data-testid='departureTime']"),
+            (By.XPATH, ".//div[contains(@class, 'flight-departure-time')]"),
+        ],
+        'arrival_time': [
+            (By.CSS_SELECTOR, "[data-testid='arrivalTime']"),
+            (By.CSS_SELECTOR, ".flight-arrival-time"),
+            (By.CSS_SELECTOR, "[data-testid*='arrivalTime']"),
+            (By.XPATH, ".//div[@data-testid='arrivalTime']"),
+            (By.XPATH, ".//div[contains(@class, 'arrival-time')]"),
+        ],
+        'airline': [
+            (By.CSS_SELECTOR, "[data-testid='AJet'], [data-testid='THY'], [data-testid='Pegasus'], [data-testid='AnadoluJet']"),
+            (By.CSS_SELECTOR, ".summary-marketing-airlines"),
+            (By.CSS_SELECTOR, "[class*='summary-marketing-airlines']"),
+            (By.XPATH, ".//div[@data-testid and (contains(@data-testid, 'AJet') or contains(@data-testid, 'THY') or contains(@data-testid, 'Pegasus'))]"),
+            (By.XPATH, ".//div[contains(@class, 'summary-marketing-airlines')]"),
+        ],
+        'price': [
+            (By.CSS_SELECTOR, "[data-price]"),
+            (By.CSS_SELECTOR, ".summary-average-price[data-price]"),
+            (By.CSS_SELECTOR, ".money-int"),
+            (By.CSS_SELECTOR, "[class*='money-int']"),
+            (By.CSS_SELECTOR, "[class*='money']"),
+            (By.XPATH, ".//span[contains(@class, 'money-int')]"),
+            (By.XPATH, ".//div[contains(@class, 'summary-average-price')]//span[contains(@class, 'money-int')]"),
+        ],
+        'connection': [
+            (By.CSS_SELECTOR, "[data-testid='transferStateDirect']"),
+            (By.CSS_SELECTOR, "[data-testid*='transferState']"),
+            (By.CSS_SELECTOR, ".summary-transit"),
+            (By.CSS_SELECTOR, "[class*='summary-transit']"),
+            (By.XPATH, ".//div[contains(@class, 'summary-transit')]"),
+            (By.XPATH, ".//div[@data-testid and contains(@data-testid, 'transferState')]"),
+        ],
+        'duration': [
+            (By.CSS_SELECTOR, "[data-testid='departureFlightTime']"),
+            (By.CSS_SELECTOR, "[data-testid*='FlightTime']"),
+            (By.CSS_SELECTOR, "[data-testid*='duration']"),
+            (By.XPATH, ".//span[@data-testid='departureFlightTime']"),
+            (By.XPATH, ".//span[contains(@data-testid, 'FlightTime')]"),
+        ],
+    }
+
+    # Tüm kartları ve her alan için selector başına ilk eşleşmeyi tek seferde toplar.
+    # arguments[0]: [by, selector, container içi selector | null] kart planı
+    # arguments[1]: {alan: [[by, selector], ...]}
+    # arguments[2]: true ise son çağrıdan beri içeriği değişmeyen kartlar atlanır (harvest)
+    # arguments[3]: [başlangıç, bitiş] kart aralığı veya null (tümü)
+    _BATCH_EXTRACT_SCRIPT = """
+        var cardPlan = arguments[0];
+        var fieldPlan = arguments[1];
+        var harvestToken = arguments[2] || null;
+        var range = arguments[3] || null;
+
+        function findAll(root, by, value) {
+            if (by === 'xpath') {
+                var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) {
+                    nodes.push(snapshot.snapshotItem(i));
+                }
+                return nodes;
+            }
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        }
+
+        function findFirst(root, by, value) {
+            try {
+                var nodes = findAll(root, by, value);
+                return nodes.length ? nodes[0] : null;
+            } catch (e) {
+                return null;
+            }
+        }
+
+        var cards = [];
+        var source = null;
+        for (var p = 0; p < cardPlan.length && cards.length === 0; p++) {
+            var step = cardPlan[p];
+            try {
+                if (step[2]) {
+                    var container = findFirst(document, step[0], step[1]);
+                    cards = container ? findAll(container, 'css selector', step[2]) : [];
+                } else {
+                    cards = findAll(document, step[0], step[1]);
+                }
+            } catch (e) {
+                cards = [];
+            }
+            if (cards.length) {
+                source = step[1];
+            }
+        }
+
+        if (harvestToken) {
+            // Sanal scroll DOM node'larını yeniden kullanabilir; imza metin içeriğidir.
+            // Token her harvest çağrısında yenilenir, önceki harvest'in işaretleri sayılmaz
+            cards = cards.filter(function (card) {
+                var signature = harvestToken + '|' + (card.textContent || '');
+                if (card.__enuygunHarvest === signature) {
+                    return false;
+                }
+                card.__enuygunHarvest = signature;
+                return true;
+            });
+        }
+
+        var total = cards.length;
+        if (range) {
+            cards = cards.slice(range[0], range[1]);
+        }
+
+        var fields = Object.keys(fieldPlan);
+        var rows = cards.map(function (card) {
+            var row = {};
+            fields.forEach(function (field) {
+                row[field] = fieldPlan[field].map(function (selector) {
+                    var el = findFirst(card, selector[0], selector[1]);
+                    if (!el) {
+                        return null;
+                    }
+                    return [el.innerText || el.textContent || '', el.getAttribute('data-price')];
+                });
+            });
+            return row;
+        });
+
+        return {source: source, total: total, cards: rows};
+    """
+
+    # Sonuç listesini kaydıran en yakın scroll container'ı (yoksa sayfayı) bir adım kaydırır.
+    # arguments[0]: kart selector'ı, arguments[1]: görünür yüksekliğin oranı olarak adım
+    _SCROLL_RESULTS_SCRIPT = """
+        var el = document.querySelector(arguments[0]);
+        while (el && el !== document.body && el !== document.documentElement) {
+            var style = window.getComputedStyle(el);
+            if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && el.scrollHeight > el.clientHeight) {
+                break;
+            }
+            el = el.parentElement;
+        }
+        var target = (el && el !== document.body && el !== document.documentElement) ? el : document.scrollingElement;
+        target.scrollTop = target.scrollTop + Math.max(target.clientHeight * arguments[1], 200);
+    """
     
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 20)
 
         # Locator'lar
-        self.flight_cards = (By.CSS_SELECTOR, "div[class*='summary-airports']")
+        self.flight_cards = self.FLIGHT_CARD_LOCATOR
         self.departure_times = (By.CSS_SELECTOR, "[data-testid*='departureTime']")
         self.loader = (By.CSS_SELECTOR, "[data-testid*='loading']")
+        self.selector_cache = get_selector_cache()
+
+    def _find_first(self, field, selectors, root=None, timeout=0, accept=None):
+        """Fallback selector listesini önbellekteki kazanan sırasıyla dener
+        
+        Zincir implicit wait olmadan tek taramada denenir; hiçbiri eşleşmezse
+        selector başına değil, zincirin tamamı için en fazla timeout beklenir.
+        
+        Args:
+            field: Önbellek alan adı (örn: "price")
+            selectors: Orijinal sıradaki (By, value) listesi
+            root: Aramanın yapılacağı element (varsayılan: tüm sayfa)
+            timeout: Hiçbiri eşleşmezse toplam bekleme süresi (saniye)
+            accept: Elementi kabul edip etmeyeceğini belirleyen opsiyonel callable
+            
+        Returns:
+            tuple: (element, orijinal listedeki index) veya (None, None)
+        """
+        ordered = self.selector_cache.order('results', field, selectors)
+        try:
+            element, matched = probe(self.driver, ordered, root=root, timeout=timeout, accept=accept)
+        except:
+            element, matched = None, None
+        
+        for selector in ordered:
+            if selector == matched:
+                self.selector_cache.record('results', field, selector, hit=True)
+                break
+            self.selector_cache.record('results', field, selector, hit=False)
+        
+        if element is None:
+            return None, None
+        return element, selectors.index(matched)
 
+    @traced()
     def wait_for_results(self):
         """Arama sonuçlarının yüklenmesini bekler"""
         try:
@@ -35,7 +265,27 @@ class ResultsPage:
             if "ucak" not in current_url and "flight" not in current_url and "bileti" not in current_url:
                 print(f"[WARNING] URL uçuş sayfası gibi görünmüyor: {current_url}")
             
-            self._wait_for_loader_to_disappear()
+            # Hazır olma sinyali: bekleyen XHR/Fetch kalmadı + kart sayısı sabitlendi.
+            # Performance log alınamıyorsa (Firefox) sadece kart sayısına bakılır
+            network_log = get_network_log(self.driver)
+            settings = network_log.settings
+            flight_found = bool(wait_until(
+                self.driver,
+                search_results_settled(
+                    network_log,
+                    self.FLIGHT_ITEM_INNER_SELECTOR,
+                    stable_ms=settings.get('card_stable_ms', 600),
+                    api_grace=settings.get('api_grace_seconds', 3),
+                    network_idle_ms=settings.get('network_idle_ms', 500),
+                    url_patterns=network_log.search_api_patterns,
+                ),
+                timeout=settings.get('results_timeout', 20), poll=0.2,
+            ))
+            if flight_found:
+                network_log.consume_search_requests()
+                print("[OK] Arama istekleri tamamlandı, kart sayısı sabitlendi")
+            else:
+                self._wait_for_loader_to_disappear()
             
             flight_list_body_selectors = [
                 (By.CSS_SELECTOR, ".flight-list-body"),
@@ -43,8 +293,9 @@ class ResultsPage:
                 (By.XPATH, "//div[contains(@class, 'flight-list-body')]"),
             ]
             
-            flight_found = False
             for selector in flight_list_body_selectors:
+                if flight_found:
+                    break
                 try:
                     WebDriverWait(self.driver, 15).until(
                         EC.presence_of_element_located(selector)
@@ -77,6 +328,7 @@ class ResultsPage:
                 flight_cards = self.driver.find_elements(*self.flight_cards)
             
             print(f"[OK] {len(flight_cards)} uçuş kartı bulundu.")
+            log_blocking_savings(self.driver, "results")
             
             if len(flight_cards) == 0:
                 self._capture_screenshot("no_results")
@@ -88,6 +340,7 @@ class ResultsPage:
             self._capture_screenshot("results_error")
             print("[WARNING] Hata olsa bile veri çıkarma denemesi yapılacak...")
 
+    @traced()
     def apply_time_filter_with_sliders(self, departure_start=10, departure_end=18):
         """Saat filtresini slider kullanarak uygular
         
@@ -108,15 +361,9 @@ class ResultsPage:
                 (By.XPATH, "//i[@class='ei-timer']/following-sibling::*[contains(text(), 'Gidiş kalkış')]/parent::*"),
             ]
             
-            for i, selector in enumerate(card_selectors):
-                try:
-                    time_filter_card = WebDriverWait(self.driver, 8).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    print(f"[OK] Saat filtresi card bulundu (selector {i+1})")
-                    break
-                except:
-                    continue
+            time_filter_card, index = self._find_first('time_filter_card', card_selectors, timeout=8)
+            if time_filter_card:
+                print(f"[OK] Saat filtresi card bulundu (selector {index+1})")
             
             if not time_filter_card:
                 print("[ERROR] Saat filtresi card bulunamadı!")
@@ -131,14 +378,13 @@ class ResultsPage:
                 (By.XPATH, "//div[contains(@class, 'ctx-filter-departure-return-time')]//i[contains(@class, 'ei-expand-more')]"),
             ]
             
-            for i, selector in enumerate(expand_selectors):
-                try:
-                    expand_icon = time_filter_card.find_element(*selector)
-                    if expand_icon.is_displayed():
-                        print(f"[OK] Expand ikonu bulundu (selector {i+1})")
-                        break
-                except:
-                    continue
+            expand_icon, index = self._find_first(
+                'time_filter_expand', expand_selectors,
+                root=time_filter_card,
+                accept=lambda element: element.is_displayed()
+            )
+            if expand_icon:
+                print(f"[OK] Expand ikonu bulundu (selector {index+1})")
             
             if expand_icon:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", expand_icon)
@@ -159,15 +405,9 @@ class ResultsPage:
                 (By.XPATH, "//div[contains(@class, 'rc-slider')]"),
             ]
             
-            for i, selector in enumerate(slider_selectors):
-                try:
-                    slider_container = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    print(f"[OK] Slider container bulundu (selector {i+1})")
-                    break
-                except:
-                    continue
+            slider_container, index = self._find_first('time_slider', slider_selectors, timeout=10)
+            if slider_container:
+                print(f"[OK] Slider container bulundu (selector {index+1})")
             
             if not slider_container:
                 print("[ERROR] Slider container bulunamadı!")
@@ -428,19 +668,20 @@ class ResultsPage:
             bool: Doğrulama başarılı ise True
         """
         try:
-            departure_elements = self.driver.find_elements(*self.departure_times)
-            
-            if not departure_elements:
-                alt_selectors = [
-                    (By.CSS_SELECTOR, "[class*='departure-time']"),
-                    (By.CSS_SELECTOR, "[class*='time']"),
-                    (By.XPATH, "//div[contains(@class, 'time') or contains(@class, 'departure')]"),
-                ]
+            with implicit_wait_disabled(self.driver):
+                departure_elements = self.driver.find_elements(*self.departure_times)
                 
-                for selector in alt_selectors:
-                    departure_elements = self.driver.find_elements(*selector)
-                    if departure_elements:
-                        break
+                if not departure_elements:
+                    alt_selectors = [
+                        (By.CSS_SELECTOR, "[class*='departure-time']"),
+                        (By.CSS_SELECTOR, "[class*='time']"),
+                        (By.XPATH, "//div[contains(@class, 'time') or contains(@class, 'departure')]"),
+                    ]
+                    
+                    for selector in alt_selectors:
+                        departure_elements = self.driver.find_elements(*selector)
+                        if departure_elements:
+                            break
             
             valid_count = 0
             total_count = len(departure_elements)
@@ -560,15 +801,9 @@ class ResultsPage:
                 (By.XPATH, "//i[@class='ei-flight-up']/following-sibling::*[contains(text(), 'Havayolları')]/parent::*"),
             ]
             
-            for i, selector in enumerate(airline_card_selectors):
-                try:
-                    airline_card = WebDriverWait(self.driver, 8).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    print(f"[OK] Havayolları card bulundu (selector {i+1})")
-                    break
-                except:
-                    continue
+            airline_card, index = self._find_first('airline_filter_card', airline_card_selectors, timeout=8)
+            if airline_card:
+                print(f"[OK] Havayolları card bulundu (selector {index+1})")
             
             if not airline_card:
                 print("[ERROR] Havayolları card bulunamadı!")
@@ -583,14 +818,13 @@ class ResultsPage:
                 (By.XPATH, "//div[contains(@class, 'ctx-filter-airline')]//i[contains(@class, 'ei-expand-more')]"),
             ]
             
-            for i, selector in enumerate(expand_selectors):
-                try:
-                    expand_icon = airline_card.find_element(*selector)
-                    if expand_icon.is_displayed():
-                        print(f"[OK] Havayolları expand ikonu bulundu (selector {i+1})")
-                        break
-                except:
-                    continue
+            expand_icon, index = self._find_first(
+                'airline_filter_expand', expand_selectors,
+                root=airline_card,
+                accept=lambda element: element.is_displayed()
+            )
+            if expand_icon:
+                print(f"[OK] Havayolları expand ikonu bulundu (selector {index+1})")
             
             if expand_icon:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", expand_icon)
@@ -614,15 +848,9 @@ class ResultsPage:
                 (By.XPATH, "//label[contains(., 'Türk Hava Yolları')]//input[@type='checkbox']"),
             ]
             
-            for i, selector in enumerate(thy_selectors):
-                try:
-                    thy_checkbox = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    print(f"[OK] THY checkbox bulundu (selector {i+1})")
-                    break
-                except:
-                    continue
+            thy_checkbox, index = self._find_first('thy_checkbox', thy_selectors, timeout=10)
+            if thy_checkbox:
+                print(f"[OK] THY checkbox bulundu (selector {index+1})")
             
             if thy_checkbox:
                 if not thy_checkbox.is_selected():
@@ -707,14 +935,13 @@ class ResultsPage:
                     ]
                     
                     airline_name = None
-                    for selector in airline_selectors:
-                        try:
-                            airline_elem = card.find_element(*selector)
-                            airline_name = airline_elem.text.strip() or airline_elem.get_attribute('alt')
-                            if airline_name:
-                                break
-                        except:
-                            continue
+                    airline_elem, _ = self._find_first(
+                        'verify_airline', airline_selectors,
+                        root=card,
+                        accept=lambda element: element.text.strip() or element.get_attribute('alt')
+                    )
+                    if airline_elem:
+                        airline_name = airline_elem.text.strip() or airline_elem.get_attribute('alt')
                     
                     if airline_name and airline_name.lower() != "unknown":
                         if any(keyword in airline_name.lower() for keyword in ['türk', 'turkish', 'thy', 'tk']):
@@ -742,6 +969,7 @@ class ResultsPage:
             print(f"[ERROR] THY doğrulama hatası: {str(e)}")
             return True
 
+    @traced()
     def get_all_prices(self):
         """Tüm uçuş fiyatlarını döndürür"""
         try:
@@ -758,14 +986,13 @@ class ResultsPage:
                     ]
                     
                     price_text = ""
-                    for selector in price_selectors:
-                        try:
-                            price_elem = card.find_element(*selector)
-                            price_text = price_elem.text.strip()
-                            if price_text and any(char.isdigit() for char in price_text):
-                                break
-                        except:
-                            continue
+                    price_elem, _ = self._find_first(
+                        'price_list', price_selectors,
+                        root=card,
+                        accept=lambda element: any(char.isdigit() for char in element.text)
+                    )
+                    if price_elem:
+                        price_text = price_elem.text.strip()
                     
                     if price_text:
                         import re
@@ -786,208 +1013,22 @@ class ResultsPage:
             print(f"[ERROR] Fiyat alma hatası: {str(e)}")
             return []
 
-    def extract_all_flight_data(self):
+    def extract_all_flight_data(self, source=None):
         """Tüm uçuş verilerini çıkarır (Case 4 için)
+
+        Kartlar ve alanlar tek bir execute_script çağrısıyla toplanır; script
+        başarısız olursa kart başına find_element ile eski yönteme dönülür.
+        source="api" ise önce arama XHR yanıtı okunur, yakalanamazsa DOM'a dönülür.
+        
+        Args:
+            source: "dom" veya "api" (varsayılan: config network.extraction)
         
         Returns:
             list: Uçuş bilgilerini içeren sözlük listesi
         """
         try:
             print("[INFO] Tüm uçuş verileri çıkarılıyor...")
-            
-            current_url = self.driver.current_url.lower()
-            if "otel" in current_url or "hotel" in current_url:
-                print("[ERROR] YANLIŞ SAYFA: Otel sayfasındayız! Veri çıkarılamaz!")
-                raise Exception("Otel sayfasında - veri çıkarılamaz")
-            
-            flight_item_selectors = [
-                (By.CSS_SELECTOR, "div.flight-item"),
-                (By.CSS_SELECTOR, "div[id^='flight-']"),
-                (By.CSS_SELECTOR, "[class*='flight-item']"),
-                (By.XPATH, "//div[@class='flight-item' or starts-with(@id, 'flight-')]"),
-                (By.CSS_SELECTOR, ".flight-list-body"),
-                (By.CSS_SELECTOR, "[class*='flight-list-body']"),
-            ]
-            
-            flight_cards = []
-            for selector in flight_item_selectors:
-                try:
-                    if selector[1].startswith("div.flight-item") or selector[1].startswith("div[id"):
-                        flight_cards = self.driver.find_elements(*selector)
-                        if flight_cards:
-                            print(f"[OK] {len(flight_cards)} flight-item bulundu (selector: {selector[1]})")
-                            break
-                    else:
-                        container = self.driver.find_element(*selector)
-                        flight_cards = container.find_elements(By.CSS_SELECTOR, "div.flight-item, div[id^='flight-']")
-                        if flight_cards:
-                            print(f"[OK] Container içinde {len(flight_cards)} flight-item bulundu")
-                            break
-                except:
-                    continue
-            
-            if not flight_cards:
-                try:
-                    flight_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='flight-item'], div[id^='flight-']")
-                    if flight_cards:
-                        print(f"[OK] {len(flight_cards)} flight-item bulundu (fallback)")
-                except:
-                    pass
-            
-            if not flight_cards:
-                flight_cards = self.driver.find_elements(*self.flight_cards)
-                print(f"[WARNING] flight-item bulunamadı, summary-airports kullanılıyor: {len(flight_cards)}")
-            
-            flight_data = []
-            
-            print(f"[INFO] {len(flight_cards)} uçuş kartı bulundu, veri çıkarılıyor...")
-            
-            for i, card in enumerate(flight_cards):
-                try:
-                    flight_info = {}
-                    
-                    departure_time = None
-                    dep_selectors = [
-                        (By.CSS_SELECTOR, "[data-testid='departureTime']"),
-                        (By.CSS_SELECTOR, ".flight-departure-time"),
-                        (By.CSS_SELECTOR, "[data-testid*='departureTime']"),
-                        (By.XPATH, ".//div[@data-testid='departureTime']"),
-                        (By.XPATH, ".//div[contains(@class, 'flight-departure-time')]"),
-                    ]
-                    for selector in dep_selectors:
-                        try:
-                            dep_elem = card.find_element(*selector)
-                            departure_time = dep_elem.text.strip()
-                            if departure_time and ':' in departure_time:
-                                break
-                        except:
-                            continue
-                    flight_info['departure_time'] = departure_time or "N/A"
-                    
-                    arrival_time = None
-                    arr_selectors = [
-                        (By.CSS_SELECTOR, "[data-testid='arrivalTime']"),
-                        (By.CSS_SELECTOR, ".flight-arrival-time"),
-                        (By.CSS_SELECTOR, "[data-testid*='arrivalTime']"),
-                        (By.XPATH, ".//div[@data-testid='arrivalTime']"),
-                        (By.XPATH, ".//div[contains(@class, 'arrival-time')]"),
-                    ]
-                    for selector in arr_selectors:
-                        try:
-                            arr_elem = card.find_element(*selector)
-                            arrival_time = arr_elem.text.strip()
-                            if arrival_time and ':' in arrival_time:
-                                break
-                        except:
-                            continue
-                    flight_info['arrival_time'] = arrival_time or "N/A"
-                    
-                    airline_name = None
-                    airline_selectors = [
-                        (By.CSS_SELECTOR, "[data-testid='AJet'], [data-testid='THY'], [data-testid='Pegasus'], [data-testid='AnadoluJet']"),
-                        (By.CSS_SELECTOR, ".summary-marketing-airlines"),
-                        (By.CSS_SELECTOR, "[class*='summary-marketing-airlines']"),
-                        (By.XPATH, ".//div[@data-testid and (contains(@data-testid, 'AJet') or contains(@data-testid, 'THY') or contains(@data-testid, 'Pegasus'))]"),
-                        (By.XPATH, ".//div[contains(@class, 'summary-marketing-airlines')]"),
-                    ]
-                    for selector in airline_selectors:
-                        try:
-                            airline_elem = card.find_element(*selector)
-                            airline_name = airline_elem.text.strip()
-                            if airline_name and airline_name.lower() != "unknown" and len(airline_name) > 0:
-                                break
-                        except:
-                            continue
-                    flight_info['airline'] = airline_name or "Unknown"
-                    
-                    price = None
-                    price_selectors = [
-                        (By.CSS_SELECTOR, "[data-price]"),
-                        (By.CSS_SELECTOR, ".summary-average-price[data-price]"),
-                        (By.CSS_SELECTOR, ".money-int"),
-                        (By.CSS_SELECTOR, "[class*='money-int']"),
-                        (By.CSS_SELECTOR, "[class*='money']"),
-                        (By.XPATH, ".//span[contains(@class, 'money-int')]"),
-                        (By.XPATH, ".//div[contains(@class, 'summary-average-price')]//span[contains(@class, 'money-int')]"),
-                    ]
-                    for selector in price_selectors:
-                        try:
-                            price_elem = card.find_element(*selector)
-                            
-                            data_price = price_elem.get_attribute("data-price")
-                            if data_price:
-                                try:
-                                    price = int(float(data_price))
-                                    break
-                                except:
-                                    pass
-                            
-                            price_text = price_elem.text.strip()
-                            if price_text:
-                                import re
-                                clean_price = price_text.replace('.', '').replace(',', '').strip()
-                                numbers = re.findall(r'\d+', clean_price)
-                                if numbers:
-                                    price = int(numbers[0])
-                                    break
-                        except:
-                            continue
-                    flight_info['price'] = price
-                    
-                    connection = "Direct"
-                    connection_selectors = [
-                        (By.CSS_SELECTOR, "[data-testid='transferStateDirect']"),
-                        (By.CSS_SELECTOR, "[data-testid*='transferState']"),
-                        (By.CSS_SELECTOR, ".summary-transit"),
-                        (By.CSS_SELECTOR, "[class*='summary-transit']"),
-                        (By.XPATH, ".//div[contains(@class, 'summary-transit')]"),
-                        (By.XPATH, ".//div[@data-testid and contains(@data-testid, 'transferState')]"),
-                    ]
-                    for selector in connection_selectors:
-                        try:
-                            conn_elem = card.find_element(*selector)
-                            conn_text = conn_elem.text.strip()
-                            if conn_text:
-                                if 'direkt' in conn_text.lower() or 'direct' in conn_text.lower():
-                                    connection = "Direct"
-                                elif '1' in conn_text or 'aktarma' in conn_text.lower():
-                                    connection = "1 Stop"
-                                else:
-                                    connection = conn_text
-                                break
-                        except:
-                            continue
-                    flight_info['connection'] = connection
-                    
-                    duration = None
-                    duration_selectors = [
-                        (By.CSS_SELECTOR, "[data-testid='departureFlightTime']"),
-                        (By.CSS_SELECTOR, "[data-testid*='FlightTime']"),
-                        (By.CSS_SELECTOR, "[data-testid*='duration']"),
-                        (By.XPATH, ".//span[@data-testid='departureFlightTime']"),
-                        (By.XPATH, ".//span[contains(@data-testid, 'FlightTime')]"),
-                    ]
-                    for selector in duration_selectors:
-                        try:
-                            dur_elem = card.find_element(*selector)
-                            duration = dur_elem.text.strip()
-                            if duration:
-                                break
-                        except:
-                            continue
-                    flight_info['duration'] = duration or "N/A"
-                    flight_info['flight_index'] = i + 1
-                    
-                    if flight_info.get('departure_time') != "N/A" or flight_info.get('airline') != "Unknown":
-                        flight_data.append(flight_info)
-                    
-                    if (i + 1) % 10 == 0:
-                        print(f"[INFO] {i + 1} uçuş verisi çıkarıldı...")
-                        
-                except Exception as e:
-                    print(f"[WARNING] Uçuş {i+1} veri çıkarma hatası: {str(e)}")
-                    continue
-            
+            flight_data = list(self.iter_flight_data(source=source, chunk_size=None))
             print(f"[OK] {len(flight_data)} uçuş verisi başarıyla çıkarıldı")
             return flight_data
             
@@ -996,3 +1037,355 @@ class ResultsPage:
             import traceback
             print(f"[ERROR] Traceback: {traceback.format_exc()}")
             return []
+
+    def iter_flight_data(self, source=None, chunk_size=25):
+        """Uçuş kayıtlarını çıkarıldıkça üretir (generator)
+
+        Kartlar chunk_size'lık gruplar halinde toplu script ile okunur ve her
+        kayıt hemen yield edilir; CSV yazımı ve analiz çıkarmayla eş zamanlı
+        ilerleyebilir. Toplu script başarısız olursa kalan kartlar için kart
+        başına find_element yöntemine dönülür.
+        
+        Args:
+            source: "dom" veya "api" (varsayılan: config network.extraction)
+            chunk_size: Script başına kart sayısı (None: tüm kartlar tek istekte)
+        
+        Yields:
+            dict: departure_time, arrival_time, airline, price, connection,
+                duration, flight_index alanlı uçuş sözlüğü
+        """
+        current_url = self.driver.current_url.lower()
+        if "otel" in current_url or "hotel" in current_url:
+            print("[ERROR] YANLIŞ SAYFA: Otel sayfasındayız! Veri çıkarılamaz!")
+            raise Exception("Otel sayfasında - veri çıkarılamaz")
+        
+        source = source or get_network_log(self.driver).settings.get('extraction', 'dom')
+        if source == "api":
+            flight_data = self.extract_flight_data_from_api()
+            if flight_data:
+                yield from flight_data
+                return
+            print("[WARNING] Arama API yanıtı yakalanamadı, DOM'dan çıkarılıyor...")
+        
+        for chunk, live in self._iter_candidate_chunks(chunk_size):
+            flight_infos = []
+            # Kart bazlı fallback'te eksik selector'lar implicit wait kadar beklemesin
+            with implicit_wait_disabled(self.driver) if live else nullcontext():
+                for i, candidates in chunk:
+                    try:
+                        flight_info = self._build_flight_info(candidates)
+                        flight_info['flight_index'] = i + 1
+                        
+                        if flight_info.get('departure_time') != "N/A" or flight_info.get('airline') != "Unknown":
+                            flight_infos.append(flight_info)
+                            
+                    except Exception as e:
+                        print(f"[WARNING] Uçuş {i+1} veri çıkarma hatası: {str(e)}")
+                        continue
+            yield from flight_infos
+
+    def _iter_candidate_chunks(self, chunk_size):
+        """Kart aday değerlerini gruplar halinde üretir
+
+        Yields:
+            tuple: ([(kart indeksi, aday değerler), ...], live) - live True ise
+                adaylar tembel find_element generator'larıdır (fallback yolu)
+        """
+        start = 0
+        try:
+            while True:
+                card_range = [start, start + chunk_size] if chunk_size else None
+                payload = self.driver.execute_script(
+                    self._BATCH_EXTRACT_SCRIPT, self._flight_card_plan(), self._flight_field_plan(), None, card_range
+                )
+                cards = payload.get('cards') or []
+                total = payload.get('total') or 0
+                if start == 0:
+                    if total:
+                        print(f"[INFO] {total} uçuş kartı bulundu (selector: {payload.get('source')}), veri çıkarılıyor...")
+                    else:
+                        print("[WARNING] Toplu çıkarmada uçuş kartı bulunamadı")
+                if not cards:
+                    return
+                yield [(start + j, candidates) for j, candidates in enumerate(cards)], False
+                start += len(cards)
+                if start >= total:
+                    return
+        except Exception as e:
+            print(f"[WARNING] Toplu veri çıkarma başarısız, kart bazlı yönteme geçiliyor: {str(e)}")
+        
+        with implicit_wait_disabled(self.driver):
+            flight_cards = self._find_flight_cards()
+        print(f"[INFO] {len(flight_cards)} uçuş kartı bulundu, veri çıkarılıyor...")
+        step = chunk_size or max(len(flight_cards), 1)
+        for chunk_start in range(start, len(flight_cards), step):
+            chunk = flight_cards[chunk_start:chunk_start + step]
+            yield [(chunk_start + j, self._collect_card_candidates(card)) for j, card in enumerate(chunk)], True
+
+    @staticmethod
+    def flight_key(flight_info):
+        """Tekrarlanan kartları ayıklamak için uçuş anahtarı"""
+        return (
+            flight_info.get('departure_time'), flight_info.get('arrival_time'), flight_info.get('airline'),
+            flight_info.get('price'), flight_info.get('connection'), flight_info.get('duration'),
+        )
+
+    def harvest_flight_data(self, max_idle_rounds=3, scroll_step=0.9, quiet_ms=300, max_records=None):
+        """Sonuç listesini adım adım kaydırarak yeni çizilen kartları üretir (generator)
+
+        Sanal scroll / lazy rendering kullanan uzun listelerde her adımda sadece
+        içeriği değişen kartlar toplu script ile okunur, uçuş anahtarıyla
+        tekrarlar ayıklanır ve kayıtlar hemen yield edilir. Art arda
+        max_idle_rounds adımda yeni kart gelmezse durur.
+        
+        Args:
+            max_idle_rounds: Yeni kart gelmeyen ardışık adım sayısı sınırı
+            scroll_step: Her adımda görünür yüksekliğin kaydırılan oranı
+            quiet_ms: Kaydırma sonrası DOM'un sakin kalması beklenen süre
+            max_records: Üretilecek maksimum kayıt (opsiyonel)
+        
+        Yields:
+            dict: extract_all_flight_data ile aynı şemada uçuş sözlüğü
+        """
+        seen = set()
+        harvest_token = uuid.uuid4().hex
+        idle_rounds = 0
+        rounds = 0
+        card_selector = f"{self.FLIGHT_ITEM_INNER_SELECTOR}, {self.FLIGHT_CARD_LOCATOR[1]}"
+        
+        while idle_rounds < max_idle_rounds:
+            rounds += 1
+            new_records = 0
+            for candidates in self._collect_cards_batched(harvest_token=harvest_token, quiet=True):
+                flight_info = self._build_flight_info(candidates)
+                if flight_info.get('departure_time') == "N/A" and flight_info.get('airline') == "Unknown":
+                    continue
+                key = self.flight_key(flight_info)
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_records += 1
+                flight_info['flight_index'] = len(seen)
+                yield flight_info
+                if max_records is not None and len(seen) >= max_records:
+                    print(f"[OK] Harvest: {len(seen)} uçuş (limit), {rounds} adım")
+                    return
+            
+            idle_rounds = 0 if new_records else idle_rounds + 1
+            # Listenin sonunda da kaydırılır: lazy load tetiklenirse yeni kartlar gelir
+            self.driver.execute_script(self._SCROLL_RESULTS_SCRIPT, card_selector, scroll_step)
+            settle(self.driver, quiet_ms=quiet_ms, timeout=2)
+        
+        print(f"[OK] Harvest: {len(seen)} uçuş, {rounds} adım")
+
+    def extract_flight_data_offline(self, executor=None):
+        """Tek bir page_source snapshot'ı alıp kartları lxml ile tarayıcı dışında ayrıştırır
+
+        Snapshot alındıktan sonra tarayıcı serbesttir; executor verilirse
+        ayrıştırma worker thread/süreçte yapılır ve Future döner.
+        
+        Args:
+            executor: concurrent.futures executor (opsiyonel)
+        
+        Returns:
+            list: Uçuş sözlükleri (executor verilirse list döndüren Future)
+        """
+        html_text = self.driver.page_source
+        print(f"[INFO] page_source snapshot alındı ({len(html_text) // 1024} KB), offline ayrıştırılıyor...")
+        if executor is not None:
+            return executor.submit(extract_html, html_text)
+        return extract_html(html_text)
+
+    def extract_flight_data_from_api(self):
+        """Uçuş arama XHR yanıtını CDP Network.getResponseBody ile okuyup çevirir
+
+        Sadece çizilmiş kartlar değil, yanıttaki tüm uçuşlar döner. Yanıt yapısı
+        config network.api_mapping ile eşlenir; varsayılan eşleme sadece replay
+        sunucusuna uyar, canlı site için kaydedilmiş gerçek bir yanıttan
+        yazılmalıdır (bkz. utils.flight_api). Eşleme tanımlı değilse, performance
+        log kapalıysa veya yanıt gövdesi artık tutulmuyorsa boş liste döner.
+        
+        Returns:
+            list: extract_all_flight_data ile aynı şemada uçuş sözlükleri
+        """
+        try:
+            network_log = get_network_log(self.driver)
+            mapping = network_log.settings.get('api_mapping')
+            if not mapping or not network_log.search_api_patterns:
+                print("[WARNING] network.api_mapping veya search_api_patterns tanımlı değil, API yanıtı okunamaz")
+                return []
+            flight_data = []
+            seen = set()
+            for payload in capture_search_payloads(network_log):
+                for flight_info in map_api_flights(payload, mapping):
+                    key = (flight_info['departure_time'], flight_info['arrival_time'],
+                           flight_info['airline'], flight_info['price'], flight_info['duration'])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    flight_info['flight_index'] = len(flight_data) + 1
+                    flight_data.append(flight_info)
+            
+            if flight_data:
+                print(f"[OK] {len(flight_data)} uçuş verisi arama API yanıtından çıkarıldı")
+            return flight_data
+        except Exception as e:
+            print(f"[WARNING] API yanıtından veri çıkarma hatası: {str(e)}")
+            return []
+
+    @classmethod
+    def _flight_card_plan(cls):
+        """Kart arama sırasını (by, selector, container içi selector) listesi olarak döndürür"""
+        plan = []
+        for by, value in cls.FLIGHT_ITEM_SELECTORS:
+            if value.startswith("div.flight-item") or value.startswith("div[id"):
+                plan.append([by, value, None])
+            else:
+                plan.append([by, value, cls.FLIGHT_ITEM_INNER_SELECTOR])
+        plan.append([By.CSS_SELECTOR, "div[class*='flight-item'], div[id^='flight-']", None])
+        plan.append([cls.FLIGHT_CARD_LOCATOR[0], cls.FLIGHT_CARD_LOCATOR[1], None])
+        return plan
+
+    @classmethod
+    def _flight_field_plan(cls):
+        """Alan selector'larını {alan: [[by, selector], ...]} biçiminde döndürür"""
+        return {
+            field: [[by, value] for by, value in selectors]
+            for field, selectors in cls.FLIGHT_FIELD_SELECTORS.items()
+        }
+
+    def _collect_cards_batched(self, harvest_token=None, quiet=False):
+        """Tüm kartların aday alan değerlerini tek execute_script ile toplar
+        
+        Args:
+            harvest_token: Verilirse aynı token'lı önceki çağrıdan beri değişmeyen
+                kartlar atlanır (harvest başına yeni token)
+            quiet: True ise kart sayısı yazdırılmaz
+        
+        Returns:
+            list: Kart başına {alan: [(text, data-price) veya None, ...]} sözlükleri
+        """
+        payload = self.driver.execute_script(
+            self._BATCH_EXTRACT_SCRIPT, self._flight_card_plan(), self._flight_field_plan(), harvest_token
+        )
+        
+        cards = payload.get('cards') or []
+        if quiet:
+            return cards
+        if cards:
+            print(f"[OK] {len(cards)} flight-item bulundu (selector: {payload.get('source')}, tek istek)")
+        else:
+            print("[WARNING] Toplu çıkarmada uçuş kartı bulunamadı")
+        return cards
+
+    def _find_flight_cards(self):
+        """Kart elementlerini find_elements ile bulur (toplu çıkarma başarısız olursa)"""
+        for by, value, inner in self._flight_card_plan():
+            try:
+                if inner is None:
+                    flight_cards = self.driver.find_elements(by, value)
+                else:
+                    container = self.driver.find_element(by, value)
+                    flight_cards = container.find_elements(By.CSS_SELECTOR, inner)
+                if flight_cards:
+                    print(f"[OK] {len(flight_cards)} flight-item bulundu (selector: {value})")
+                    return flight_cards
+            except:
+                continue
+        return []
+
+    def _collect_card_candidates(self, card):
+        """Tek bir kartın aday alan değerlerini find_element ile toplar
+        
+        Değerler tembel (generator) üretilir; _build_flight_info kabul edilebilir
+        değeri bulduğunda kalan selector'lar hiç denenmez. Sıra selector
+        önbelleğindeki kazanana göre belirlenir.
+        """
+        def lazy_candidates(field, selectors):
+            for selector in self.selector_cache.order('results', f"card_{field}", selectors):
+                try:
+                    elem = card.find_element(*selector)
+                    candidate = (elem.text, elem.get_attribute("data-price"))
+                except:
+                    candidate = None
+                # Boş / sayısal olmayan metne eşleşen selector kazanan sayılmaz
+                self.selector_cache.record('results', f"card_{field}", selector,
+                                           hit=candidate_accepted(field, candidate))
+                yield candidate
+        
+        return {
+            field: lazy_candidates(field, selectors)
+            for field, selectors in self.FLIGHT_FIELD_SELECTORS.items()
+        }
+
+    @staticmethod
+    def _build_flight_info(candidates):
+        """Aday değerlerden selector fallback sırasına göre uçuş sözlüğü oluşturur
+        
+        Args:
+            candidates: Alan -> selector sırasıyla (text, data-price) veya None listesi
+            
+        Returns:
+            dict: departure_time, arrival_time, airline, price, connection, duration
+        """
+        import re
+        flight_info = {}
+        
+        for field in ('departure_time', 'arrival_time'):
+            value = None
+            for candidate in candidates.get(field) or []:
+                if candidate is None:
+                    continue
+                value = (candidate[0] or "").strip()
+                if candidate_accepted(field, candidate):
+                    break
+            flight_info[field] = value or "N/A"
+        
+        airline_name = None
+        for candidate in candidates.get('airline') or []:
+            if candidate is None:
+                continue
+            airline_name = (candidate[0] or "").strip()
+            if candidate_accepted('airline', candidate):
+                break
+        flight_info['airline'] = airline_name or "Unknown"
+        
+        price = None
+        for candidate in candidates.get('price') or []:
+            if not candidate_accepted('price', candidate):
+                continue
+            price_text, data_price = candidate
+            if data_price:
+                try:
+                    price = int(float(data_price))
+                    break
+                except:
+                    pass
+            numbers = re.findall(r'\d+', (price_text or "").replace('.', '').replace(',', '').strip())
+            if numbers:
+                price = int(numbers[0])
+                break
+        flight_info['price'] = price
+        
+        connection = "Direct"
+        for candidate in candidates.get('connection') or []:
+            if not candidate_accepted('connection', candidate):
+                continue
+            conn_text = candidate[0].strip()
+            if 'direkt' in conn_text.lower() or 'direct' in conn_text.lower():
+                connection = "Direct"
+            elif '1' in conn_text or 'aktarma' in conn_text.lower():
+                connection = "1 Stop"
+            else:
+                connection = conn_text
+            break
+        flight_info['connection'] = connection
+        
+        duration = None
+        for candidate in candidates.get('duration') or []:
+            if candidate_accepted('duration', candidate):
+                duration = candidate[0].strip()
+                break
+        flight_info['duration'] = duration or "N/A"
+        
+        return flight_info
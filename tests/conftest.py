@@ -0,0 +1,38 @@
+"""
+Pytest fixture'ları - testler arasında paylaşılan tarayıcı havuzu
+"""
+import os
+import pytest
+from urllib.parse import urlsplit
+from utils.browser_factory import load_config
+from utils.driver_pool import DriverPool
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Oturum boyunca yaşayan sıcak tarayıcı havuzu"""
+    config = load_config()
+    site = urlsplit(config['site']['url'])
+    pool = DriverPool(size=config['browser'].get('pool_size', 1), origins=[f"{site.scheme}://{site.netloc}"])
+    pool.warm_up(1)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(driver_pool, request):
+    """Test başına havuzdan kiralanan, test sonunda sıfırlanıp iade edilen tarayıcı
+
+    browser.profile_commands açıksa testin WebDriver komut raporu
+    reports/commands/<test>.json dosyasına yazılır.
+    """
+    with driver_pool.leased() as leased_driver:
+        profiler = getattr(leased_driver, 'profiler', None)
+        if profiler is not None:
+            profiler.reset()
+        yield leased_driver
+        if profiler is not None:
+            report_file = profiler.write_json(os.path.join("reports", "commands", f"{request.node.name}.json"))
+            print(f"\n[COMMANDS] {request.node.name} WebDriver komutları:")
+            print(profiler.summary_table())
+            print(f"[COMMANDS] Rapor: {report_file}")
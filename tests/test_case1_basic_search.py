@@ -1,20 +1,17 @@
 import datetime
-import time
-from utils.browser_factory import create_driver, load_config
+from utils.browser_factory import load_config
 from pages.home_page import HomePage
 from pages.results_page import ResultsPage
 
 
-def test_basic_flight_search():
+def test_basic_flight_search(driver):
     """Case 1: Basic Flight Search and Time Filter"""
 
     config = load_config()
-    driver = create_driver()
     home = HomePage(driver)
     results = ResultsPage(driver)
 
     try:
-        url = config['site']['url']
         dep_city = config['defaults']['departure_city']
         dest_city = config['defaults']['destination_city']
         days_ahead = config['dates']['days_ahead_departure']
@@ -31,8 +28,7 @@ def test_basic_flight_search():
         print(f"Gidis: {dep_date}, Donus: {ret_date}")
         print("======================================")
 
-        home.open(url)
-        home.search_round_trip(dep_city, dest_city, dep_date, ret_date)
+        home.search_with_config(config, dep_city, dest_city, dep_date, ret_date)
         results.wait_for_results()
 
         print("[INFO] Gidiş kalkış saati 10:00-18:00 aralığına ayarlanıyor...")
@@ -50,7 +46,3 @@ def test_basic_flight_search():
     except Exception as e:
         print(f"Test sirasinda hata olustu: {str(e)}")
         raise
-
-    finally:
-        time.sleep(1)  
-        driver.quit()
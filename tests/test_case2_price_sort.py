@@ -3,22 +3,19 @@ Test Case 2: Türk Hava Yolları Fiyat Sıralaması
 Belirli bir havayolu için fiyat sıralama fonksiyonunu doğrular
 """
 import datetime
-import time
-from utils.browser_factory import create_driver, load_config
+from utils.browser_factory import load_config
 from pages.home_page import HomePage
 from pages.results_page import ResultsPage
 
 
-def test_turkish_airlines_price_sorting():
+def test_turkish_airlines_price_sorting(driver):
     """Case 2: Türk Hava Yolları Fiyat Sıralaması"""
 
     config = load_config()
-    driver = create_driver()
     home = HomePage(driver)
     results = ResultsPage(driver)
 
     try:
-        url = config['site']['url']
         dep_city = config['defaults']['departure_city']
         dest_city = config['defaults']['destination_city']
         days_ahead = config['dates']['days_ahead_departure']
@@ -35,8 +32,7 @@ def test_turkish_airlines_price_sorting():
         print(f"- Gidiş: {dep_date}, Dönüş: {ret_date}")
         print("======================================")
 
-        home.open(url)
-        home.search_round_trip(dep_city, dest_city, dep_date, ret_date)
+        home.search_with_config(config, dep_city, dest_city, dep_date, ret_date)
         results.wait_for_results()
 
         try:
@@ -57,7 +53,3 @@ def test_turkish_airlines_price_sorting():
     except Exception as e:
         print(f"[ERROR] Test sırasında hata oluştu: {str(e)}")
         raise
-
-    finally:
-        time.sleep(1)
-        driver.quit()
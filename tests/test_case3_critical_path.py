@@ -23,18 +23,19 @@ CRITICAL USER PATH DOCUMENTATION:
 """
 import datetime
 import time
-from utils.browser_factory import create_driver, load_config
+from utils.browser_factory import load_config
 from pages.home_page import HomePage
 from pages.results_page import ResultsPage
+from utils.tracing import Tracer
 
 
-def test_critical_user_path():
+def test_critical_user_path(driver):
     """Case 3: Critical Path Testing - Complete User Journey"""
 
     config = load_config()
-    driver = create_driver()
     home = HomePage(driver)
     results = ResultsPage(driver)
+    tracer = Tracer("case3_critical_path").start(driver)
 
     try:
         url = config['site']['url']
@@ -150,7 +151,9 @@ def test_critical_user_path():
         except:
             pass
         raise
-
     finally:
-        print("\n[INFO] Browser kapatılıyor...")
-        driver.quit()
+        tracer.stop()
+        trace_file = tracer.write_json(f"reports/trace_case3_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        print("\n[TRACE] Adım süreleri:")
+        print(tracer.summary_table())
+        print(f"[TRACE] JSON trace: {trace_file}")
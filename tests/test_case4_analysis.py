@@ -6,14 +6,15 @@ import datetime
 import time
 import csv
 import os
-from utils.browser_factory import create_driver, load_config
+from utils.browser_factory import load_config
 from pages.home_page import HomePage
 from pages.results_page import ResultsPage
 from utils.csv_helper import CSVHelper
-from utils.data_analysis import DataAnalyzer
+from utils.data_analysis import DataAnalyzer, RunningFlightStats
+from utils.observation_store import ObservationStore
 
 
-def test_flight_data_analysis():
+def test_flight_data_analysis(driver):
     """
     Case 4: Analysis and Categorization - Data Extraction & Analysis
     
@@ -55,7 +56,6 @@ def test_flight_data_analysis():
     """
 
     config = load_config()
-    driver = create_driver()
     home = HomePage(driver)
     results = ResultsPage(driver)
 
@@ -105,10 +105,17 @@ def test_flight_data_analysis():
         
         print(f"[INFO] {flight_count} uçuş bulundu")
 
-        print("\n[STEP 3] Tüm sonuçlardan uçuş verilerini çıkar")
+        print("\n[STEP 3] Tüm sonuçlardan uçuş verilerini çıkar (CSV'ye akış halinde kaydederek)")
         print("[INFO] Çıkarılan veriler: kalkış/varış saatleri, havayolu, fiyat, bağlantı, süre")
+        csv_filename = f"flight_data_{dep_city.replace(' ', '_')}_{dest_city.replace(' ', '_')}_{today.strftime('%Y%m%d')}.csv"
+        csv_path = os.path.join("reports", csv_filename)
+        os.makedirs("reports", exist_ok=True)
         
-        flight_data = results.extract_all_flight_data()
+        # Kayıtlar çıkarıldıkça CSV'ye yazılır ve running istatistiklere eklenir
+        running_stats = RunningFlightStats()
+        flight_data = list(CSVHelper.stream_flight_data(
+            running_stats.observe(results.iter_flight_data()), csv_path
+        ))
         
         if not flight_data or len(flight_data) == 0:
             print("[ERROR] Uçuş verisi çıkarılamadı!")
@@ -128,14 +135,18 @@ def test_flight_data_analysis():
             print(f"   • Connection: {sample.get('connection', 'N/A')}")
             print(f"   • Duration: {sample.get('duration', 'N/A')}")
 
-        print("\n[STEP 4] Çıkarılan verileri CSV dosyasına kaydet")
-        csv_filename = f"flight_data_{dep_city.replace(' ', '_')}_{dest_city.replace(' ', '_')}_{today.strftime('%Y%m%d')}.csv"
-        csv_path = os.path.join("reports", csv_filename)
-        os.makedirs("reports", exist_ok=True)
-        
-        CSVHelper.save_flight_data(flight_data, csv_path)
+        print("\n[STEP 4] Çıkarılan verilerin CSV dosyasına kaydını doğrula")
         print(f"[OK] {len(flight_data)} uçuş verisi CSV'ye kaydedildi: {csv_path}")
+        summary = running_stats.summary()
+        if summary['count']:
+            print(f"[INFO] Akış istatistikleri: {summary['count']} fiyat, "
+                  f"min {summary['min']:.0f}TL, max {summary['max']:.0f}TL, ort {summary['avg']:.0f}TL")
         print(f"[INFO] CSV dosyası içeriği: departure_time, arrival_time, airline, price, connection, duration")
+        if config.get('observation_store', {}).get('enabled', False):
+            with ObservationStore.from_config(config) as store:
+                stored = store.add_observations(flight_data, route=f"{dep_city}-{dest_city}",
+                                                travel_date=dep_date, return_date=ret_date)
+                print(f"[OK] {stored} gözlem SQLite deposuna eklendi: {store.path}")
 
         print("\n[STEP 5] CSV dosyasını oku ve veriyi analiz et")
         print("[INFO] Analiz için CSV dosyası okunuyor...")
@@ -166,12 +177,17 @@ def test_flight_data_analysis():
                     print(f"     - Maksimum Fiyat: {stats['max']:.0f}TL")
                     print(f"     - Ortalama Fiyat: {stats['avg']:.0f}TL")
                     print(f"     - Uçuş Sayısı: {stats['count']}")
+                    print(f"     - Medyan: {stats['median']:.0f}TL (P10-P90: {stats['p10']:.0f}-{stats['p90']:.0f}TL, "
+                          f"Std: {stats['std']:.0f}TL)")
+                    if stats['direct_share'] is not None:
+                        print(f"     - Direkt Uçuş Oranı: %{stats['direct_share'] * 100:.0f}")
         else:
             print("[WARNING] Havayolu istatistikleri hesaplanamadı")
 
         print("\n[STEP 7] En uygun maliyetli uçuşları belirle (Algoritma)")
         print("[INFO] Algoritma: En düşük %30 fiyat aralığındaki uçuşları buluyor...")
-        cost_effective_flights = analyzer.find_cost_effective_flights()
+        print(f"[INFO] Akış sketch'inden %30 fiyat eşiği: {running_stats.price_quantile(0.30) or 0:.0f}TL")
+        cost_effective_flights = analyzer.find_cost_effective_flights(sketch=running_stats.sketch)
         print(f"[OK] Algoritma {len(cost_effective_flights)} en uygun maliyetli uçuş belirledi")
         
         if cost_effective_flights:
@@ -197,7 +213,9 @@ def test_flight_data_analysis():
         
         print("[INFO] Farklı saat dilimlerinde fiyat dağılımı ısı haritası oluşturuluyor...")
         heatmap_file = f"reports/time_price_heatmap_{route_suffix}_{timestamp}.png"
-        analyzer.create_time_price_heatmap(heatmap_file)
+        analyzer.create_time_price_heatmap(
+            heatmap_file, bin_minutes=config.get('analysis', {}).get('heatmap_bin_minutes', 60)
+        )
         print(f"[OK] Isı haritası kaydedildi: {heatmap_file}")
         
         print("[INFO] Fiyat dağılım grafiği oluşturuluyor...")
@@ -240,7 +258,3 @@ def test_flight_data_analysis():
         except:
             pass
         raise
-
-    finally:
-        print("\n[INFO] Browser kapatılıyor...")
-        driver.quit()
\ No newline at end of file
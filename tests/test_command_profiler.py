@@ -0,0 +1,60 @@
+"""
+WebDriver komut profiler'ı birim testleri (tarayıcı gerektirmez, sahte driver kullanır)
+"""
+import json
+from utils.command_profiler import CommandProfiler, ProfiledDriver, add_command_listener
+
+
+class FakeDriver:
+    title = "Enuygun"
+
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+
+    def find_element(self, by, value):
+        return self.execute('findElement', {'using': by, 'value': value})
+
+
+def load_results(driver):
+    driver.find_element('css selector', '.flight-item')
+    driver.execute('executeScript')
+    driver.execute('executeScript')
+
+
+def test_profiled_driver_counts_by_command_and_call_site(tmp_path):
+    driver = ProfiledDriver(FakeDriver())
+    assert driver.title == "Enuygun"
+
+    load_results(driver)
+
+    report = driver.profiler.report()
+    assert report['total_commands'] == 3
+    assert report['commands']['executeScript']['count'] == 2
+    assert sum(report['commands']['findElement']['histogram'].values()) == 1
+    script_sites = [site for site, counts in report['call_sites'].items() if 'executeScript' in counts]
+    assert script_sites and all('load_results' in site for site in script_sites)
+    assert sum(sum(counts.values()) for counts in report['call_sites'].values()) == 3
+
+    path = driver.profiler.write_json(str(tmp_path / "commands.json"))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['total_commands'] == 3
+    assert 'executeScript' in driver.profiler.summary_table()
+
+    driver.profiler.reset()
+    assert driver.profiler.report()['total_commands'] == 0
+
+
+def test_hook_is_shared_between_listeners():
+    driver = FakeDriver()
+    seen = []
+    profiler = CommandProfiler(track_call_sites=False).attach(driver)
+    add_command_listener(driver, lambda command, elapsed: seen.append(command))
+    original_hook = driver.execute
+    ProfiledDriver(driver, profiler)
+
+    driver.execute('getTitle')
+
+    assert driver.execute is original_hook
+    assert seen == ['getTitle']
+    assert profiler.report()['total_commands'] == 1
+    assert profiler.report()['call_sites'] == {}
@@ -0,0 +1,68 @@
+"""
+Tamponlu CSV yazıcı birim testleri (tarayıcı gerektirmez)
+"""
+import csv
+import threading
+import time
+import pytest
+from utils.csv_helper import BufferedCSVWriter, CSVHelper
+
+FIELDS = ['route', 'flight_index', 'airline', 'price']
+
+
+def _read(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_concurrent_producers_write_complete_rows(tmp_path):
+    path = str(tmp_path / "sweep.csv")
+    producers, per_producer = 8, 250
+
+    def produce(worker):
+        for i in range(per_producer):
+            writer.write({'route': f"r{worker}", 'flight_index': i, 'airline': "Pegasus", 'price': i * 10,
+                          'extra': "ignored"})
+
+    with BufferedCSVWriter(path, FIELDS, buffer_rows=64, flush_interval=None, append=False) as writer:
+        threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    rows = _read(path)
+    assert len(rows) == producers * per_producer == writer.rows_written
+    assert set(rows[0]) == set(FIELDS)
+    for worker in range(producers):
+        indexes = [int(row['flight_index']) for row in rows if row['route'] == f"r{worker}"]
+        assert indexes == list(range(per_producer))
+
+
+def test_buffering_interval_flush_and_schema_check(tmp_path):
+    path = str(tmp_path / "out.csv")
+    writer = BufferedCSVWriter(path, FIELDS, buffer_rows=100, flush_interval=0.05, fsync="flush")
+    row = {'route': "a-b", 'flight_index': 1, 'airline': "AJet"}
+    writer.write(row)
+    row['airline'] = "changed"
+    assert _read(path) == []
+
+    deadline = time.time() + 2
+    while not _read(path) and time.time() < deadline:
+        time.sleep(0.02)
+    assert _read(path) == [{'route': "a-b", 'flight_index': "1", 'airline': "AJet", 'price': ""}]
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(row)
+
+    with BufferedCSVWriter(path, FIELDS, flush_interval=None) as appender:
+        appender.write_rows([{'route': "c-d", 'flight_index': 2}])
+    assert [r['route'] for r in _read(path)] == ["a-b", "c-d"]
+
+    with pytest.raises(ValueError):
+        BufferedCSVWriter(path, ['route', 'price'])
+    with pytest.raises(ValueError):
+        BufferedCSVWriter(str(tmp_path / "x.csv"), FIELDS, fsync="always")
+    with pytest.raises(ValueError):
+        with CSVHelper(str(tmp_path)).open_writer("strict", FIELDS, extrasaction='raise', flush_interval=None) as strict:
+            strict.write({'route': "a-b", 'unknown': 1})
@@ -0,0 +1,164 @@
+"""
+DataAnalyzer birim testleri (tarayıcı gerektirmez)
+"""
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+import numpy as np
+from utils.data_analysis import DataAnalyzer
+
+FLIGHTS = [
+    {'airline': "Pegasus", 'price': 1000, 'connection': "Direct", 'departure_time': "06:10"},
+    {'airline': "THY", 'price': "3000", 'connection': "1 Stop", 'departure_time': "09:00"},
+    {'airline': "Pegasus", 'price': 2000, 'connection': "1 Stop", 'departure_time': "12:30"},
+    {'airline': "Pegasus", 'price': 3000, 'connection': "Direct", 'departure_time': "18:45"},
+    {'airline': "Pegasus", 'price': None, 'connection': "Direct", 'departure_time': "20:00"},
+    {'airline': "Unknown", 'price': 500, 'connection': "Direct", 'departure_time': "N/A"},
+]
+
+
+def test_airline_stats_single_pass():
+    stats = DataAnalyzer(FLIGHTS).calculate_airline_price_stats()
+
+    assert list(stats) == ["Pegasus", "THY"]
+    pegasus = stats["Pegasus"]
+    assert (pegasus['min'], pegasus['max'], pegasus['avg'], pegasus['count']) == (1000.0, 3000.0, 2000.0, 3)
+    assert pegasus['median'] == 2000.0
+    assert pegasus['p10'] == pytest.approx(1200.0)
+    assert pegasus['p90'] == pytest.approx(2800.0)
+    assert pegasus['std'] == pytest.approx(1000.0)
+    assert pegasus['direct_share'] == pytest.approx(2 / 3)
+    assert stats["THY"]['std'] == 0.0
+    assert stats["THY"]['direct_share'] == 0.0
+
+
+def test_airline_stats_without_connection_or_prices():
+    no_connection = [{k: v for k, v in flight.items() if k != 'connection'} for flight in FLIGHTS]
+    assert DataAnalyzer(no_connection).calculate_airline_price_stats()["THY"]['direct_share'] is None
+    assert DataAnalyzer([{'airline': "THY", 'price': "N/A"}]).calculate_airline_price_stats() == {}
+    assert DataAnalyzer([]).calculate_airline_price_stats() == {}
+
+
+def test_clock_parsing_is_vectorized_and_lenient():
+    from utils.data_analysis import parse_clock_minutes
+
+    minutes = parse_clock_minutes(["06:10", " 9:05", "23:59", "24:00", "N/A", None, "10:"])
+    assert minutes.tolist()[:3] == [370.0, 545.0, 1439.0]
+    assert minutes.isna().tolist()[3:6] == [True, True, True]
+    assert minutes.iloc[6] == 600.0
+
+
+def test_hourly_matrix_bins_without_mutating_frame():
+    analyzer = DataAnalyzer(FLIGHTS)
+    columns = list(analyzer.df.columns)
+
+    matrix, labels = analyzer.hourly_price_matrix(bin_minutes=60)
+    assert matrix.shape == (4, 6)
+    assert labels[:2] == ["+0:00", "+1:00"]
+    assert matrix[1, 0] == 1000.0
+    assert matrix[1, 3] == 3000.0
+    assert matrix[3, 0] == 3000.0
+    assert int((~np.isnan(matrix)).sum()) == 4
+
+    half_hour, labels = analyzer.hourly_price_matrix(bin_minutes=30)
+    assert half_hour.shape == (4, 12)
+    assert labels[1] == "+0:30"
+    assert half_hour[2, 1] == 2000.0
+    assert list(analyzer.df.columns) == columns
+
+    assert analyzer.hourly_price_matrix(bin_minutes=45)[0].shape == (4, 8)
+    for invalid in (50, 7, 0):
+        with pytest.raises(ValueError):
+            analyzer.hourly_price_matrix(bin_minutes=invalid)
+
+
+def test_schema_is_typed_once_and_records_stay_display_compatible():
+    raw = [
+        {'departure_time': "06:10", 'arrival_time': "07:25", 'airline': "Pegasus", 'price': "1499",
+         'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 1, 'route': "ist-esb"},
+        {'departure_time': "N/A", 'arrival_time': "N/A", 'airline': "AJet", 'price': None,
+         'connection': "1 Stop", 'duration': "N/A", 'flight_index': 2, 'route': "ist-esb"},
+    ]
+    analyzer = DataAnalyzer(raw)
+    df = analyzer.df
+
+    assert list(df.columns) == ['departure_minutes', 'arrival_minutes', 'airline', 'price',
+                                'connection', 'duration_minutes', 'flight_index', 'route']
+    assert str(df['price'].dtype) == "Int32"
+    assert str(df['departure_minutes'].dtype) == "Int16"
+    assert str(df['duration_minutes'].dtype) == "Int16"
+    assert str(df['airline'].dtype) == "category"
+    assert df['departure_minutes'].tolist()[0] == 370
+    assert df['duration_minutes'].tolist()[0] == 75
+
+    from utils.data_analysis import flight_records
+    assert flight_records(df) == [
+        dict(raw[0], price=1499),
+        dict(raw[1]),
+    ]
+
+
+def test_duration_parsing_variants():
+    from utils.data_analysis import parse_duration_minutes
+
+    minutes = parse_duration_minutes(["1s 15dk", "2s", "45dk", "3sa 5dk", "N/A", None])
+    assert minutes.tolist()[:4] == [75.0, 120.0, 45.0, 185.0]
+    assert minutes.isna().tolist()[4:] == [True, True]
+
+
+def test_chunked_csv_aggregates_match_in_memory(tmp_path):
+    import csv
+    from utils.data_analysis import FlightAggregates
+    from utils.csv_helper import CSVHelper
+
+    flights = FLIGHTS + [
+        {'airline': "THY", 'price': 4200, 'connection': "Direct", 'departure_time': "06:40"},
+        {'airline': "Pegasus", 'price': 1800, 'connection': "1 Stop", 'departure_time': "23:05"},
+    ]
+    path = tmp_path / "history.csv"
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(flights[0]))
+        writer.writeheader()
+        writer.writerows(flights)
+
+    in_memory = DataAnalyzer(flights)
+    chunked = DataAnalyzer.from_csv_chunks(str(path), chunksize=2)
+    assert chunked.df.empty and chunked.aggregates.rows == len(flights)
+
+    expected = in_memory.calculate_airline_price_stats()
+    actual = chunked.calculate_airline_price_stats()
+    assert list(actual) == list(expected)
+    for airline, stats in expected.items():
+        assert actual[airline] == pytest.approx(stats)
+
+    for bin_minutes in (30, 60, 120):
+        assert np.allclose(chunked.hourly_price_matrix(bin_minutes)[0], in_memory.hourly_price_matrix(bin_minutes)[0],
+                           equal_nan=True)
+    assert chunked.find_cost_effective_flights() == in_memory.find_cost_effective_flights()
+
+    parts = [FlightAggregates().update(chunk) for chunk in CSVHelper.iter_typed_chunks(str(path), chunksize=3)]
+    assert len(parts) == 3
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    merged_stats = merged.airline_price_stats()
+    assert list(merged_stats) == list(actual)
+    for airline, stats in actual.items():
+        assert merged_stats[airline] == pytest.approx(stats)
+    assert merged.price_quantile(0.3) == pytest.approx(in_memory.df['price'].astype('float64').quantile(0.3))
+
+
+def test_cost_effective_threshold_from_streaming_sketch():
+    from utils.data_analysis import RunningFlightStats
+
+    running = RunningFlightStats()
+    list(running.observe(iter(FLIGHTS)))
+    analyzer = DataAnalyzer(FLIGHTS)
+
+    assert running.price_quantile(0.30) == pytest.approx(analyzer.df['price'].astype('float64').quantile(0.30))
+    assert analyzer.find_cost_effective_flights(sketch=running.sketch) == analyzer.find_cost_effective_flights()
+
+    cross_route = RunningFlightStats()
+    list(cross_route.observe([{'airline': "X", 'price': price} for price in (100, 200, 300, 400)]))
+    assert analyzer.find_cost_effective_flights(sketch=cross_route.sketch) == []
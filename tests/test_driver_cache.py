@@ -0,0 +1,113 @@
+"""
+Driver binary önbelleği birim testleri (tarayıcı gerektirmez)
+"""
+import os
+import pytest
+from utils import driver_cache
+from utils.driver_cache import DriverCache, resolve_driver_path
+
+
+@pytest.fixture
+def fake_driver(tmp_path):
+    path = tmp_path / "chromedriver"
+    path.write_bytes(b"fake-driver-binary")
+    return path
+
+
+def test_cache_roundtrip_and_checksum(tmp_path, fake_driver):
+    cache = DriverCache(tmp_path / "cache")
+    cache.put('chrome', '126.0.1', str(fake_driver))
+
+    assert cache.get('chrome', '126.0.1') == str(fake_driver.absolute())
+    assert cache.get('chrome', '127.0.0') is None
+
+    os.utime(fake_driver, ns=(0, 0))
+    assert cache.get('chrome', '126.0.1') is not None
+
+    fake_driver.write_bytes(b"tampered-binary!!")
+    assert cache.get('chrome', '126.0.1') is None
+
+
+def test_resolve_skips_network_when_cached(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setattr(driver_cache, 'detect_browser_version', lambda *args: '126.0.1')
+    DriverCache(tmp_path / "cache").put('chrome', '126.0.1', str(fake_driver))
+
+    def fail_install(browser_name):
+        raise AssertionError("cache hit durumunda ağa çıkılmamalı")
+
+    monkeypatch.setattr(driver_cache, '_install_driver', fail_install)
+    config = {'path': str(tmp_path / "cache")}
+    assert resolve_driver_path('chrome', config) == str(fake_driver.absolute())
+
+
+def test_offline_mode_uses_latest_entry(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setattr(driver_cache, 'detect_browser_version', lambda *args: '127.0.0')
+    monkeypatch.setattr(driver_cache, '_install_driver', lambda name: pytest.fail("offline"))
+    DriverCache(tmp_path / "cache").put('chrome', '126.0.1', str(fake_driver))
+
+    config = {'path': str(tmp_path / "cache"), 'offline': True}
+    assert resolve_driver_path('chrome', config) == str(fake_driver.absolute())
+
+    monkeypatch.setattr(driver_cache.shutil, 'which', lambda name: None)
+    with pytest.raises(RuntimeError):
+        resolve_driver_path('chrome', {'path': str(tmp_path / "empty"), 'offline': True})
+
+
+def test_unknown_version_never_reads_or_writes_cache(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setattr(driver_cache, 'detect_browser_version', lambda *args: None)
+    installs = []
+    monkeypatch.setattr(driver_cache, '_install_driver', lambda name: installs.append(name) or str(fake_driver))
+    cache = DriverCache(tmp_path / "cache")
+    cache._save({'chrome:unknown': {'path': str(fake_driver)}})
+
+    config = {'path': str(tmp_path / "cache")}
+    assert resolve_driver_path('chrome', config) == str(fake_driver)
+    assert resolve_driver_path('chrome', config) == str(fake_driver)
+    assert installs == ['chrome', 'chrome']
+    assert list(cache._load()) == ['chrome:unknown']
+
+
+def test_refresh_drops_stale_entry(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setattr(driver_cache, 'detect_browser_version', lambda *args: '126.0.1')
+    stale = tmp_path / "stale-chromedriver"
+    stale.write_bytes(b"old-driver")
+    cache = DriverCache(tmp_path / "cache")
+    cache.put('chrome', '126.0.1', str(stale))
+    monkeypatch.setattr(driver_cache, '_install_driver', lambda name: str(fake_driver))
+
+    config = {'path': str(tmp_path / "cache")}
+    assert resolve_driver_path('chrome', config) == str(stale.absolute())
+    assert resolve_driver_path('chrome', config, refresh=True) == str(fake_driver)
+    assert cache.get('chrome', '126.0.1') == str(fake_driver.absolute())
+
+
+def test_version_from_registry_and_plist(tmp_path, monkeypatch):
+    import plistlib
+    import sys
+    import types
+
+    class FakeKey:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def open_key(hive, path):
+        if hive != 'HKLM' or 'Wow6432Node' in path:
+            raise OSError("yok")
+        return FakeKey()
+
+    fake_winreg = types.SimpleNamespace(HKEY_CURRENT_USER='HKCU', HKEY_LOCAL_MACHINE='HKLM', OpenKey=open_key,
+                                        QueryValueEx=lambda key, name: ("127.0.6533.72", 1))
+    monkeypatch.setitem(sys.modules, 'winreg', fake_winreg)
+    monkeypatch.setattr(driver_cache.subprocess, 'run', lambda *args, **kwargs: pytest.fail("binary çalıştırılmamalı"))
+    monkeypatch.setattr(driver_cache.sys, 'platform', 'win32')
+    assert driver_cache.detect_browser_version('chrome') == "127.0.6533.72"
+
+    app = tmp_path / "Google Chrome.app" / "Contents"
+    (app / "MacOS").mkdir(parents=True)
+    with open(app / "Info.plist", 'wb') as f:
+        plistlib.dump({'CFBundleShortVersionString': "128.0.6613.84"}, f)
+    monkeypatch.setattr(driver_cache.sys, 'platform', 'darwin')
+    assert driver_cache.detect_browser_version('chrome', str(app / "MacOS" / "Google Chrome")) == "128.0.6613.84"
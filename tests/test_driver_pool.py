@@ -0,0 +1,126 @@
+"""
+DriverPool birim testleri (sahte driver ile, tarayıcı gerektirmez)
+"""
+import pytest
+from utils.driver_pool import DriverPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.handles) + len(self.driver.closed)}"
+        self.driver.handles.append(handle)
+        self.driver.origins[handle] = "null"
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    def __init__(self, fail_reset=False):
+        self.fail_reset = fail_reset
+        self.handles = ["tab-0", "tab-1"]
+        self.origins = {"tab-0": "https://www.enuygun.com", "tab-1": "https://pay.enuygun.com"}
+        self.closed = []
+        self.current_window_handle = "tab-0"
+        self.switch_to = FakeSwitchTo(self)
+        self.cdp = []
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        if self.fail_reset:
+            raise RuntimeError("tarayıcı yanıt vermiyor")
+        return list(self.handles)
+
+    def execute_script(self, script):
+        return self.origins[self.current_window_handle]
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+        self.closed.append(self.current_window_handle)
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_lease_reuses_released_driver_up_to_size():
+    created = []
+    pool = DriverPool(size=2, factory=lambda: created.append(FakeDriver()) or created[-1])
+
+    first = pool.lease()
+    second = pool.lease()
+    assert len(created) == 2
+    with pytest.raises(TimeoutError):
+        pool.lease(timeout=0.01)
+
+    pool.release(first)
+    assert pool.lease() is first
+    assert len(created) == 2
+    pool.release(second)
+
+
+def test_reset_clears_every_origin_but_keeps_http_cache():
+    driver = FakeDriver()
+    pool = DriverPool(size=1, factory=lambda: driver, origins=["http://127.0.0.1:8765"])
+    with pool.leased() as leased:
+        assert leased is driver
+
+    commands = [command for command, _ in driver.cdp]
+    assert 'Network.clearBrowserCache' not in commands
+    assert 'Network.clearBrowserCookies' in commands
+    cleared = {params['origin'] for command, params in driver.cdp if command == 'Storage.clearDataForOrigin'}
+    assert cleared == {"https://www.enuygun.com", "https://pay.enuygun.com", "http://127.0.0.1:8765"}
+    # Eski sekmeler (sessionStorage dahil) kapatılır, tek boş sekme kalır
+    assert driver.closed == ["tab-0", "tab-1"]
+    assert driver.window_handles == [driver.current_window_handle]
+    assert driver.url == "about:blank"
+
+
+def test_reset_clears_attached_network_log():
+    from utils.network_log import attach_network_log
+
+    driver = FakeDriver()
+    network_log = attach_network_log(driver)
+    network_log.requests['1'] = {'url': 'http://x/app.js', 'state': 'finished'}
+    assert DriverPool.reset(driver)
+    assert network_log.requests == {}
+
+
+def test_failed_reset_replaces_driver():
+    created = []
+    pool = DriverPool(size=1, factory=lambda: created.append(FakeDriver()) or created[-1])
+
+    broken = pool.lease()
+    broken.fail_reset = True
+    pool.release(broken)
+    assert broken.quit_called
+
+    replacement = pool.lease()
+    assert replacement is not broken
+    assert len(created) == 2
+    pool.release(replacement)
+
+
+def test_close_quits_all_and_rejects_new_leases():
+    created = []
+    pool = DriverPool(size=2, factory=lambda: created.append(FakeDriver()) or created[-1])
+    pool.warm_up()
+    leased = pool.lease()
+
+    pool.close()
+    assert all(driver.quit_called for driver in created)
+    with pytest.raises(RuntimeError):
+        pool.lease()
+
+    pool.release(leased)
+    assert leased.quit_called
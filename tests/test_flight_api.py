@@ -0,0 +1,89 @@
+"""
+Arama API yanıtı eşleme birim testleri (tarayıcı gerektirmez)
+"""
+import base64
+import json
+import pytest
+from utils.flight_api import REPLAY_API_MAPPING, capture_search_payloads, map_api_flights
+from utils.network_log import NetworkLog
+from utils.replay_server import generate_flights
+
+
+def _entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def test_replay_payload_maps_to_flight_schema():
+    flights = generate_flights("ist-esb", "01.06.2030", count=5)
+    payload = {"status": "ok", "data": {"route": "ist-esb", "flights": flights}}
+
+    records = map_api_flights(payload, REPLAY_API_MAPPING)
+
+    assert len(records) == 5
+    first = records[0]
+    assert set(first) == {'departure_time', 'arrival_time', 'airline', 'price', 'connection', 'duration', 'flight_index'}
+    assert first['departure_time'] == flights[0]['departure']['time']
+    assert first['airline'] == flights[0]['airline']['name']
+    assert first['price'] == flights[0]['price']['amount']
+    assert first['connection'] == ("Direct" if flights[0]['stops'] == 0 else "1 Stop")
+    minutes = flights[0]['duration_minutes']
+    assert first['duration'] == f"{minutes // 60}s {minutes % 60}dk"
+    assert [record['flight_index'] for record in records] == [1, 2, 3, 4, 5]
+
+
+def test_custom_mapping_and_missing_fields():
+    payload = {"result": [{"dep": "10:05", "carrier": {"title": "Pegasus"}, "fare": "1234.90"}]}
+    records = map_api_flights(payload, {
+        'flights_path': 'result', 'departure_time': 'dep', 'airline': 'carrier.title', 'price': 'fare',
+    })
+    assert records == [{
+        'departure_time': "10:05", 'arrival_time': "N/A", 'airline': "Pegasus", 'price': 1234,
+        'connection': "Direct", 'duration': "N/A", 'flight_index': 1,
+    }]
+    assert map_api_flights({"data": {"flights": None}}, REPLAY_API_MAPPING) == []
+
+
+def test_mapping_is_required():
+    payload = {"data": {"flights": []}}
+    with pytest.raises(ValueError):
+        map_api_flights(payload, None)
+    with pytest.raises(ValueError):
+        map_api_flights(payload, {'price': 'price.amount'})
+
+
+class FakeCdpDriver:
+    def __init__(self, entries, bodies):
+        self.entries = entries
+        self.bodies = bodies
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == 'Network.getResponseBody'
+        if params['requestId'] not in self.bodies:
+            raise Exception("No resource with given identifier found")
+        return self.bodies[params['requestId']]
+
+
+def test_capture_reads_latest_search_responses_after_wait_consumed_them():
+    body = json.dumps({"data": {"flights": []}})
+    driver = FakeCdpDriver(
+        [
+            _entry('Network.requestWillBeSent', requestId='7', request={'url': 'http://x/api/flights/search?route=a-b'}),
+            _entry('Network.loadingFinished', requestId='7'),
+            _entry('Network.requestWillBeSent', requestId='8', request={'url': 'http://x/api/flights/search?route=a-b'}),
+            _entry('Network.loadingFinished', requestId='8'),
+        ],
+        {'7': {'body': body, 'base64Encoded': False},
+         '8': {'body': base64.b64encode(body.encode()).decode(), 'base64Encoded': True}},
+    )
+    network_log = NetworkLog(driver, {'search_api_patterns': ['/api/flights/search']})
+    network_log.poll()
+    network_log.consume_search_requests()
+
+    assert capture_search_payloads(network_log) == [{"data": {"flights": []}}] * 2
+
+    del driver.bodies['8']
+    assert len(capture_search_payloads(network_log)) == 1
@@ -0,0 +1,49 @@
+"""
+Deep-link arama URL'i birim testleri (tarayıcı gerektirmez)
+"""
+import pytest
+
+pytest.importorskip("selenium")
+
+from pages.home_page import HomePage
+
+TEMPLATE = ("{base}/ucak-bileti/arama/{origin_slug}-{destination_slug}-{origin_code}-{destination_code}/"
+            "?gidis={departure_date}&donus={return_date}&yetiskin=1&sinif=ekonomi&save=1")
+
+
+def test_slugify_handles_turkish_characters():
+    assert HomePage._slugify("İstanbul") == "istanbul"
+    assert HomePage._slugify("İzmir") == "izmir"
+    assert HomePage._slugify("Lefkoşa") == "lefkosa"
+    assert HomePage._slugify("  Şanlıurfa (GAP) ") == "sanliurfa-gap"
+    assert HomePage._slugify("Çanakkale Ğ Ü Ö") == "canakkale-g-u-o"
+
+
+def test_build_search_url_keeps_date_format_and_lowercases_codes():
+    home = HomePage(None)
+    url = home.build_search_url("https://www.enuygun.com/", TEMPLATE, "IST", "ECN",
+                                "01.06.2030", "04.06.2030", "İstanbul", "Lefkoşa")
+    assert url == ("https://www.enuygun.com/ucak-bileti/arama/istanbul-lefkosa-ist-ecn/"
+                   "?gidis=01.06.2030&donus=04.06.2030&yetiskin=1&sinif=ekonomi&save=1")
+
+    # Şehir adı yoksa slug IATA kodundan üretilir
+    assert "/arama/esb-adb-esb-adb/" in home.build_search_url("http://127.0.0.1:8765", TEMPLATE, "ESB", "ADB",
+                                                              "01.06.2030", "04.06.2030")
+
+
+def test_search_with_config_uses_per_city_codes():
+    config = {
+        'site': {'url': "https://www.enuygun.com"},
+        'search': {'mode': "deep_link", 'url_template': TEMPLATE},
+        'defaults': {'departure_city': "İstanbul", 'destination_city': "Ankara",
+                     'airport_codes': {'departure': "IST", 'destination': "ESB"}},
+        'test_data': {'airport_codes': {"İzmir": "ADB", "Ankara": "ESB"}},
+    }
+    home = HomePage(None)
+    opened = []
+    home.search_round_trip_deep_link = lambda url: opened.append(url) or True
+
+    home.search_with_config(config, "Ankara", "İzmir", "01.06.2030", "04.06.2030")
+    home.search_with_config(config, "İstanbul", "Ankara", "01.06.2030", "04.06.2030")
+    assert "/arama/ankara-izmir-esb-adb/" in opened[0]
+    assert "/arama/istanbul-ankara-ist-esb/" in opened[1]
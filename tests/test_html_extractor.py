@@ -0,0 +1,62 @@
+"""
+Offline page_source parser birim testleri (tarayıcı gerektirmez)
+"""
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+pytest.importorskip("selenium")
+
+from utils.html_extractor import default_extractor, extract_files
+
+CARD = """
+<div class="flight-item" id="flight-{i}">
+  <div class="summary-airports">
+    <div class="summary-marketing-airlines" data-testid="{testid}">{airline}</div>
+    <div class="flight-departure-time" data-testid="departureTime">{dep}</div>
+    <span data-testid="departureFlightTime">1s 15dk</span>
+    <div class="flight-arrival-time" data-testid="arrivalTime">{arr}</div>
+    <div class="summary-transit" data-testid="{transit_id}">{transit}</div>
+    <div class="summary-average-price" data-price="{price}"><span class="money-int">{price_text}</span> TL</div>
+  </div>
+</div>
+"""
+
+
+def _page(cards):
+    body = "".join(CARD.format(i=i, **card) for i, card in enumerate(cards))
+    return f"<html><body><div class='flight-list-body'>{body}</div></body></html>"
+
+
+CARDS = [
+    dict(testid="THY", airline="Türk Hava Yolları", dep="10:05", arr="11:20", transit_id="transferStateDirect",
+         transit="Direkt", price="2450", price_text="2.450"),
+    dict(testid="Pegasus", airline="Pegasus", dep="17:40", arr="21:10", transit_id="transferStateTransfer",
+         transit="1 Aktarma", price="", price_text="1.899"),
+]
+
+
+def test_extracts_same_schema_as_live_dom():
+    records = default_extractor().extract(_page(CARDS))
+
+    assert records == [
+        {'departure_time': "10:05", 'arrival_time': "11:20", 'airline': "Türk Hava Yolları", 'price': 2450,
+         'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 1},
+        {'departure_time': "17:40", 'arrival_time': "21:10", 'airline': "Pegasus", 'price': 1899,
+         'connection': "1 Stop", 'duration': "1s 15dk", 'flight_index': 2},
+    ]
+    assert default_extractor().extract("") == []
+
+
+def test_bulk_extracts_saved_snapshots_in_order(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"page_{i}.html"
+        path.write_text(_page(CARDS[:i + 1]), encoding="utf-8")
+        paths.append(str(path))
+
+    results = list(extract_files(paths, workers=2, use_processes=False))
+
+    assert [path for path, _, _ in results] == paths
+    assert [len(records) for _, records, _ in results] == [1, 2, 2]
+    assert all(error is None for _, _, error in results)
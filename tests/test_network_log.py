@@ -0,0 +1,180 @@
+"""
+Performance log (CDP Network olayları) okuyucu birim testleri (tarayıcı gerektirmez)
+"""
+import json
+import pytest
+from utils.network_log import NetworkLog, get_network_log, parse_performance_entries
+
+
+def _entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeDriver:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+def test_parse_skips_non_network_and_malformed_entries():
+    events = parse_performance_entries([
+        _entry('Network.requestWillBeSent', requestId='1', request={'url': 'https://x/a.png'}),
+        _entry('Page.frameNavigated', frame={}),
+        {'message': 'not json'},
+    ])
+    assert [event['method'] for event in events] == ['Network.requestWillBeSent']
+
+
+def test_blocking_report_estimates_saved_bytes_from_loaded_requests():
+    driver = FakeDriver([
+        _entry('Network.requestWillBeSent', requestId='1', type='Image', request={'url': 'https://x/logo.png'}),
+        _entry('Network.loadingFinished', requestId='1', encodedDataLength=10_000),
+        _entry('Network.requestWillBeSent', requestId='2', type='Image', request={'url': 'https://x/ad.png'}),
+        _entry('Network.loadingFailed', requestId='2', type='Image', blockedReason='inspector'),
+        _entry('Network.requestWillBeSent', requestId='3', type='Font', request={'url': 'https://x/f.woff2'}),
+        _entry('Network.loadingFailed', requestId='3', type='Font', blockedReason='inspector'),
+        _entry('Network.requestWillBeSent', requestId='4', type='XHR', request={'url': 'https://x/api'}),
+    ])
+    network_log = get_network_log(driver)
+    assert get_network_log(driver) is network_log
+
+    report = network_log.blocking_report({'Font': 30_000})
+    assert report['blocked_requests'] == 2
+    assert report['loaded_requests'] == 1
+    assert report['estimated_saved_bytes'] == 10_000 + 30_000
+    assert report['by_type']['Font'] == {'requests': 1, 'estimated_bytes': 30_000}
+
+    # Bekleyen XHR tamamlanınca bir sonraki rapora girer, eski kayıtlar tekrar sayılmaz
+    driver.entries = [_entry('Network.loadingFinished', requestId='4', encodedDataLength=500)]
+    report = network_log.blocking_report()
+    assert report['blocked_requests'] == 0
+    assert report['loaded_bytes'] == 500
+
+
+class FakeResultsDriver(FakeDriver):
+    def __init__(self, entries, card_counts):
+        super().__init__(entries)
+        self.card_counts = card_counts
+
+    def execute_script(self, script, *args):
+        return self.card_counts.pop(0) if len(self.card_counts) > 1 else self.card_counts[0]
+
+
+def test_search_requests_are_tracked_until_consumed():
+    driver = FakeDriver([
+        _entry('Network.requestWillBeSent', requestId='1', type='XHR',
+               request={'url': 'http://127.0.0.1:8765/api/flights/search?route=ist-esb'}),
+        _entry('Network.requestWillBeSent', requestId='2', type='Script', request={'url': 'http://x/app.js'}),
+    ])
+    network_log = NetworkLog(driver, {'search_api_patterns': ['/api/flights/search']})
+    network_log.poll()
+    assert list(network_log.search_requests()) == ['1']
+    assert network_log.pending_search_requests() == 1
+
+    driver.entries = [_entry('Network.loadingFinished', requestId='1', encodedDataLength=2048)]
+    network_log.poll()
+    assert network_log.pending_search_requests() == 0
+
+    network_log.consume_search_requests()
+    assert network_log.search_requests() == {}
+
+
+def test_finished_and_reported_requests_are_evicted():
+    search_url = 'http://x/api/flights/search'
+    driver = FakeDriver([])
+    network_log = NetworkLog(driver, {'search_api_patterns': ['/api/flights/search'], 'max_requests': 5})
+
+    for batch in ('a', 'b'):
+        driver.entries = [
+            _entry('Network.requestWillBeSent', requestId=f'{batch}-search', request={'url': search_url}),
+            _entry('Network.loadingFinished', requestId=f'{batch}-search', encodedDataLength=100),
+        ]
+        network_log.poll()
+        network_log.consume_search_requests()
+    # Sadece son tüketilen arama grubu (flight_api yanıt gövdesi için) tutulur
+    assert list(network_log.requests) == ['b-search']
+    assert network_log.latest_search_request_ids() == ['b-search']
+
+    driver.entries = [_entry('Network.requestWillBeSent', requestId=str(i), request={'url': f'http://x/{i}.js'})
+                      for i in range(20)]
+    driver.entries += [_entry('Network.loadingFinished', requestId=str(i)) for i in range(20)]
+    network_log.poll()
+    assert len(network_log.requests) == 5
+    assert 'b-search' in network_log.requests
+
+    network_log.blocking_report()
+    assert list(network_log.requests) == ['b-search']
+
+    network_log.clear()
+    assert network_log.requests == {} and network_log.latest_search_request_ids() == []
+
+
+def test_results_settle_after_network_idle_and_stable_card_count():
+    pytest.importorskip("selenium")
+    from utils.waits import search_results_settled
+
+    # Pattern gerekmez: canlı sitedeki gibi bilinmeyen bir arama URL'i
+    driver = FakeResultsDriver(
+        [_entry('Network.requestWillBeSent', requestId='1', type='XHR', request={'url': 'http://x/graphql?op=search'})],
+        [0, 20, 60],
+    )
+    network_log = NetworkLog(driver)
+    condition = search_results_settled(network_log, "div.flight-item", stable_ms=0, network_idle_ms=0)
+
+    assert condition(driver) is False      # XHR bekleniyor, sayı 0
+    assert condition(driver) is False      # sayı değişti (20)
+    driver.entries = [_entry('Network.loadingFinished', requestId='1')]
+    assert condition(driver) is False      # sayı değişti (60)
+    assert condition(driver) == 60         # bekleyen XHR yok, sayı sabit
+    assert condition.requests_seen
+
+
+def test_pending_fetch_blocks_results_until_idle_and_patterns_narrow():
+    pytest.importorskip("selenium")
+    from utils.waits import search_results_settled
+
+    driver = FakeResultsDriver(
+        [_entry('Network.requestWillBeSent', requestId='1', type='Fetch', request={'url': 'http://x/api/fares'}),
+         _entry('Network.requestWillBeSent', requestId='2', type='Script', request={'url': 'http://x/app.js'})],
+        [5, 5, 5],
+    )
+    condition = search_results_settled(NetworkLog(driver), "div.flight-item", stable_ms=0, network_idle_ms=0)
+    assert condition(driver) is False      # ilk sayım
+    assert condition(driver) is False      # sayı sabit ama Fetch bekliyor (Script sayılmaz)
+    driver.entries = [_entry('Network.loadingFinished', requestId='1')]
+    assert condition(driver) == 5
+
+    # Pattern verilirse eşleşmeyen bekleyen istekler beklemeyi engellemez
+    driver = FakeResultsDriver(
+        [_entry('Network.requestWillBeSent', requestId='1', type='XHR', request={'url': 'http://x/beacon'})],
+        [5, 5],
+    )
+    condition = search_results_settled(NetworkLog(driver), "div.flight-item", stable_ms=0, network_idle_ms=0,
+                                       url_patterns=['/api/flights/search'])
+    assert condition(driver) is False
+    assert condition(driver) == 5
+    assert not condition.requests_seen
+
+
+def test_empty_results_wait_for_api_grace():
+    pytest.importorskip("selenium")
+    from utils.waits import search_results_settled
+
+    driver = FakeResultsDriver(
+        [_entry('Network.requestWillBeSent', requestId='1', type='XHR', request={'url': 'http://x/search'}),
+         _entry('Network.loadingFinished', requestId='1')],
+        [0, 0, 0],
+    )
+    condition = search_results_settled(NetworkLog(driver), "div.flight-item", stable_ms=0, network_idle_ms=0,
+                                       api_grace=0)
+    assert condition(driver) is False      # ilk sayım
+    assert condition(driver) is True       # XHR görüldü ve bitti, sonuç yok
+
+    driver = FakeResultsDriver([], [0, 0])
+    condition = search_results_settled(NetworkLog(driver), "div.flight-item", stable_ms=0, network_idle_ms=0,
+                                       api_grace=0)
+    assert condition(driver) is False
+    assert condition(driver) is False      # hiç XHR görülmedi, arama sürüyor olabilir
@@ -0,0 +1,97 @@
+"""
+SQLite gözlem deposu birim testleri (tarayıcı gerektirmez)
+"""
+import pytest
+from utils.observation_store import ObservationStore, iso_date
+
+
+def _flights(prices, airline="Pegasus"):
+    return [
+        {'departure_time': f"{8 + i:02d}:00", 'arrival_time': f"{9 + i:02d}:15", 'airline': airline,
+         'price': price, 'connection': "Direct", 'duration': "1s 15dk", 'flight_index': i + 1}
+        for i, price in enumerate(prices)
+    ]
+
+
+def test_batched_insert_is_idempotent_and_queryable():
+    store = ObservationStore(":memory:", batch_size=2)
+    route = "İstanbul-Ankara"
+
+    assert store.add_observations(_flights([1500, "2500", None]), route=route, travel_date="01.06.2030",
+                                  search_date="2030-05-01", scraped_at="2030-05-01T10:00:00") == 3
+    assert store.add_observations(_flights([1500, 2500, None]), route=route, travel_date="01.06.2030",
+                                  search_date="2030-05-01", scraped_at="2030-05-01T10:00:00") == 0
+    store.add_observations(_flights([1300], airline="AJet"), route=route, travel_date="2030-06-02",
+                           search_date="2030-05-02", scraped_at="2030-05-02T10:00:00")
+    store.add_observations(
+        [dict(flight, route="Ankara-İzmir", departure_date="03.06.2030") for flight in _flights([900])],
+        search_date="2030-05-02",
+    )
+
+    assert store.count() == 5
+    assert store.count(route=route, travel_date_from="2030-06-02") == 1
+    rows = store.query(route=route, airline="Pegasus", columns=['travel_date', 'price', 'departure_time'])
+    assert rows == [
+        {'travel_date': "2030-06-01", 'price': 1500, 'departure_time': "08:00"},
+        {'travel_date': "2030-06-01", 'price': 2500, 'departure_time': "09:00"},
+        {'travel_date': "2030-06-01", 'price': None, 'departure_time': "10:00"},
+    ]
+    assert store.query(route="Ankara-İzmir")[0]['travel_date'] == "2030-06-03"
+    assert store.daily_min_prices(route) == [
+        {'travel_date': "2030-06-01", 'search_date': "2030-05-01", 'min_price': 1500, 'observations': 3},
+        {'travel_date': "2030-06-02", 'search_date': "2030-05-02", 'min_price': 1300, 'observations': 1},
+    ]
+    plan = " ".join(row[-1] for row in store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM observations WHERE route = ? AND travel_date >= ?", (route, "2030-06-01")))
+    assert "idx_observations_route_travel" in plan
+
+    with pytest.raises(ValueError):
+        store.query(columns=['nope'])
+    with pytest.raises(ValueError):
+        store.add_observations(_flights([100]))
+    store.close()
+
+
+def test_missing_key_fields_do_not_duplicate_on_reimport(tmp_path):
+    partial = [{'price': 1800, 'connection': "Direct"}, {'airline': "AJet", 'price': 900, 'flight_index': 2}]
+    keys = dict(route="İstanbul-Ankara", travel_date="01.06.2030", search_date="2030-05-01",
+                scraped_at="2030-05-01T10:00:00")
+
+    store = ObservationStore(":memory:")
+    assert store.add_observations(partial, **keys) == 2
+    assert store.add_observations(partial, **keys) == 0
+    assert store.query(columns=['airline', 'departure_time', 'flight_index', 'price']) == [
+        {'airline': None, 'departure_time': None, 'flight_index': None, 'price': 1800},
+        {'airline': "AJet", 'departure_time': None, 'flight_index': 2, 'price': 900},
+    ]
+    store.close()
+
+    # Eski şema (NULL'lu anahtarlar) açılırken işaretlere çevrilir, tekrarlar silinir
+    import sqlite3
+    from utils import observation_store
+    path = str(tmp_path / "legacy.sqlite3")
+    legacy = observation_store.SCHEMA.replace(" NOT NULL DEFAULT ''", "").replace(" NOT NULL DEFAULT 0", "")
+    conn = sqlite3.connect(path)
+    conn.executescript(legacy)
+    conn.executemany("INSERT INTO observations (route, search_date, travel_date, scraped_at, airline, price) "
+                     "VALUES ('İstanbul-Ankara', '2030-05-01', '2030-06-01', '2030-05-01T10:00:00', ?, ?)",
+                     [(None, 1800), (None, 1800), ("AJet", 900)])
+    conn.commit()
+    conn.close()
+
+    with ObservationStore(path) as store:
+        assert store.count() == 2
+        assert store.add_observations([{'price': 1800}], **keys) == 0
+
+
+def test_store_feeds_analyzer():
+    pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("seaborn")
+
+    with ObservationStore(":memory:") as store:
+        store.add_observations(_flights([1000, 2000, 3000]), route="İstanbul-Ankara", travel_date="01.06.2030")
+        analyzer = store.to_analyzer(route="İstanbul-Ankara")
+
+    assert analyzer.calculate_airline_price_stats()["Pegasus"]['avg'] == 2000.0
+    assert iso_date("01.06.2030") == "2030-06-01"
@@ -0,0 +1,65 @@
+"""
+Parquet yazıcı/okuyucu birim testleri (tarayıcı gerektirmez)
+"""
+import csv
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from utils.parquet_helper import ParquetHelper
+
+FLIGHTS = [
+    {'route': "İstanbul-Ankara", 'departure_time': "08:00", 'arrival_time': "09:15", 'airline': "Pegasus",
+     'price': 1500, 'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 1},
+    {'route': "İstanbul-Ankara", 'departure_time': "12:30", 'arrival_time': "15:00", 'airline': "AJet",
+     'price': None, 'connection': "1 Stop", 'duration': "2s 30dk", 'flight_index': 2},
+    {'route': "Ankara-İzmir", 'departure_time': "18:45", 'arrival_time': "20:00", 'airline': "Pegasus",
+     'price': 900, 'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 1},
+]
+
+
+def test_round_trip_with_dictionary_columns_and_pushdown(tmp_path):
+    import pyarrow.parquet as pq
+    path = str(tmp_path / "flights.parquet")
+    ParquetHelper.save_flight_data(FLIGHTS, path)
+
+    schema = pq.read_schema(path)
+    assert str(schema.field('airline').type).startswith("dictionary")
+    assert str(schema.field('price').type) == "int32"
+    assert ParquetHelper.read_flight_data(path) == [dict(sorted(flight.items())) for flight in FLIGHTS]
+
+    table = ParquetHelper.read_table(path, columns=['airline', 'price', 'missing'],
+                                     filters=[('route', '=', "İstanbul-Ankara")])
+    assert table.column_names == ['airline', 'price']
+    assert table.num_rows == 2
+
+
+def test_csv_conversion_matches_source(tmp_path):
+    csv_path = tmp_path / "sweep.csv"
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(FLIGHTS[0]))
+        writer.writeheader()
+        writer.writerows(FLIGHTS)
+
+    parquet_path = ParquetHelper.csv_to_parquet(str(csv_path))
+    assert parquet_path.endswith("sweep.parquet")
+    assert ParquetHelper.read_flight_data(parquet_path, filters=[('price', '<', 1000)]) == [FLIGHTS[2]]
+
+
+def test_analyzer_loads_only_chart_columns(tmp_path):
+    pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("seaborn")
+    from utils.data_analysis import DataAnalyzer
+
+    path = str(tmp_path / "flights.parquet")
+    ParquetHelper.save_flight_data(FLIGHTS, path)
+
+    analyzer = DataAnalyzer.from_parquet(path, chart='heatmap')
+    assert list(analyzer.df.columns) == ['departure_minutes', 'price']
+    matrix, _ = analyzer.hourly_price_matrix()
+    assert matrix[1, 2] == 1500.0
+
+    stats = DataAnalyzer.from_parquet(path, chart='airline_stats',
+                                      filters=[('route', '=', "Ankara-İzmir")]).calculate_airline_price_stats()
+    assert list(stats) == ["Pegasus"] and stats["Pegasus"]['count'] == 1
@@ -0,0 +1,54 @@
+"""
+KLL quantile sketch birim testleri (tarayıcı gerektirmez)
+"""
+import json
+import random
+import pytest
+from utils.quantile_sketch import KLLSketch
+
+
+def _true_rank(sorted_values, value):
+    return sum(1 for item in sorted_values if item <= value) / len(sorted_values)
+
+
+def test_small_streams_are_exact_with_linear_interpolation():
+    sketch = KLLSketch().extend([1000, 3000, None, "2000", float('nan'), "N/A"])
+
+    assert sketch.exact and sketch.count == 3
+    assert sketch.quantile(0.1) == pytest.approx(1200.0)
+    assert sketch.quantile(0.3) == pytest.approx(1600.0)
+    assert sketch.quantile(0.5) == 2000.0
+    assert (sketch.quantile(0), sketch.quantile(1)) == (1000.0, 3000.0)
+    assert KLLSketch().quantile(0.5) is None
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_large_stream_bounded_memory_and_mergeable():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(7.8, 0.45) for _ in range(50000)]
+    ordered = sorted(values)
+
+    single = KLLSketch(seed=1).extend(values)
+    workers = [KLLSketch(seed=i).extend(values[i::4]) for i in range(4)]
+    merged = workers[0]
+    for worker in workers[1:]:
+        merged.merge(worker)
+
+    for sketch in (single, merged):
+        assert not sketch.exact
+        assert sketch.count == len(values)
+        assert sum(len(compactor) for compactor in sketch.compactors) < 1000
+        for q in (0.1, 0.3, 0.5, 0.9):
+            assert abs(_true_rank(ordered, sketch.quantile(q)) - q) < 0.02
+
+    restored = KLLSketch.from_dict(json.loads(json.dumps(merged.to_dict())))
+    assert restored.quantile(0.3) == merged.quantile(0.3)
+    assert restored.rank(merged.quantile(0.5)) == pytest.approx(0.5, abs=0.02)
+
+
+def test_merge_rejects_different_parameters():
+    with pytest.raises(ValueError):
+        KLLSketch(k=200).merge(KLLSketch(k=100).extend([1, 2, 3]))
+    with pytest.raises(ValueError):
+        KLLSketch(k=200).merge(KLLSketch(k=200, c=0.5))
@@ -0,0 +1,67 @@
+"""
+Replay sunucusu birim testleri (port 0 üzerinde, tarayıcı gerektirmez)
+"""
+import json
+import urllib.error
+import urllib.request
+import pytest
+from utils.flight_api import REPLAY_API_MAPPING, map_api_flights
+from utils.replay_server import ReplayServer, generate_flights, record_snapshot
+
+
+def _get(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.headers.get("Content-Type"), response.read().decode("utf-8")
+
+
+@pytest.fixture
+def server(tmp_path):
+    replay = ReplayServer(port=0, api_latency_ms=0, flights_per_search=12, snapshot_dir=tmp_path / "snapshots")
+    replay.start()
+    yield replay
+    replay.stop()
+
+
+def test_serves_results_page_with_search_xhr(server):
+    status, content_type, html = _get(f"{server.url}/ucak-bileti/arama/istanbul-ankara-ist-esb/?gidis=01.06.2030")
+
+    assert status == 200 and content_type.startswith("text/html")
+    assert 'data-testid="loading-indicator"' in html
+    assert "/api/flights/search" in html
+    # Port 0 ile seçilen gerçek port URL'e yansır
+    assert not server.url.endswith(":0")
+
+
+def test_search_api_returns_deterministic_flights(server):
+    status, content_type, body = _get(f"{server.url}/api/flights/search?gidis=01.06.2030&route=ist-esb")
+
+    assert status == 200 and content_type.startswith("application/json")
+    payload = json.loads(body)
+    assert payload["status"] == "ok"
+    assert payload["data"]["route"] == "ist-esb"
+    flights = payload["data"]["flights"]
+    assert flights == generate_flights("ist-esb", "01.06.2030", 12)
+    assert set(flights[0]) == {"id", "departure", "arrival", "airline", "price", "stops", "duration_minutes"}
+    prices = [flight["price"]["amount"] for flight in flights]
+    assert prices == sorted(prices)
+    assert len(map_api_flights(payload, REPLAY_API_MAPPING)) == 12
+
+
+def test_unknown_path_returns_404(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _get(f"{server.url}/bilinmeyen")
+    assert error.value.code == 404
+
+
+class FakeDriver:
+    page_source = "<html><body><div class='flight-item'>kayıtlı sonuç</div></body></html>"
+
+
+def test_recorded_snapshot_is_served_instead_of_template(server):
+    path = "/ucak-bileti/arama/istanbul-ankara-ist-esb"
+    target = record_snapshot(FakeDriver(), path, snapshot_dir=server.snapshot_dir)
+
+    assert target.endswith("ucak-bileti__arama__istanbul-ankara-ist-esb.html")
+    status, _, html = _get(f"{server.url}{path}/")
+    assert status == 200
+    assert html == FakeDriver.page_source
@@ -0,0 +1,221 @@
+"""
+ResultsPage saf mantık birim testleri (sahte driver/kart ile, tarayıcı gerektirmez)
+"""
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import NoSuchElementException
+from pages.results_page import ResultsPage
+from utils.selector_cache import SelectorCache, selector_key
+
+
+class FakeElement:
+    def __init__(self, text, data_price=None):
+        self.text = text
+        self.data_price = data_price
+
+    def get_attribute(self, name):
+        return self.data_price if name == "data-price" else None
+
+
+class FakeCard:
+    def __init__(self, elements):
+        self.elements = elements
+
+    def find_element(self, by, value):
+        if value not in self.elements:
+            raise NoSuchElementException(value)
+        return self.elements[value]
+
+
+class FakeBatchDriver:
+    """_BATCH_EXTRACT_SCRIPT yerine kart aralığını dilimleyen sahte driver"""
+    current_url = "https://www.enuygun.com/ucak-bileti/istanbul-ankara/"
+
+    def __init__(self, cards):
+        self.cards = cards
+        self.ranges = []
+
+    def execute_script(self, script, card_plan, field_plan, harvest_token, card_range=None):
+        self.ranges.append(card_range)
+        start, end = card_range or (0, len(self.cards))
+        return {'cards': self.cards[start:end], 'total': len(self.cards), 'source': "div.flight-item"}
+
+
+def _card(departure_time, airline, price):
+    return {
+        'departure_time': [(departure_time, None)],
+        'airline': [(airline, None)],
+        'price': [(str(price), None)],
+    }
+
+
+class FakeNode:
+    """Sanal scroll'un yeniden kullandığı kart DOM node'u (JS expando dahil)"""
+
+    def __init__(self, text):
+        self.text_content = text
+        self.harvest = None
+
+
+class FakeScrollDriver:
+    """Her kaydırmada sıradaki görünür node grubunu gösteren sahte driver"""
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.position = 0
+        self.batches = 0
+        self.scrolls = 0
+
+    def execute_script(self, script, *args):
+        if script is not ResultsPage._BATCH_EXTRACT_SCRIPT:
+            self.scrolls += 1
+            self.position = min(self.position + 1, len(self.steps) - 1)
+            return None
+        self.batches += 1
+        harvest_token = args[2]
+        cards = []
+        for node in self.steps[self.position]:
+            signature = f"{harvest_token}|{node.text_content}"
+            if node.harvest == signature:
+                continue
+            node.harvest = signature
+            departure_time, airline, price = node.text_content.split("|")
+            cards.append(_card(departure_time, airline, price))
+        return {'cards': cards, 'total': len(cards), 'source': "div.flight-item"}
+
+
+@pytest.fixture
+def page(tmp_path):
+    results = ResultsPage(None)
+    results.selector_cache = SelectorCache(tmp_path / "selectors.json")
+    return results
+
+
+def test_lazy_candidates_record_hit_only_for_accepted_values(page):
+    price_selectors = ResultsPage.FLIGHT_FIELD_SELECTORS['price']
+    card = FakeCard({
+        price_selectors[0][1]: FakeElement("", data_price=None),
+        price_selectors[2][1]: FakeElement("1.499 TL"),
+    })
+
+    flight_info = page._build_flight_info(page._collect_card_candidates(card))
+    assert flight_info['price'] == 1499
+
+    stats = page.selector_cache.stats('results')['results/card_price']
+    assert stats['winner'] == selector_key(price_selectors[2])
+    assert stats['selectors'][selector_key(price_selectors[0])] == {'hits': 0, 'misses': 1}
+    # Boş span'a eşleşen selector sonraki çalıştırmada öne alınmaz
+    assert page.selector_cache.order('results', 'card_price', price_selectors)[0] == price_selectors[2]
+
+
+def test_build_flight_info_takes_first_accepted_candidate_per_field():
+    flight_info = ResultsPage._build_flight_info({
+        'departure_time': [None, ("", None), ("10:30", None)],
+        'arrival_time': [("11:45", None), ("12:00", None)],
+        'airline': [("Unknown", None), ("Pegasus", None)],
+        'price': [("", "abc"), ("2.350,00 TL", None), ("999 TL", None)],
+        'connection': [None, ("1 Aktarma", None)],
+        'duration': [("", None), ("1s 15dk", None)],
+    })
+
+    assert flight_info == {
+        'departure_time': "10:30", 'arrival_time': "11:45", 'airline': "Pegasus",
+        'price': 235000, 'connection': "1 Stop", 'duration': "1s 15dk",
+    }
+
+
+def test_build_flight_info_prefers_data_price_attribute():
+    flight_info = ResultsPage._build_flight_info({'price': [("1.499 TL", "1299.90")]})
+    assert flight_info['price'] == 1299
+
+
+def test_build_flight_info_defaults_when_no_candidate_found():
+    flight_info = ResultsPage._build_flight_info({
+        'departure_time': [None, None],
+        'airline': [None, ("", None)],
+        'price': [("Fiyat yok", None)],
+        'connection': [("", None)],
+    })
+
+    assert flight_info == {
+        'departure_time': "N/A", 'arrival_time': "N/A", 'airline': "Unknown",
+        'price': None, 'connection': "Direct", 'duration': "N/A",
+    }
+
+
+def test_iter_flight_data_reads_cards_in_chunks(tmp_path):
+    cards = [_card(f"{hour:02d}:00", "Pegasus", 1000 + hour) for hour in range(7)]
+    cards[3] = {'departure_time': [None], 'airline': [None], 'price': [None]}
+    driver = FakeBatchDriver(cards)
+    results = ResultsPage(driver)
+    results.selector_cache = SelectorCache(tmp_path / "selectors.json")
+
+    flights = list(results.iter_flight_data(source="dom", chunk_size=3))
+
+    assert driver.ranges == [[0, 3], [3, 6], [6, 9]]
+    # Boş kart (N/A + Unknown) atlanır, flight_index kart sırasını korur
+    assert [flight['flight_index'] for flight in flights] == [1, 2, 3, 5, 6, 7]
+    assert [flight['price'] for flight in flights] == [1000, 1001, 1002, 1004, 1005, 1006]
+
+
+def test_iter_flight_data_without_chunk_size_uses_single_script(tmp_path):
+    driver = FakeBatchDriver([_card("08:15", "AJet", 899), _card("09:40", "THY", 1299)])
+    results = ResultsPage(driver)
+    results.selector_cache = SelectorCache(tmp_path / "selectors.json")
+
+    flights = list(results.iter_flight_data(source="dom", chunk_size=None))
+
+    assert driver.ranges == [None]
+    assert [flight['airline'] for flight in flights] == ["AJet", "THY"]
+
+
+@pytest.fixture
+def harvest_page(tmp_path, monkeypatch):
+    monkeypatch.setattr('pages.results_page.settle', lambda *args, **kwargs: True)
+
+    def build(steps):
+        results = ResultsPage(FakeScrollDriver(steps))
+        results.selector_cache = SelectorCache(tmp_path / "selectors.json")
+        return results
+    return build
+
+
+def _scroll_steps():
+    first, second, third = FakeNode("10:00|Pegasus|1000"), FakeNode("11:00|AJet|1100"), FakeNode("12:00|THY|1200")
+    # İkinci adımda aynı uçuş farklı bir node'da yeniden çizilir
+    return [[first, second], [FakeNode("11:00|AJet|1100"), third], [third]]
+
+
+def test_harvest_dedupes_by_flight_key_and_stops_after_idle_rounds(harvest_page):
+    results = harvest_page(_scroll_steps())
+
+    flights = list(results.harvest_flight_data(max_idle_rounds=2))
+
+    assert [flight['departure_time'] for flight in flights] == ["10:00", "11:00", "12:00"]
+    assert [flight['flight_index'] for flight in flights] == [1, 2, 3]
+    # 2 adımda yeni kart gelir, sonra ardışık 2 boş adımda durulur
+    assert results.driver.batches == 4
+    assert results.driver.scrolls == 4
+
+
+def test_harvest_stops_at_max_records(harvest_page):
+    results = harvest_page(_scroll_steps())
+
+    flights = list(results.harvest_flight_data(max_records=2))
+
+    assert [flight['airline'] for flight in flights] == ["Pegasus", "AJet"]
+    assert results.driver.batches == 1
+    assert results.driver.scrolls == 0
+
+
+def test_second_harvest_on_same_page_reads_cards_again(harvest_page):
+    results = harvest_page(_scroll_steps())
+    assert len(list(results.harvest_flight_data(max_idle_rounds=1))) == 3
+
+    # Aynı node'lar hâlâ önceki harvest'in işaretini taşır
+    results.driver.position = 0
+    flights = list(results.harvest_flight_data(max_idle_rounds=1))
+
+    assert [flight['price'] for flight in flights] == [1000, 1100, 1200]
@@ -0,0 +1,42 @@
+"""
+Selector önbelleği birim testleri (tarayıcı gerektirmez)
+"""
+from utils.selector_cache import SelectorCache, selector_key
+
+SELECTORS = [
+    ("css selector", "[data-price]"),
+    ("css selector", ".money-int"),
+    ("xpath", ".//span[contains(@class, 'money-int')]"),
+]
+
+
+def test_winner_moves_first_and_failures_demoted(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+    assert cache.order('results', 'price', SELECTORS) == SELECTORS
+
+    cache.record('results', 'price', SELECTORS[0], hit=False)
+    cache.record('results', 'price', SELECTORS[0], hit=False)
+    cache.record('results', 'price', SELECTORS[2], hit=True)
+
+    assert cache.order('results', 'price', SELECTORS) == [SELECTORS[2], SELECTORS[1], SELECTORS[0]]
+    stats = cache.stats('results')['results/price']
+    assert stats['winner'] == selector_key(SELECTORS[2])
+    assert stats['selectors'][selector_key(SELECTORS[0])] == {'hits': 0, 'misses': 2}
+
+
+def test_persists_between_instances(tmp_path):
+    path = tmp_path / "selectors.json"
+    cache = SelectorCache(path)
+    cache.record('results', 'price', SELECTORS[1], hit=True)
+    cache.save()
+
+    reloaded = SelectorCache(path)
+    assert reloaded.order('results', 'price', SELECTORS)[0] == SELECTORS[1]
+
+
+def test_disabled_cache_keeps_order(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json", enabled=False)
+    cache.record('results', 'price', SELECTORS[2], hit=True)
+    cache.save()
+    assert cache.order('results', 'price', SELECTORS) == SELECTORS
+    assert not (tmp_path / "selectors.json").exists()
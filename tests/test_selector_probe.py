@@ -0,0 +1,80 @@
+"""
+Selector probe birim testleri (sahte driver ile, tarayıcı gerektirmez)
+"""
+import types
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.webdriver.common.by import By
+from utils.selector_probe import implicit_wait_disabled, probe
+
+
+class FakeElement:
+    def __init__(self, name, displayed=True):
+        self.name = name
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class FakeDriver:
+    def __init__(self, elements, implicit_wait=10):
+        self.elements = elements
+        self.timeouts = types.SimpleNamespace(implicit_wait=implicit_wait)
+        self.implicit_waits = []
+        self.lookups = []
+        self.scripts = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+        self.timeouts.implicit_wait = seconds
+
+    def find_elements(self, by, value):
+        self.lookups.append((value, self.timeouts.implicit_wait))
+        return self.elements.get(value, [])
+
+    def execute_script(self, script, root, selectors):
+        self.scripts.append(selectors)
+        return [(self.elements.get(value) or [None])[0] for _, value in selectors]
+
+
+def test_probe_returns_first_accepted_match_in_selector_order():
+    hidden, visible, later = FakeElement("hidden", displayed=False), FakeElement("visible"), FakeElement("later")
+    driver = FakeDriver({"#hidden": [hidden], "#visible": [visible], "#later": [later]})
+    selectors = [(By.CSS_SELECTOR, "#missing"), (By.CSS_SELECTOR, "#hidden"),
+                 (By.CSS_SELECTOR, "#visible"), (By.CSS_SELECTOR, "#later")]
+
+    element, selector = probe(driver, selectors, accept=FakeElement.is_displayed)
+
+    assert (element, selector) == (visible, (By.CSS_SELECTOR, "#visible"))
+    # CSS/XPath zinciri tek script ile taranır, find_elements çağrılmaz
+    assert len(driver.scripts) == 1 and driver.lookups == []
+
+
+def test_probe_disables_implicit_wait_for_non_js_strategies():
+    driver = FakeDriver({"search": [FakeElement("search")]}, implicit_wait=10)
+    selectors = [(By.ID, "missing"), (By.NAME, "search")]
+
+    element, selector = probe(driver, selectors)
+
+    assert element.name == "search" and selector == (By.NAME, "search")
+    # Eksik selector implicit wait kadar beklemez; çıkışta eski değer geri yüklenir
+    assert driver.lookups == [("missing", 0), ("search", 0)]
+    assert driver.implicit_waits == [0, 10]
+    assert driver.timeouts.implicit_wait == 10
+
+
+def test_probe_without_match_returns_none_pair():
+    driver = FakeDriver({})
+    assert probe(driver, [(By.ID, "missing")]) == (None, None)
+    assert probe(driver, []) == (None, None)
+
+
+def test_implicit_wait_restored_after_error():
+    driver = FakeDriver({}, implicit_wait=5)
+    with pytest.raises(RuntimeError):
+        with implicit_wait_disabled(driver):
+            raise RuntimeError("arama hatası")
+    assert driver.timeouts.implicit_wait == 5
@@ -0,0 +1,51 @@
+"""
+Akış (iterable) tüketicileri birim testleri (tarayıcı gerektirmez)
+"""
+import csv
+import pytest
+from utils.csv_helper import CSVHelper
+
+FLIGHTS = [
+    {'departure_time': "10:05", 'arrival_time': "11:20", 'airline': "Pegasus", 'price': 1500,
+     'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 1},
+    {'departure_time': "12:00", 'arrival_time': "13:15", 'airline': "Pegasus", 'price': 2500,
+     'connection': "Direct", 'duration': "1s 15dk", 'flight_index': 2},
+    {'departure_time': "18:30", 'arrival_time': "19:45", 'airline': "AJet", 'price': None,
+     'connection': "1 Stop", 'duration': "N/A", 'flight_index': 3},
+]
+
+
+def test_stream_writes_while_passing_records_through(tmp_path):
+    path = tmp_path / "reports" / "stream.csv"
+    consumed = []
+
+    for flight in CSVHelper.stream_flight_data(iter(FLIGHTS), str(path), flush_every=1):
+        consumed.append(flight)
+        with open(path, encoding='utf-8') as f:
+            assert len(list(csv.DictReader(f))) == len(consumed)
+
+    assert consumed == FLIGHTS
+    with open(path, encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == sorted(FLIGHTS[0].keys())
+        assert [row['airline'] for row in reader] == ["Pegasus", "Pegasus", "AJet"]
+
+
+def test_running_stats_match_batch_stats():
+    pytest.importorskip("pandas")
+    from utils.data_analysis import DataAnalyzer, RunningFlightStats
+
+    analyzer = DataAnalyzer.from_iterable(iter(FLIGHTS))
+
+    batch_stats = analyzer.calculate_airline_price_stats()
+    running_stats = analyzer.running_stats.airline_price_stats()
+    assert list(running_stats) == list(batch_stats)
+    for airline, stats in running_stats.items():
+        assert set(stats) == set(batch_stats[airline])
+        assert stats == pytest.approx(batch_stats[airline])
+    summary = analyzer.running_stats.summary()
+    assert summary['records'] == 3
+    assert summary['count'] == 2
+    assert summary['avg'] == 2000
+    assert round(summary['std'], 3) == round((2 * 500 ** 2) ** 0.5, 3)
+    assert RunningFlightStats().summary() == {'records': 0, 'count': 0}
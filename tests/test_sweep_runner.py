@@ -0,0 +1,71 @@
+"""
+Sweep runner birim testleri (worker işi sahte, tarayıcı gerektirmez)
+"""
+import csv
+import datetime
+import os
+from utils import sweep_runner
+from utils.quantile_sketch import KLLSketch
+from utils.sweep_runner import SweepJob, build_route_matrix, run_sweep
+
+
+class FakeDriver:
+    def __init__(self, marker):
+        self.marker = marker
+
+    def quit(self):
+        with open(self.marker, 'w') as f:
+            f.write("quit")
+
+
+def _fake_run_job(job, retries):
+    """Gerçek _run_job yerine: worker sürecine sahte driver bağlar, kayıt üretir"""
+    if sweep_runner._worker_driver is None:
+        marker = os.path.join(os.environ['SWEEP_TEST_DIR'], f"quit_{os.getpid()}")
+        sweep_runner._worker_driver = FakeDriver(marker)
+    if job.departure_city == "İzmir":
+        return {'worker': os.getpid(), 'job': job, 'attempts': retries + 1, 'duration': 0.01,
+                'records': [], 'error': "Uçuş verisi çıkarılamadı", 'sketch': None}
+    records = [dict(route=job.route, departure_city=job.departure_city, destination_city=job.destination_city,
+                    departure_date=job.departure_date, return_date=job.return_date, flight_index=index,
+                    airline="Pegasus", price=price)
+               for index, price in enumerate((1000, 2000), 1)]
+    return {'worker': os.getpid(), 'job': job, 'attempts': 1, 'duration': 0.01, 'records': records,
+            'error': None, 'sketch': KLLSketch().extend(record['price'] for record in records)}
+
+
+def test_route_matrix_covers_ordered_pairs_and_offsets():
+    jobs = build_route_matrix(["İstanbul", "Ankara", "İzmir"], [7, 14], return_days=3,
+                              today=datetime.date(2030, 1, 1))
+
+    assert len(jobs) == 3 * 2 * 2
+    assert jobs[0] == SweepJob("İstanbul", "Ankara", "08.01.2030", "11.01.2030")
+    assert jobs[1] == SweepJob("İstanbul", "Ankara", "15.01.2030", "18.01.2030")
+    assert jobs[0].route == "İstanbul-Ankara"
+    assert all(job.departure_city != job.destination_city for job in jobs)
+    assert build_route_matrix(["İstanbul"], [7], 3) == []
+
+
+def test_run_sweep_streams_results_and_quits_worker_drivers(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep_runner, '_run_job', _fake_run_job)
+    monkeypatch.setenv('SWEEP_TEST_DIR', str(tmp_path))
+    jobs = build_route_matrix(["İstanbul", "Ankara", "İzmir"], [7], return_days=3,
+                              today=datetime.date(2030, 1, 1))
+    output = tmp_path / "sweep.csv"
+
+    report = run_sweep(jobs, str(output), workers=2, retries=1, config={'site': {'url': "http://127.0.0.1:8765"}})
+
+    assert (report['jobs'], report['succeeded'], report['failed']) == (6, 4, 2)
+    assert report['records'] == 8
+    assert {failure['job']['departure_city'] for failure in report['failures']} == {"İzmir"}
+    assert report['price_quantiles']['p50'] == 1500.0
+    assert sum(stats['retries'] for stats in report['workers'].values()) == 2
+
+    with open(output, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 8
+    assert list(rows[0]) == sweep_runner.FLIGHT_FIELDS
+
+    # Executor kapanırken her worker'ın tarayıcısı kapatılmış olmalı
+    markers = [name for name in os.listdir(tmp_path) if name.startswith("quit_")]
+    assert sorted(markers) == sorted(f"quit_{pid}" for pid in report['workers'])
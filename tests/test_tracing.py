@@ -0,0 +1,65 @@
+"""
+Tracing katmanı birim testleri (tarayıcı gerektirmez, sahte driver kullanır)
+"""
+import json
+import threading
+import time
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.tracing import Tracer, traced
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+
+
+class FakePage:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @traced()
+    def step(self):
+        self.driver.execute('findElements')
+        self.driver.execute('getElementText')
+        time.sleep(0.02)
+        WebDriverWait(self.driver, 1, poll_frequency=0.01).until(lambda d: True)
+
+
+def test_span_records_commands_and_sleep(tmp_path):
+    page = FakePage(FakeDriver())
+    page.step()  # tracer yokken no-op
+
+    tracer = Tracer("unit")
+    with tracer.activate(page.driver):
+        page.step()
+
+    assert time.sleep.__name__ == 'sleep'
+    span = tracer.spans[0]
+    assert span['name'] == 'FakePage.step'
+    assert span['commands'] == 2
+    assert span['sleep_s'] >= 0.02
+    assert tracer.command_types == {'findElements': 1, 'getElementText': 1}
+
+    path = tracer.write_json(str(tmp_path / "trace.json"))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['total_commands'] == 2
+    assert 'FakePage.step' in tracer.summary_table()
+
+
+def test_other_threads_are_not_attributed_to_tracer():
+    driver = FakeDriver()
+    page = FakePage(driver)
+    tracer = Tracer("unit")
+    with tracer.activate(driver):
+        worker = threading.Thread(target=page.step)
+        worker.start()
+        worker.join()
+
+    # Başka thread'in sleep/wait/komutları ve span'leri bu trace'e girmez
+    assert tracer.spans == []
+    assert tracer.commands == 0
+    assert tracer.sleep_seconds == 0.0 and tracer.wait_seconds == 0.0
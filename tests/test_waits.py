@@ -0,0 +1,32 @@
+"""
+Bekleme koşulları birim testleri (sahte element ile, tarayıcı gerektirmez)
+"""
+import pytest
+
+pytest.importorskip("selenium")
+
+from utils.waits import input_value_committed
+
+
+class FakeInput:
+    def __init__(self, value):
+        self.value = value
+
+    def get_attribute(self, name):
+        return self.value
+
+
+def test_input_value_committed_waits_for_expected_city():
+    element = FakeInput("")
+    condition = input_value_committed(element, "İstanbul")
+    assert condition(None) is False
+
+    element.value = "Ank"
+    assert condition(None) is False
+    element.value = "ISTANBUL, Tüm Havalimanları"
+    assert condition(None) is element
+
+    alternatives = input_value_committed(element, ["Lefkoşa", "Ercan"])
+    element.value = "Ercan Havalimanı (ECN)"
+    assert alternatives(None) is element
+    assert input_value_committed(element)(None) is element
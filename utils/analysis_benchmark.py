@@ -0,0 +1,175 @@
+"""
+DataAnalyzer istatistiklerini büyük sentetik geçmiş verisi üzerinde ölçen benchmark
+
+Çok rotalı geçmiş dosyaları milyon satır mertebesinde olduğu için sentetik veri
+numpy ile tek seferde üretilir; eski havayolu başına filtreleme döngüsü ile
+tek geçişli groupby sürümü, ısı haritası için de satır satır apply + 24 filtreli
+matris doldurma ile vektörel bincount sürümü karşılaştırılır. Eski sürümler ham
+object kolonlarında, yeniler bir kez normalize edilmiş tipli şemada çalışır.
+
+Kullanım:
+    python -m utils.analysis_benchmark --rows 1000000 --repeat 3
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from utils.data_analysis import DataAnalyzer
+
+
+AIRLINES = [
+    "Türk Hava Yolları", "Pegasus", "AJet", "SunExpress", "Corendon", "Lufthansa",
+    "Qatar Airways", "Emirates", "KLM", "Air France", "Wizz Air", "Unknown",
+]
+CONNECTIONS = ["Direct", "1 Stop", "2 Stop"]
+
+
+def generate_history(rows, seed=42):
+    """Sentetik uçuş geçmişi üretir (extract_all_flight_data şemasında)
+
+    Args:
+        rows: Satır sayısı
+        seed: Rastgelelik tohumu
+
+    Returns:
+        pd.DataFrame: Uçuş satırları (fiyatların ~%2'si eksik)
+    """
+    rng = np.random.default_rng(seed)
+    departure_minutes = rng.integers(0, 24 * 60, rows)
+    duration_minutes = rng.integers(45, 16 * 60, rows)
+    arrival_minutes = (departure_minutes + duration_minutes) % (24 * 60)
+    prices = rng.lognormal(mean=7.8, sigma=0.45, size=rows).round().astype(object)
+    prices[rng.random(rows) < 0.02] = None
+
+    def clock(minutes):
+        return pd.Series(minutes // 60).astype(str).str.zfill(2) + ":" + pd.Series(minutes % 60).astype(str).str.zfill(2)
+
+    return pd.DataFrame({
+        'departure_time': clock(departure_minutes),
+        'arrival_time': clock(arrival_minutes),
+        'airline': np.array(AIRLINES, dtype=object)[rng.integers(0, len(AIRLINES), rows)],
+        'price': prices,
+        'connection': np.array(CONNECTIONS, dtype=object)[rng.choice(3, rows, p=[0.55, 0.35, 0.10])],
+        'duration': pd.Series(duration_minutes // 60).astype(str) + "s " + pd.Series(duration_minutes % 60).astype(str) + "dk",
+        'flight_index': np.arange(1, rows + 1),
+    })
+
+
+def legacy_airline_price_stats(df):
+    """Havayolu başına tüm DataFrame'i yeniden filtreleyen eski uygulama (karşılaştırma için)"""
+    airline_stats = {}
+    for airline in df['airline'].unique():
+        if airline == "Unknown" or pd.isna(airline):
+            continue
+        prices = pd.to_numeric(df[df['airline'] == airline]['price'].dropna(), errors='coerce').dropna()
+        if len(prices) > 0:
+            airline_stats[airline] = {
+                "min": float(prices.min()),
+                "max": float(prices.max()),
+                "avg": float(prices.mean()),
+                "count": len(prices)
+            }
+    return airline_stats
+
+
+def legacy_hourly_matrix(df):
+    """Satır başına apply ile saat çıkarıp matrisi 24 ayrı filtreyle dolduran eski uygulama"""
+    def extract_hour(time_str):
+        try:
+            if pd.isna(time_str) or time_str == "N/A":
+                return None
+            time_str = str(time_str)
+            if ':' in time_str:
+                hour = int(time_str.split(':')[0].strip())
+                if 0 <= hour <= 23:
+                    return hour
+            return None
+        except:
+            return None
+
+    hourly = pd.DataFrame({'hour': df['departure_time'].apply(extract_hour),
+                           'price_numeric': pd.to_numeric(df['price'], errors='coerce')})
+    hourly_prices = hourly.dropna().groupby('hour')['price_numeric'].mean().reset_index()
+    price_matrix = np.zeros((4, 6))
+    for i in range(4):
+        for j in range(6):
+            hour_data = hourly_prices[hourly_prices['hour'] == i * 6 + j]
+            price_matrix[i, j] = hour_data['price_numeric'].iloc[0] if not hour_data.empty else np.nan
+    return price_matrix
+
+
+def _best_of(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def run(rows, repeat=3, seed=42):
+    """Eski ve yeni istatistik hesaplamalarını ölçer, sonuçların tutarlılığını kontrol eder
+
+    Returns:
+        dict: Süreler (saniye), hızlanma, bellek (MB) ve havayolu sayısı
+    """
+    started = time.perf_counter()
+    df = generate_history(rows, seed)
+    generate_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    analyzer = DataAnalyzer.from_frame(df)
+    normalize_s = time.perf_counter() - started
+    raw_mb = df.memory_usage(deep=True).sum() / 2 ** 20
+    typed_mb = analyzer.df.memory_usage(deep=True).sum() / 2 ** 20
+
+    legacy_s, legacy = _best_of(lambda: legacy_airline_price_stats(df), repeat)
+    grouped_s, grouped = _best_of(analyzer.calculate_airline_price_stats, repeat)
+
+    legacy_heatmap_s, legacy_matrix = _best_of(lambda: legacy_hourly_matrix(df), repeat)
+    heatmap_s, (matrix, _) = _best_of(lambda: analyzer.hourly_price_matrix(60), repeat)
+    assert np.allclose(legacy_matrix, matrix, equal_nan=True), "Isı haritası matrisi uyuşmuyor"
+
+    for airline, stats in legacy.items():
+        for key in ("min", "max", "count"):
+            assert stats[key] == grouped[airline][key], f"{airline} {key} uyuşmuyor"
+        assert abs(stats["avg"] - grouped[airline]["avg"]) < 1e-6, f"{airline} avg uyuşmuyor"
+
+    return {
+        'rows': rows,
+        'airlines': len(grouped),
+        'generate_s': generate_s,
+        'normalize_s': normalize_s,
+        'raw_mb': raw_mb,
+        'typed_mb': typed_mb,
+        'legacy_s': legacy_s,
+        'grouped_s': grouped_s,
+        'speedup': legacy_s / grouped_s if grouped_s else float('inf'),
+        'legacy_heatmap_s': legacy_heatmap_s,
+        'heatmap_s': heatmap_s,
+        'heatmap_speedup': legacy_heatmap_s / heatmap_s if heatmap_s else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataAnalyzer istatistik benchmark'ı")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    result = run(args.rows, args.repeat, args.seed)
+    print(f"[INFO] {result['rows']:,} satır, {result['airlines']} havayolu (üretim {result['generate_s']:.2f}s)")
+    print(f"   • Tipli şema normalizasyonu (tek sefer): {result['normalize_s']:.2f}s, "
+          f"bellek {result['raw_mb']:.1f}MB -> {result['typed_mb']:.1f}MB")
+    print(f"   • Eski döngü (min/max/avg/count): {result['legacy_s']:.3f}s")
+    print(f"   • Tek geçiş groupby (+median/p10/p90/std/direkt oranı): {result['grouped_s']:.3f}s")
+    print(f"[OK] Hızlanma: {result['speedup']:.1f}x")
+    print(f"   • Eski ısı haritası (apply + 24 filtre): {result['legacy_heatmap_s']:.3f}s")
+    print(f"   • Vektörel ısı haritası (bincount, 60 dk): {result['heatmap_s']:.3f}s")
+    print(f"[OK] Hızlanma: {result['heatmap_speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,25 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.common.exceptions import SessionNotCreatedException
+from utils.driver_cache import resolve_driver_path
+from utils.command_profiler import ProfiledDriver
+from utils.logger import logger
+from utils.network_log import attach_network_log
 import io
 
 
+# browser.block.resource_types değerlerinin karşılığı olan URL kalıpları.
+# Engelleme CDP resource type'ına göre değil, dosya uzantısına göre yapılır:
+# uzantısız URL'lerden sunulan görsel/font'lar engellenmez.
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*.avif*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.m4a*'],
+    'stylesheet': ['*.css*'],
+}
+
+
 def load_config():
     """Config dosyasını yükler
     
@@ -19,17 +33,46 @@ def load_config():
         return yaml.safe_load(f)
 
 
-def create_driver():
+def _start_driver(browser_name, cache_config, start):
+    """Önbellekten çözülen driver ile tarayıcıyı başlatır
+
+    Tarayıcı otomatik güncellendiyse kayıtlı driver oturum açamaz
+    (SessionNotCreatedException); bu durumda kayıt silinip driver bir kez
+    yeniden çözülür.
+
+    Args:
+        browser_name: "chrome" veya "firefox"
+        cache_config: config.yaml `browser.driver_cache` bölümü
+        start: Driver yolunu alıp WebDriver döndüren fonksiyon
+
+    Returns:
+        WebDriver: Başlatılan tarayıcı
+    """
+    try:
+        return start(resolve_driver_path(browser_name, cache_config))
+    except SessionNotCreatedException as e:
+        logger.warning(f"Driver tarayıcıyla oturum açamadı, yeniden çözülüyor: {e.msg}")
+        return start(resolve_driver_path(browser_name, cache_config, refresh=True))
+
+
+def create_driver(profile_commands=None):
     """WebDriver instance oluşturur (Chrome veya Firefox)
     
+    Args:
+        profile_commands: True ise komut sayan ProfiledDriver döner
+            (None: config'deki browser.profile_commands değeri kullanılır)
+    
     Returns:
-        WebDriver: Yapılandırılmış WebDriver instance'ı
+        WebDriver: Yapılandırılmış WebDriver instance'ı (veya ProfiledDriver)
     """
     config = load_config()
     browser_name = config['browser']['name'].lower()
     headless = config['browser']['headless']
     width = config['browser']['window_size']['width']
     height = config['browser']['window_size']['height']
+    cache_config = config['browser'].get('driver_cache', {})
+    block_config = config['browser'].get('block', {})
+    network_config = config.get('network', {})
 
     if browser_name == 'chrome':
         options = ChromeOptions()
@@ -55,8 +98,14 @@ def create_driver():
         options.add_argument('--allow-running-insecure-content')
         options.add_argument(f'--window-size={width},{height}')
         options.page_load_strategy = 'eager'
+        if (block_config.get('enabled', False) or network_config.get('performance_log', True)
+                or network_config.get('extraction') == "api"):
+            # Sonuç beklemesi (ağ boşta), engelleme raporu ve API çıkarımı için CDP Network olayları
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        driver = _start_driver('chrome', cache_config,
+                               lambda path: webdriver.Chrome(service=ChromeService(path), options=options))
+        apply_request_blocking(driver, block_config)
 
     elif browser_name == 'firefox':
         options = FirefoxOptions()
@@ -64,11 +113,67 @@ def create_driver():
             options.add_argument('--headless')
         options.add_argument(f'--width={width}')
         options.add_argument(f'--height={height}')
-        driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
+        driver = _start_driver('firefox', cache_config,
+                               lambda path: webdriver.Firefox(service=FirefoxService(path), options=options))
+        if block_config.get('enabled', False):
+            logger.warning("İstek engelleme sadece Chrome'da destekleniyor, Firefox için atlandı")
 
     else:
         raise ValueError(f"Desteklenmeyen tarayıcı: {browser_name}")
 
+    attach_network_log(driver, network_config)
     driver.implicitly_wait(config['browser']['implicit_wait'])
     driver.set_page_load_timeout(config['browser']['page_load_timeout'])
+
+    if profile_commands is None:
+        profile_commands = config['browser'].get('profile_commands', False)
+    if profile_commands:
+        return ProfiledDriver(driver)
     return driver
+
+
+def blocked_url_patterns(block_config):
+    """browser.block ayarından Network.setBlockedURLs kalıp listesini üretir
+
+    resource_types değerleri RESOURCE_TYPE_PATTERNS ile uzantı kalıplarına
+    çevrilir (setBlockedURLs sadece URL kalıbı kabul eder).
+
+    Args:
+        block_config: config['browser']['block'] sözlüğü
+
+    Returns:
+        list: Tekrarsız URL kalıpları (engelleme kapalıysa boş liste)
+    """
+    if not block_config or not block_config.get('enabled', False):
+        return []
+    patterns = list(block_config.get('url_patterns', []))
+    for resource_type in block_config.get('resource_types', []):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type.lower(), []))
+    return list(dict.fromkeys(patterns))
+
+
+def apply_request_blocking(driver, block_config):
+    """Chrome DevTools ile kalıplara uyan istekleri engeller
+
+    Engellenen istekler performance log'da blockedReason ile görünür;
+    utils.network_log.log_blocking_savings sayfa başına tasarrufu raporlar.
+
+    Args:
+        driver: Chrome WebDriver instance'ı
+        block_config: config['browser']['block'] sözlüğü
+
+    Returns:
+        list: Uygulanan URL kalıpları
+    """
+    patterns = blocked_url_patterns(block_config)
+    if not patterns:
+        return []
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        driver._request_blocking = block_config
+        logger.info(f"İstek engelleme aktif: {len(patterns)} kalıp")
+    except Exception as e:
+        logger.warning(f"İstek engelleme uygulanamadı: {str(e)}")
+        return []
+    return patterns
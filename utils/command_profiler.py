@@ -0,0 +1,227 @@
+"""
+WebDriver komut sayacı ve gecikme histogramı
+
+Driver'ın execute metoduna tek bir hook takılır; tracing ve profiler bu hook'a
+listener olarak bağlanır. WebElement komutları da parent driver'ın execute'unu
+kullandığı için find_element, execute_script, get_attribute, text vb. hepsi
+sayılır.
+
+Kullanım:
+    driver = create_driver(profile_commands=True)   # ProfiledDriver döner
+    ...
+    driver.profiler.write_json("reports/commands/test_x.json")
+    print(driver.profiler.summary_table())
+"""
+import json
+import os
+import sys
+import time
+import threading
+from collections import defaultdict
+
+
+# Histogram kova üst sınırları (ms); son kova bunların üstü
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+_SKIPPED_PATHS = (
+    os.sep + "selenium" + os.sep,
+    os.path.join("utils", "command_profiler.py"),
+    os.path.join("utils", "tracing.py"),
+)
+
+
+def unwrap_driver(driver):
+    """ProfiledDriver (veya WrapsDriver) ise alttaki gerçek driver'ı döndürür"""
+    return getattr(driver, 'wrapped_driver', driver)
+
+
+def add_command_listener(driver, listener):
+    """Driver'ın execute metoduna listener bağlar
+
+    Hook driver başına bir kez takılır; listener(command, elapsed_seconds)
+    her WebDriver komutundan sonra çağrılır.
+
+    Args:
+        driver: Selenium WebDriver instance'ı (veya ProfiledDriver)
+        listener: Çağrılacak fonksiyon
+    """
+    driver = unwrap_driver(driver)
+    if driver is None:
+        return
+    listeners = getattr(driver, '_command_listeners', None)
+    if listeners is None:
+        listeners = []
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                for callback in listeners:
+                    callback(driver_command, elapsed)
+
+        driver.execute = execute
+        driver._command_listeners = listeners
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def remove_command_listener(driver, listener):
+    """add_command_listener ile bağlanan listener'ı çıkarır"""
+    listeners = getattr(unwrap_driver(driver), '_command_listeners', None)
+    if listeners and listener in listeners:
+        listeners.remove(listener)
+
+
+def _call_site():
+    """Komutu tetikleyen, selenium dışındaki ilk çağrı noktasını döndürür"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(skipped in filename for skipped in _SKIPPED_PATHS):
+            try:
+                filename = os.path.relpath(filename)
+            except ValueError:
+                pass
+            return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class CommandProfiler:
+    """Komut tipine ve çağrı noktasına göre sayım ve gecikme histogramı"""
+
+    def __init__(self, track_call_sites=True):
+        """
+        Args:
+            track_call_sites: False ise çağrı noktası (stack) taraması yapılmaz
+        """
+        self.track_call_sites = track_call_sites
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Tüm sayaçları sıfırlar (örn: her test başında)"""
+        with self._lock:
+            self.total = 0
+            self.total_seconds = 0.0
+            self._commands = defaultdict(lambda: {
+                'count': 0, 'total_s': 0.0, 'max_s': 0.0,
+                'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            })
+            self._call_sites = defaultdict(lambda: defaultdict(int))
+
+    def __call__(self, command, elapsed):
+        site = _call_site() if self.track_call_sites else None
+        elapsed_ms = elapsed * 1000
+        bucket = next((i for i, limit in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= limit),
+                      len(LATENCY_BUCKETS_MS))
+        with self._lock:
+            self.total += 1
+            self.total_seconds += elapsed
+            stats = self._commands[command]
+            stats['count'] += 1
+            stats['total_s'] += elapsed
+            stats['max_s'] = max(stats['max_s'], elapsed)
+            stats['buckets'][bucket] += 1
+            if site is not None:
+                self._call_sites[site][command] += 1
+
+    def attach(self, driver):
+        """Profiler'ı driver'ın execute hook'una bağlar"""
+        add_command_listener(driver, self)
+        return self
+
+    @staticmethod
+    def _bucket_labels():
+        labels = [f"<={limit}ms" for limit in LATENCY_BUCKETS_MS]
+        return labels + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+
+    @staticmethod
+    def _percentile_ms(buckets, fraction):
+        """Histogramdan yaklaşık yüzdelik (kova üst sınırı) döndürür"""
+        target = sum(buckets) * fraction
+        running = 0
+        for limit, count in zip(LATENCY_BUCKETS_MS + (None,), buckets):
+            running += count
+            if running >= target and count:
+                return limit if limit is not None else float('inf')
+        return 0
+
+    def report(self):
+        """Sayım ve histogram raporunu sözlük olarak döndürür"""
+        labels = self._bucket_labels()
+        with self._lock:
+            commands = {
+                command: {
+                    'count': stats['count'],
+                    'total_ms': round(stats['total_s'] * 1000, 2),
+                    'mean_ms': round(stats['total_s'] * 1000 / stats['count'], 2),
+                    'max_ms': round(stats['max_s'] * 1000, 2),
+                    'p50_ms': self._percentile_ms(stats['buckets'], 0.5),
+                    'p95_ms': self._percentile_ms(stats['buckets'], 0.95),
+                    'histogram': {label: n for label, n in zip(labels, stats['buckets']) if n},
+                }
+                for command, stats in sorted(self._commands.items(), key=lambda item: -item[1]['count'])
+            }
+            call_sites = {
+                site: dict(counts)
+                for site, counts in sorted(self._call_sites.items(), key=lambda item: -sum(item[1].values()))
+            }
+            return {
+                'total_commands': self.total,
+                'total_ms': round(self.total_seconds * 1000, 2),
+                'commands': commands,
+                'call_sites': call_sites,
+            }
+
+    def write_json(self, path):
+        """Raporu JSON dosyasına yazar ve yolu döndürür"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        return path
+
+    def summary_table(self, top_sites=10):
+        """Komut ve en yoğun çağrı noktası tablosunu metin olarak döndürür"""
+        report = self.report()
+        header = f"{'Komut':<32} {'Adet':>7} {'Toplam(ms)':>11} {'Ort(ms)':>9} {'p95(ms)':>9} {'Max(ms)':>9}"
+        lines = [header, "-" * len(header)]
+        for command, stats in report['commands'].items():
+            lines.append(f"{command[:32]:<32} {stats['count']:>7} {stats['total_ms']:>11.1f} "
+                         f"{stats['mean_ms']:>9.2f} {stats['p95_ms']:>9} {stats['max_ms']:>9.1f}")
+        lines.append(f"{'TOPLAM':<32} {report['total_commands']:>7} {report['total_ms']:>11.1f}")
+
+        if report['call_sites']:
+            lines.append("")
+            lines.append("En çok komut gönderen çağrı noktaları:")
+            for site, counts in list(report['call_sites'].items())[:top_sites]:
+                lines.append(f"   {sum(counts.values()):>6}  {site}")
+        return "\n".join(lines)
+
+
+class ProfiledDriver:
+    """Gerçek driver'ı saran ve tüm komutları CommandProfiler'a sayan proxy
+
+    Öznitelik erişimleri gerçek driver'a devredilir; sayım execute hook'u
+    üzerinden yapıldığı için WebElement komutları da dahildir.
+    """
+
+    def __init__(self, driver, profiler=None):
+        object.__setattr__(self, '_driver', driver)
+        object.__setattr__(self, 'profiler', (profiler or CommandProfiler()).attach(driver))
+
+    @property
+    def wrapped_driver(self):
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._driver, name, value)
+
+    def __repr__(self):
+        return f"<ProfiledDriver {self._driver!r}>"
@@ -2,12 +2,150 @@
 Test verilerini CSV dosyalarına kaydetmek için yardımcı sınıf
 """
 import csv
+import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 from utils.logger import logger
 
 
+FSYNC_POLICIES = ("never", "flush", "close")
+
+
+class BufferedCSVWriter:
+    """Şeması bir kez belirlenen, tamponlu ve thread-safe uzun ömürlü CSV yazıcı
+
+    Dosya bir kez açılır; satırlar bellekte toplanır ve tampon dolduğunda veya
+    flush_interval saniye geçtiğinde (arka plan thread'i ile, üretici boştayken de)
+    tek seferde yazılır. fsync politikası:
+        "never": işletim sistemine bırak, "flush": her flush'ta, "close": kapanışta
+    Mevcut dosyaya eklerken başlık şemayla aynı olmalıdır.
+    """
+
+    def __init__(self, filepath: str, fieldnames: List[str], buffer_rows: int = 500, flush_interval: float = 5.0,
+                 fsync: str = "close", append: bool = True, extrasaction: str = 'ignore'):
+        """Dosyayı açar ve gerekirse başlığı yazar
+
+        Args:
+            filepath: CSV dosyasının tam yolu
+            fieldnames: Sabit kolon listesi (eksik alanlar boş yazılır)
+            buffer_rows: Bu kadar satır birikince flush
+            flush_interval: Saniye; 0/None ise sadece boyut ve close ile flush
+            fsync: "never", "flush" veya "close"
+            append: True ise mevcut dosyaya ekler, False ise üzerine yazar
+            extrasaction: Şemada olmayan alanlar için 'ignore' veya 'raise'
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Geçersiz fsync politikası: {fsync} ({', '.join(FSYNC_POLICIES)})")
+        self.filepath = filepath
+        self.fieldnames = list(fieldnames)
+        self.buffer_rows = buffer_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.rows_written = 0
+        self.flushes = 0
+
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        existing_header = self._existing_header(filepath) if append else None
+        if existing_header is not None and existing_header != self.fieldnames:
+            raise ValueError(f"CSV şeması uyuşmuyor: {filepath} başlığı {existing_header}, beklenen {self.fieldnames}")
+
+        self._extrasaction = extrasaction
+        self._field_set = set(self.fieldnames)
+        self._file = open(filepath, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if existing_header is None:
+            self._writer.writerow(self.fieldnames)
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="csv-flusher", daemon=True)
+            self._flusher.start()
+
+    @staticmethod
+    def _existing_header(filepath):
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return None
+        with open(filepath, 'r', newline='', encoding='utf-8') as f:
+            return next(csv.reader(f), None)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+
+    def _flush_locked(self, fsync=None):
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+        self._file.flush()
+        if fsync is None:
+            fsync = self.fsync == "flush"
+        if fsync:
+            os.fsync(self._file.fileno())
+        self._last_flush = time.monotonic()
+        self.flushes += 1
+
+    def write(self, row: Dict):
+        """Tek satırı tampona ekler (gerekirse flush eder)"""
+        self.write_rows([row])
+
+    def _values(self, row):
+        if self._extrasaction == 'raise':
+            extras = row.keys() - self._field_set
+            if extras:
+                raise ValueError(f"Şemada olmayan alan(lar): {', '.join(sorted(map(str, extras)))}")
+        return [row.get(field, '') for field in self.fieldnames]
+
+    def write_rows(self, rows: Iterable[Dict]):
+        """Satırları tampona ekler; tampon dolduysa veya süre geçtiyse flush eder
+
+        Değerler eklenirken kopyalanır, çağıran sözlükleri sonradan değiştirebilir.
+        """
+        values = [self._values(row) for row in rows]
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError(f"Kapalı CSV yazıcısına yazılamaz: {self.filepath}")
+            self._buffer.extend(values)
+            if len(self._buffer) >= self.buffer_rows or (
+                    self.flush_interval and time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self, fsync: bool = None):
+        """Tampondaki satırları yazar
+
+        Args:
+            fsync: True/False ile politikayı bu çağrı için geçersiz kılar
+        """
+        with self._lock:
+            self._flush_locked(fsync)
+
+    def close(self):
+        """Kalan satırları yazar, politikaya göre fsync eder ve dosyayı kapatır"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            self._flush_locked(self.fsync in ("flush", "close"))
+            self._file.close()
+        logger.info(f"CSV yazıcı kapatıldı: {self.filepath} ({self.rows_written} satır, {self.flushes} flush)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class CSVHelper:
     """CSV işlemleri için yardımcı sınıf"""
     
@@ -22,12 +160,13 @@ class CSVHelper:
         logger.info(f"CSV output directory: {self.output_dir.absolute()}")
     
     @staticmethod
-    def save_flight_data(flight_data: List[Dict], filepath: str):
+    def save_flight_data(flight_data: List[Dict], filepath: str, fieldnames: List[str] = None):
         """Uçuş verilerini CSV dosyasına kaydeder (Case 4 için static method)
         
         Args:
             flight_data: Uçuş sözlüklerinin listesi
             filepath: CSV dosyasının kaydedileceği tam yol
+            fieldnames: Sabit sütunlar (verilirse tüm kayıtların anahtar birleşimi hesaplanmaz)
         """
         try:
             import os
@@ -37,13 +176,14 @@ class CSVHelper:
                 print("[WARNING] Kaydedilecek veri yok")
                 return
             
-            fieldnames = set()
-            for flight in flight_data:
-                fieldnames.update(flight.keys())
-            fieldnames = sorted(list(fieldnames))
+            if fieldnames is None:
+                fieldnames = set()
+                for flight in flight_data:
+                    fieldnames.update(flight.keys())
+                fieldnames = sorted(list(fieldnames))
             
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
                 writer.writeheader()
                 writer.writerows(flight_data)
             
@@ -52,6 +192,76 @@ class CSVHelper:
         except Exception as e:
             print(f"[ERROR] CSV kaydetme hatası: {str(e)}")
     
+    @staticmethod
+    def stream_flight_data(flight_iter: Iterable[Dict], filepath: str, fieldnames: List[str] = None,
+                           flush_every: int = 25) -> Iterator[Dict]:
+        """Uçuşları geldikçe CSV'ye yazar ve aynen geri üretir (pass-through generator)
+        
+        ResultsPage.iter_flight_data ile zincirlendiğinde kayıtlar çıkarılırken
+        diske yazılır; tüketici (örn: RunningFlightStats) aynı akışı kullanır.
+        
+        Args:
+            flight_iter: Uçuş sözlükleri üreten iterable
+            filepath: CSV dosyasının tam yolu
+            fieldnames: Sütunlar (varsayılan: ilk kaydın anahtarları, alfabetik)
+            flush_every: Kaç kayıtta bir diske flush edileceği
+            
+        Yields:
+            dict: Yazılan uçuş sözlüğü
+        """
+        import os
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        
+        count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = None
+            for flight in flight_iter:
+                if writer is None:
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames or sorted(flight.keys()),
+                                            extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(flight)
+                count += 1
+                if count % flush_every == 0:
+                    csvfile.flush()
+                yield flight
+        
+        if count:
+            print(f"[OK] {count} uçuş verisi CSV'ye akış halinde kaydedildi: {filepath}")
+        else:
+            print("[WARNING] Kaydedilecek veri yok")
+    
+    @staticmethod
+    def iter_typed_chunks(filepath: str, chunksize: int = 100_000, columns: List[str] = None) -> Iterator:
+        """Büyük CSV'yi sabit boyutlu, tipli DataFrame parçaları olarak okur
+
+        Satırlar sözlüğe çevrilmez; her parça okunur okunmaz DataAnalyzer'ın
+        tipli şemasına normalize edilir, böylece bellek parça boyutuyla sınırlı kalır.
+
+        Args:
+            filepath: CSV dosyasının tam yolu
+            chunksize: Parça başına satır
+            columns: Okunacak ham kolonlar (varsayılan: tümü); dosyada olmayanlar atlanır
+
+        Yields:
+            pd.DataFrame: normalize_flight_frame çıktısı (price Int32, saatler dakika, ...)
+        """
+        import pandas as pd
+        from utils.data_analysis import normalize_flight_frame
+
+        wanted = set(columns) if columns is not None else None
+        reader = pd.read_csv(
+            filepath,
+            chunksize=chunksize,
+            usecols=(lambda column: column in wanted) if wanted is not None else None,
+            dtype={'airline': 'category', 'connection': 'category'},
+            keep_default_na=False,
+            na_values=[""],
+        )
+        with reader:
+            for chunk in reader:
+                yield normalize_flight_frame(chunk)
+
     def save_to_csv(self, data: List[Dict], filename: str, headers: List[str] = None) -> str:
         """Veriyi CSV dosyasına kaydeder
         
@@ -88,6 +298,24 @@ class CSVHelper:
             logger.error(f"Failed to save CSV file: {str(e)}")
             return None
     
+    def open_writer(self, filename: str, headers: List[str], **options) -> BufferedCSVWriter:
+        """Çıktı dizininde uzun ömürlü, tamponlu bir CSV yazıcı açar
+        
+        Tekrarlanan append_to_csv çağrıları yerine (her çağrıda dosya açma ve
+        başlık türetme) uzun taramalarda kullanılır.
+        
+        Args:
+            filename: CSV dosya adı (uzantı olmadan)
+            headers: Sabit sütun başlıkları
+            **options: BufferedCSVWriter seçenekleri (buffer_rows, flush_interval, fsync, append)
+            
+        Returns:
+            BufferedCSVWriter: Yazıcı (kapatılmalı veya with ile kullanılmalı)
+        """
+        if not filename.endswith('.csv'):
+            filename = f"{filename}.csv"
+        return BufferedCSVWriter(str(self.output_dir / filename), headers, **options)
+    
     def append_to_csv(self, data: List[Dict], filename: str, headers: List[str] = None) -> str:
         """Mevcut CSV dosyasına veri ekler veya yeni dosya oluşturur
         
@@ -6,72 +6,573 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import os
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Iterable, Iterator
 from utils.logger import logger
 from utils.csv_helper import CSVHelper
+from utils.quantile_sketch import KLLSketch
+
+
+DAY_PARTS = ['Gece (00-05)', 'Sabah (06-11)', 'Öğle (12-17)', 'Akşam (18-23)']
+MINUTES_PER_DAY_PART = 6 * 60
+MINUTES_PER_DAY = 24 * 60
+
+
+def parse_clock_minutes(values) -> pd.Series:
+    """"HH:MM" saat metinlerini vektörel olarak gün içi dakikaya çevirir
+    
+    Args:
+        values: Saat metinleri (Series veya liste)
+        
+    Returns:
+        pd.Series: Gün içi dakika (float); "N/A", boş veya geçersiz saatler NaN
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    parts = series.astype(str).str.extract(r'^\s*(\d{1,2})\s*:\s*(\d{0,2})')
+    hours = pd.to_numeric(parts[0], errors='coerce')
+    minutes = pd.to_numeric(parts[1], errors='coerce').fillna(0)
+    return (hours * 60 + minutes).where((hours <= 23) & (minutes <= 59))
+
+
+def parse_duration_minutes(values) -> pd.Series:
+    """"1s 15dk" biçimindeki süreleri vektörel olarak dakikaya çevirir
+    
+    Args:
+        values: Süre metinleri (Series veya liste)
+        
+    Returns:
+        pd.Series: Toplam dakika (float); "N/A" veya ayrıştırılamayan süreler NaN
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    parts = series.astype(str).str.extract(
+        r'^\s*(?:(\d+)\s*(?:saat|sa|s|h))?\s*(?:(\d+)\s*(?:dakika|dk|d|min|m))?', flags=re.IGNORECASE
+    )
+    hours = pd.to_numeric(parts[0], errors='coerce')
+    minutes = pd.to_numeric(parts[1], errors='coerce')
+    return (hours.fillna(0) * 60 + minutes.fillna(0)).where(hours.notna() | minutes.notna())
+
+
+def format_clock_minutes(minutes: pd.Series) -> pd.Series:
+    """Gün içi dakikayı "HH:MM" metnine çevirir (eksikler "N/A")"""
+    valid = minutes.notna()
+    filled = minutes.fillna(0).astype('int64')
+    clock = (filled // 60).astype(str).str.zfill(2) + ":" + (filled % 60).astype(str).str.zfill(2)
+    return clock.where(valid, "N/A")
+
+
+def format_duration_minutes(minutes: pd.Series) -> pd.Series:
+    """Dakikayı sitedeki "1s 15dk" gösterimine çevirir (eksikler "N/A")"""
+    valid = minutes.notna()
+    filled = minutes.fillna(0).astype('int64')
+    duration = (filled // 60).astype(str) + "s " + (filled % 60).astype(str) + "dk"
+    return duration.where(valid, "N/A")
+
+
+# Ham kolon -> (tipli kolon, dtype, ayrıştırıcı); ayrıştırıcı None ise doğrudan dönüştürülür
+FLIGHT_SCHEMA = {
+    'departure_time': ('departure_minutes', 'Int16', parse_clock_minutes),
+    'arrival_time': ('arrival_minutes', 'Int16', parse_clock_minutes),
+    'duration': ('duration_minutes', 'Int16', parse_duration_minutes),
+    'price': ('price', 'Int32', lambda values: pd.to_numeric(values, errors='coerce').round()),
+    'flight_index': ('flight_index', 'Int32', lambda values: pd.to_numeric(values, errors='coerce')),
+    'airline': ('airline', 'category', None),
+    'connection': ('connection', 'category', None),
+}
+
+# Tipli kolon -> gösterim kolonu biçimlendiricisi
+DISPLAY_FORMATTERS = {
+    'departure_minutes': ('departure_time', format_clock_minutes),
+    'arrival_minutes': ('arrival_time', format_clock_minutes),
+    'duration_minutes': ('duration', format_duration_minutes),
+}
+
+
+# Analiz / grafik -> ihtiyaç duyduğu ham kolonlar (kolonsal okumada sadece bunlar yüklenir)
+CHART_COLUMNS = {
+    'airline_stats': ['airline', 'price', 'connection'],
+    'airline_comparison': ['airline', 'price', 'connection'],
+    'heatmap': ['departure_time', 'price'],
+    'price_distribution': ['price'],
+    'cost_effective': ['departure_time', 'arrival_time', 'airline', 'price', 'connection', 'duration', 'flight_index'],
+}
+
+
+# Parça parça agregasyonda okunan ham kolonlar
+AGGREGATE_COLUMNS = ['airline', 'price', 'connection', 'departure_time']
+
+
+def normalize_flight_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Ham uçuş DataFrame'ini tek geçişte tipli şemaya çevirir
+    
+    Fiyat Int32, saatler gece yarısından itibaren dakika (Int16), süre dakika (Int16),
+    havayolu ve bağlantı category olur; eksik/geçersiz değerler <NA>. Şemada olmayan
+    kolonlar olduğu gibi korunur, kolon sırası değişmez.
+    
+    Args:
+        frame: extract_all_flight_data / CSV şemasında DataFrame
+        
+    Returns:
+        pd.DataFrame: Tipli yeni DataFrame (girdi değiştirilmez)
+    """
+    columns = {}
+    for column in frame.columns:
+        if column not in FLIGHT_SCHEMA:
+            columns[column] = frame[column]
+            continue
+        name, dtype, parser = FLIGHT_SCHEMA[column]
+        values = frame[column] if parser is None else parser(frame[column])
+        columns[name] = values.astype(dtype)
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def flight_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Tipli DataFrame'i extract_all_flight_data ile aynı gösterimde sözlüklere çevirir
+    
+    Args:
+        frame: normalize_flight_frame çıktısı (veya alt kümesi)
+        
+    Returns:
+        list: "HH:MM" saatli, "1s 15dk" süreli, int/None fiyatlı uçuş sözlükleri
+    """
+    columns = {}
+    for column in frame.columns:
+        values = frame[column]
+        if column in DISPLAY_FORMATTERS:
+            name, formatter = DISPLAY_FORMATTERS[column]
+            columns[name] = formatter(values)
+        else:
+            values = values.astype(object)
+            columns[column] = values.where(values.notna(), None)
+    return pd.DataFrame(columns, index=frame.index).to_dict('records')
+
+
+def _slot_labels(bin_minutes: int) -> List[str]:
+    """Isı haritası kolon etiketleri; bin_minutes 360'ı tam bölmüyorsa ValueError"""
+    if bin_minutes <= 0 or MINUTES_PER_DAY_PART % bin_minutes:
+        raise ValueError(f"bin_minutes 360'ı tam bölmeli: {bin_minutes}")
+    return [f"+{start // 60}:{start % 60:02d}" for start in range(0, MINUTES_PER_DAY_PART, bin_minutes)]
+
+
+def _weighted_quantile(values: np.ndarray, counts: np.ndarray, q: float) -> float:
+    """Sıralı değer/adet çiftlerinden pandas'ın lineer interpolasyonlu quantile'ı"""
+    n = int(counts.sum())
+    cumulative = np.cumsum(counts)
+    position = (n - 1) * q
+    lower = int(np.floor(position))
+    low = values[np.searchsorted(cumulative, lower, side='right')]
+    high = values[np.searchsorted(cumulative, min(lower + 1, n - 1), side='right')]
+    return float(low + (position - lower) * (high - low))
+
+
+class RunningFlightStats:
+    """Uçuş akışı üzerinde kayıt kayıt güncellenen fiyat istatistikleri
+
+    Tüm veri belleğe alınmadan calculate_airline_price_stats ile aynı
+    anahtarlarla sonuç verir; ortalama ve standart sapma Welford yöntemiyle,
+    medyan/p10/p90 havayolu başına KLL sketch'iyle hesaplanır (yaklaşık
+    sketch_k fiyata kadar birebir, sonrasında yaklaşık).
+    """
+
+    def __init__(self, sketch_k: int = 200):
+        self.records = 0
+        self.sketch_k = sketch_k
+        self.has_connection = False
+        self._airlines = {}
+        self._overall = self._empty()
+        self.sketch = self._overall['sketch']
+
+    def _empty(self):
+        return {'count': 0, 'min': float('inf'), 'max': float('-inf'), 'mean': 0.0, 'm2': 0.0,
+                'direct': 0, 'sketch': KLLSketch(self.sketch_k)}
+
+    @staticmethod
+    def _add(stats, price):
+        stats['count'] += 1
+        stats['min'] = min(stats['min'], price)
+        stats['max'] = max(stats['max'], price)
+        delta = price - stats['mean']
+        stats['mean'] += delta / stats['count']
+        stats['m2'] += delta * (price - stats['mean'])
+
+    def update(self, flight: Dict[str, Any]):
+        """Tek bir uçuş kaydını istatistiklere ekler"""
+        self.records += 1
+        try:
+            price = float(flight.get('price'))
+        except (TypeError, ValueError):
+            return
+        if np.isnan(price):
+            return
+        self._add(self._overall, price)
+        self.sketch.update(price)
+        if 'connection' in flight:
+            self.has_connection = True
+        airline = flight.get('airline')
+        if airline and airline != "Unknown":
+            stats = self._airlines.get(airline)
+            if stats is None:
+                stats = self._airlines[airline] = self._empty()
+            self._add(stats, price)
+            stats['sketch'].update(price)
+            stats['direct'] += flight.get('connection') == "Direct"
+
+    def observe(self, flight_iter: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Akıştaki her kaydı istatistiklere ekleyip aynen geri üretir (pass-through)"""
+        for flight in flight_iter:
+            self.update(flight)
+            yield flight
+
+    def price_quantile(self, q: float):
+        """Şimdiye kadarki fiyatların q quantile'ı (KLL sketch; veri yoksa None)"""
+        return self.sketch.quantile(q)
+
+    def airline_price_stats(self) -> Dict[str, Dict[str, float]]:
+        """calculate_airline_price_stats ile aynı biçimde havayolu istatistikleri
+
+        Returns:
+            dict: Havayolu adı -> {min, max, avg, count, median, p10, p90, std, direct_share}
+                  (hiçbir kayıtta connection yoksa direct_share None)
+        """
+        return {
+            airline: {
+                "min": stats['min'],
+                "max": stats['max'],
+                "avg": stats['mean'],
+                "count": stats['count'],
+                "median": stats['sketch'].quantile(0.5),
+                "p10": stats['sketch'].quantile(0.1),
+                "p90": stats['sketch'].quantile(0.9),
+                "std": (stats['m2'] / (stats['count'] - 1)) ** 0.5 if stats['count'] > 1 else 0.0,
+                "direct_share": stats['direct'] / stats['count'] if self.has_connection else None,
+            }
+            for airline, stats in self._airlines.items()
+        }
+
+    def summary(self) -> Dict[str, float]:
+        """Tüm fiyatlar için count, min, max, avg, std"""
+        stats = self._overall
+        if not stats['count']:
+            return {'records': self.records, 'count': 0}
+        return {
+            'records': self.records,
+            'count': stats['count'],
+            'min': stats['min'],
+            'max': stats['max'],
+            'avg': stats['mean'],
+            'std': (stats['m2'] / (stats['count'] - 1)) ** 0.5 if stats['count'] > 1 else 0.0,
+        }
+
+
+class FlightAggregates:
+    """Parça (chunk) başına hesaplanıp toplanarak birleştirilen uçuş agregaları
+
+    Fiyatlar tam sayı olduğu için (havayolu, fiyat) -> adet sayımları saklanır;
+    böylece min/max/ortalama/std ve medyan/p10/p90 DataAnalyzer ile birebir aynı
+    çıkar ve bellek satır sayısına değil farklı fiyat sayısına bağlı kalır.
+    Kalkış saatleri dakika başına toplam/adet olarak tutulur, her dilim genişliği
+    sonradan üretilebilir.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.has_connection = False
+        self._airline_order = []
+        self._airline_prices = None
+        self._airline_direct = None
+        self._price_counts = None
+        self._minute_sums = np.zeros(MINUTES_PER_DAY)
+        self._minute_counts = np.zeros(MINUTES_PER_DAY, dtype=np.int64)
+
+    @staticmethod
+    def _add(total, part):
+        return part if total is None else total.add(part, fill_value=0)
+
+    def _remember_airlines(self, airlines):
+        for airline in airlines:
+            if airline not in self._airline_order:
+                self._airline_order.append(airline)
+
+    def update(self, chunk: pd.DataFrame):
+        """Tipli bir parçanın (normalize_flight_frame çıktısı) kısmi agregalarını ekler
+        
+        Returns:
+            FlightAggregates: self (zincirleme için)
+        """
+        self.rows += len(chunk)
+        if chunk.empty or 'price' not in chunk.columns:
+            return self
+
+        prices = chunk['price'].astype('float64')
+        priced = prices.notna()
+        self._price_counts = self._add(self._price_counts, prices[priced].value_counts())
+
+        if 'airline' in chunk.columns:
+            airlines = chunk['airline']
+            valid = priced & airlines.notna() & (airlines != "Unknown")
+            if valid.any():
+                frame = pd.DataFrame({'airline': airlines[valid].astype(object), 'price': prices[valid]})
+                self._remember_airlines(frame['airline'].unique())
+                self._airline_prices = self._add(self._airline_prices, frame.groupby(['airline', 'price']).size())
+                if 'connection' in chunk.columns:
+                    self.has_connection = True
+                    direct = (chunk.loc[valid, 'connection'] == "Direct").groupby(frame['airline']).sum()
+                    self._airline_direct = self._add(self._airline_direct, direct)
+
+        if 'departure_minutes' in chunk.columns:
+            minutes = chunk['departure_minutes'].to_numpy(dtype='float64', na_value=np.nan)
+            valid = ~np.isnan(minutes) & priced.to_numpy()
+            slots = minutes[valid].astype(np.int64)
+            self._minute_sums += np.bincount(slots, weights=prices.to_numpy()[valid], minlength=MINUTES_PER_DAY)
+            self._minute_counts += np.bincount(slots, minlength=MINUTES_PER_DAY)
+        return self
+
+    def merge(self, other: "FlightAggregates"):
+        """Başka bir parçanın/worker'ın agregalarını birleştirir
+        
+        Returns:
+            FlightAggregates: self
+        """
+        self.rows += other.rows
+        self.has_connection = self.has_connection or other.has_connection
+        self._remember_airlines(other._airline_order)
+        for name in ('_airline_prices', '_airline_direct', '_price_counts'):
+            if getattr(other, name) is not None:
+                setattr(self, name, self._add(getattr(self, name), getattr(other, name)))
+        self._minute_sums += other._minute_sums
+        self._minute_counts += other._minute_counts
+        return self
+
+    def airline_price_stats(self) -> Dict[str, Dict[str, float]]:
+        """DataAnalyzer.calculate_airline_price_stats ile aynı biçimde havayolu istatistikleri"""
+        if self._airline_prices is None:
+            return {}
+        airline_stats = {}
+        for airline in self._airline_order:
+            series = self._airline_prices.xs(airline, level='airline').sort_index()
+            values = series.index.to_numpy(dtype='float64')
+            counts = series.to_numpy().astype(np.int64)
+            n = int(counts.sum())
+            mean = float((values * counts).sum() / n)
+            std = float(np.sqrt(((values - mean) ** 2 * counts).sum() / (n - 1))) if n > 1 else 0.0
+            direct_share = None
+            if self.has_connection:
+                direct_share = float(self._airline_direct.get(airline, 0)) / n
+            airline_stats[airline] = {
+                "min": float(values[0]),
+                "max": float(values[-1]),
+                "avg": mean,
+                "count": n,
+                "median": _weighted_quantile(values, counts, 0.5),
+                "p10": _weighted_quantile(values, counts, 0.1),
+                "p90": _weighted_quantile(values, counts, 0.9),
+                "std": std,
+                "direct_share": direct_share,
+            }
+        return airline_stats
+
+    def price_counts(self):
+        """Tüm geçerli fiyatlar için (sıralı değerler, adetler) - histogram ağırlıkları"""
+        if self._price_counts is None or self._price_counts.empty:
+            return np.array([]), np.array([], dtype=np.int64)
+        series = self._price_counts.sort_index()
+        return series.index.to_numpy(dtype='float64'), series.to_numpy().astype(np.int64)
+
+    def price_quantile(self, q: float):
+        """Tüm geçerli fiyatların tam quantile'ı (veri yoksa None)"""
+        values, counts = self.price_counts()
+        return _weighted_quantile(values, counts, q) if len(values) else None
+
+    def hourly_price_matrix(self, bin_minutes: int = 60):
+        """DataAnalyzer.hourly_price_matrix ile aynı matris, dakika toplamlarından"""
+        labels = _slot_labels(bin_minutes)
+        if not self._minute_counts.any():
+            return None, labels
+        sums = self._minute_sums.reshape(-1, bin_minutes).sum(axis=1)
+        counts = self._minute_counts.reshape(-1, bin_minutes).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        return means.reshape(len(DAY_PARTS), len(labels)), labels
 
 
 class DataAnalyzer:
     """Uçuş verileri için gelişmiş analiz ve görselleştirme sınıfı"""
 
     def __init__(self, flight_data: List[Dict[str, Any]]):
-        """Uçuş verisi ile başlatır
+        """Uçuş verisi ile başlatır; veri bir kez tipli şemaya normalize edilir
         
         Args:
             flight_data: Uçuş bilgilerini içeren sözlük listesi
         """
         self.flight_data = flight_data
-        self.df = pd.DataFrame(flight_data) if flight_data else pd.DataFrame()
+        self.df = normalize_flight_frame(pd.DataFrame(flight_data)) if flight_data else pd.DataFrame()
+        self.aggregates = None
+        self.source_csv = None
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame):
+        """Hazır bir DataFrame'den (örn: büyük geçmiş dosyası) analyzer oluşturur
+        
+        Args:
+            frame: extract_all_flight_data / CSV şemasında DataFrame
+            
+        Returns:
+            DataAnalyzer: Tipli df'li analyzer (flight_data boş liste)
+        """
+        analyzer = cls([])
+        analyzer.df = normalize_flight_frame(frame) if not frame.empty else pd.DataFrame()
+        return analyzer
+
+    @classmethod
+    def from_parquet(cls, filepath: str, chart: str = None, columns: List[str] = None, filters=None):
+        """Parquet dosyasından sadece gereken kolonlarla analyzer oluşturur
+        
+        Args:
+            filepath: ParquetHelper ile yazılmış dosya
+            chart: CHART_COLUMNS anahtarı (örn: "heatmap"); verilirse sadece o analizin kolonları okunur
+            columns: Okunacak kolonlar (chart yerine açıkça)
+            filters: Predicate pushdown filtreleri, örn: [('route', '=', 'İstanbul-Ankara')]
+            
+        Returns:
+            DataAnalyzer: Tipli df'li analyzer
+        """
+        from utils.parquet_helper import ParquetHelper
+        if chart is not None:
+            columns = CHART_COLUMNS[chart]
+        return cls.from_frame(ParquetHelper.read_frame(filepath, columns=columns, filters=filters))
+
+    @classmethod
+    def from_csv_chunks(cls, filepath: str, chunksize: int = 100_000):
+        """Büyük CSV'yi parça parça okuyup sadece birleştirilebilir agregaları tutan analyzer
+        
+        Satırlar bellekte tutulmaz; istatistik, ısı haritası ve histogram
+        FlightAggregates'ten, en uygun uçuşlar CSV'nin ikinci bir taramasıyla üretilir.
+        
+        Args:
+            filepath: Uçuş CSV'si (save_flight_data / sweep çıktısı)
+            chunksize: Parça başına satır
+            
+        Returns:
+            DataAnalyzer: aggregates özniteliği dolu, df'i boş analyzer
+        """
+        aggregates = FlightAggregates()
+        for chunk in CSVHelper.iter_typed_chunks(filepath, chunksize, columns=AGGREGATE_COLUMNS):
+            aggregates.update(chunk)
+        analyzer = cls([])
+        analyzer.aggregates = aggregates
+        analyzer.source_csv = (filepath, chunksize)
+        logger.info(f"CSV parça parça analiz edildi: {filepath} ({aggregates.rows} satır)")
+        return analyzer
+
+    @classmethod
+    def from_iterable(cls, flight_iter: Iterable[Dict[str, Any]], running_stats: RunningFlightStats = None):
+        """Akıştan analyzer oluşturur; kayıtlar gelirken running istatistikler güncellenir
+        
+        Args:
+            flight_iter: Uçuş sözlükleri üreten iterable (örn: ResultsPage.iter_flight_data)
+            running_stats: Güncellenecek RunningFlightStats (varsayılan: yeni örnek)
+            
+        Returns:
+            DataAnalyzer: running_stats özniteliği dolu analyzer
+        """
+        running_stats = running_stats or RunningFlightStats()
+        analyzer = cls(list(running_stats.observe(flight_iter)))
+        analyzer.running_stats = running_stats
+        return analyzer
 
     def calculate_airline_price_stats(self) -> Dict[str, Dict[str, float]]:
-        """Havayolu başına fiyat istatistiklerini hesaplar (Min, Max, Ortalama)
+        """Havayolu başına fiyat istatistiklerini tek groupby geçişinde hesaplar
+        
+        Geçersiz fiyatlı, "Unknown" veya boş havayolu satırları elenir. Havayolları ilk görüldükleri sırada döner.
         
         Returns:
-            dict: Havayolu adı -> {min, max, avg, count} sözlüğü
+            dict: Havayolu adı -> {min, max, avg, count, median, p10, p90, std, direct_share} sözlüğü
+                  (std tek fiyatta 0; direct_share fiyatlı uçuşlar içinde direkt oranı,
+                  connection kolonu yoksa None)
         """
+        if self.aggregates is not None:
+            return self.aggregates.airline_price_stats()
         if self.df.empty or 'airline' not in self.df.columns or 'price' not in self.df.columns:
             return {}
 
-        airline_stats = {}
-        for airline in self.df['airline'].unique():
-            if airline == "Unknown" or pd.isna(airline):
-                continue
-                
-            airline_data = self.df[self.df['airline'] == airline]
-            prices = airline_data['price'].dropna()
-            prices = prices[prices.notna()]
-            
-            if not prices.empty and len(prices) > 0:
-                prices = pd.to_numeric(prices, errors='coerce').dropna()
-                
-                if len(prices) > 0:
-                    airline_stats[airline] = {
-                        "min": float(prices.min()),
-                        "max": float(prices.max()),
-                        "avg": float(prices.mean()),
-                        "count": len(prices)
-                    }
+        prices = self.df['price'].astype('float64')
+        airlines = self.df['airline']
+        valid = prices.notna() & airlines.notna() & (airlines != "Unknown")
+        if not valid.any():
+            return {}
 
-        return airline_stats
+        frame = pd.DataFrame({'airline': airlines[valid], 'price': prices[valid]})
+        has_connection = 'connection' in self.df.columns
+        if has_connection:
+            frame['direct'] = (self.df.loc[valid, 'connection'] == "Direct").astype('float64')
 
-    def find_cost_effective_flights(self) -> List[Dict[str, Any]]:
-        """En uygun maliyetli uçuşları bulur (en düşük %30 fiyat aralığı)
+        grouped = frame.groupby('airline', sort=False, observed=True)
+        summary = grouped['price'].agg(['min', 'max', 'mean', 'count', 'median', 'std'])
+        quantiles = grouped['price'].quantile([0.1, 0.9]).unstack()
+        summary['p10'] = quantiles[0.1]
+        summary['p90'] = quantiles[0.9]
+        summary['std'] = summary['std'].fillna(0.0)
+        summary['direct_share'] = grouped['direct'].mean() if has_connection else np.nan
+        summary = summary.reindex(list(frame['airline'].unique()))
+
+        return {
+            airline: {
+                "min": float(row['min']),
+                "max": float(row['max']),
+                "avg": float(row['mean']),
+                "count": int(row['count']),
+                "median": float(row['median']),
+                "p10": float(row['p10']),
+                "p90": float(row['p90']),
+                "std": float(row['std']),
+                "direct_share": None if pd.isna(row['direct_share']) else float(row['direct_share']),
+            }
+            for airline, row in summary.iterrows()
+        }
+
+    def find_cost_effective_flights(self, quantile: float = 0.30, sketch: KLLSketch = None) -> List[Dict[str, Any]]:
+        """En uygun maliyetli uçuşları bulur (varsayılan: en düşük %30 fiyat aralığı)
+        
+        Args:
+            quantile: Eşik quantile'ı
+            sketch: Verilirse eşik bu KLLSketch'ten alınır (örn: rotalar arası, akış
+                    halinde güncellenen sketch); fiyat kolonu yeniden sıralanmaz
         
         Returns:
             list: En uygun maliyetli uçuşların listesi
         """
+        threshold = sketch.quantile(quantile) if sketch is not None and sketch.count else None
+        if self.aggregates is not None:
+            return self._cost_effective_from_csv(quantile, threshold)
         if self.df.empty or 'price' not in self.df.columns:
             return []
 
-        prices = pd.to_numeric(self.df['price'], errors='coerce').dropna()
-        if prices.empty:
+        prices = self.df['price'].astype('float64')
+        if prices.isna().all():
             return []
 
-        threshold = prices.quantile(0.30)
-        cost_effective_df = self.df[pd.to_numeric(self.df['price'], errors='coerce') <= threshold]
-        cost_effective_df = cost_effective_df.sort_values(by='price', ascending=True)
+        if threshold is None:
+            threshold = prices.quantile(quantile)
+        cost_effective_df = self.df[(prices <= threshold).to_numpy()]
+        cost_effective_df = cost_effective_df.sort_values(by='price', ascending=True, kind='stable')
         
-        return cost_effective_df.to_dict('records')
+        return flight_records(cost_effective_df)
+
+    def _cost_effective_from_csv(self, quantile: float, threshold: float = None) -> List[Dict[str, Any]]:
+        """Eşik agregalardan (veya verilen sketch'ten), satırlar CSV'nin ikinci taramasından"""
+        if threshold is None:
+            threshold = self.aggregates.price_quantile(quantile)
+        if threshold is None or self.source_csv is None:
+            return []
+        filepath, chunksize = self.source_csv
+        selected = [
+            chunk[(chunk['price'].astype('float64') <= threshold).to_numpy()]
+            for chunk in CSVHelper.iter_typed_chunks(filepath, chunksize)
+            if 'price' in chunk.columns
+        ]
+        if not selected:
+            return []
+        cost_effective_df = pd.concat(selected).sort_values(by='price', ascending=True, kind='stable')
+        return flight_records(cost_effective_df)
 
     def create_price_distribution_chart(self, filename: str):
         """Fiyat dağılım histogram grafiği oluşturur
@@ -80,23 +581,25 @@ class DataAnalyzer:
             filename: Grafik dosyasının kaydedileceği yol
         """
         try:
-            if self.df.empty or 'price' not in self.df.columns:
-                print("[WARNING] Fiyat verisi bulunamadı, grafik oluşturulamadı")
-                return
-
-            prices = pd.to_numeric(self.df['price'], errors='coerce').dropna()
-            if prices.empty:
+            if self.aggregates is not None:
+                prices, weights = self.aggregates.price_counts()
+            else:
+                if self.df.empty or 'price' not in self.df.columns:
+                    print("[WARNING] Fiyat verisi bulunamadı, grafik oluşturulamadı")
+                    return
+                prices, weights = self.df['price'].astype('float64').dropna().to_numpy(), None
+            if not len(prices):
                 print("[WARNING] Geçerli fiyat verisi yok")
                 return
 
             plt.figure(figsize=(10, 6))
-            plt.hist(prices, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
+            plt.hist(prices, bins=20, weights=weights, alpha=0.7, color='skyblue', edgecolor='black')
             plt.title('Uçuş Fiyat Dağılımı', fontsize=16, fontweight='bold')
             plt.xlabel('Fiyat (TL)', fontsize=12)
             plt.ylabel('Uçuş Sayısı', fontsize=12)
             plt.grid(True, alpha=0.3)
             
-            stats_text = f'Min: {prices.min():.0f}TL\nMax: {prices.max():.0f}TL\nOrtalama: {prices.mean():.0f}TL'
+            stats_text = f'Min: {prices.min():.0f}TL\nMax: {prices.max():.0f}TL\nOrtalama: {np.average(prices, weights=weights):.0f}TL'
             plt.text(0.7, 0.8, stats_text, transform=plt.gca().transAxes, 
                     bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
             
@@ -150,69 +653,71 @@ class DataAnalyzer:
         except Exception as e:
             print(f"[WARNING] Grafik oluşturma hatası: {str(e)}")
 
-    def create_time_price_heatmap(self, filename: str):
+    def hourly_price_matrix(self, bin_minutes: int = 60):
+        """Kalkış saatine göre ortalama fiyat matrisini tek bincount geçişinde hesaplar
+        
+        Satırlar 6 saatlik gün bölümleri, kolonlar gün bölümü içindeki zaman dilimleridir.
+        self.df değiştirilmez.
+        
+        Args:
+            bin_minutes: Dilim genişliği (dakika); 360'ı tam bölmeli (örn: 30, 60, 120)
+            
+        Returns:
+            tuple: (4 x (360 / bin_minutes) ortalama fiyat matrisi - veri yoksa NaN,
+                    kolon etiketleri) veya geçerli veri yoksa (None, etiketler)
+        """
+        labels = _slot_labels(bin_minutes)
+        if self.aggregates is not None:
+            return self.aggregates.hourly_price_matrix(bin_minutes)
+        columns = len(labels)
+        if self.df.empty or 'departure_minutes' not in self.df.columns or 'price' not in self.df.columns:
+            return None, labels
+
+        minutes = self.df['departure_minutes'].to_numpy(dtype='float64', na_value=np.nan)
+        prices = self.df['price'].to_numpy(dtype='float64', na_value=np.nan)
+        valid = ~(np.isnan(minutes) | np.isnan(prices))
+        if not valid.any():
+            return None, labels
+
+        bins = (minutes[valid] // bin_minutes).astype(np.int64)
+        size = len(DAY_PARTS) * columns
+        sums = np.bincount(bins, weights=prices[valid], minlength=size)
+        counts = np.bincount(bins, minlength=size)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        return means.reshape(len(DAY_PARTS), columns), labels
+
+    def create_time_price_heatmap(self, filename: str, bin_minutes: int = 60):
         """Saat bazında fiyat ısı haritası oluşturur
         
         Args:
             filename: Grafik dosyasının kaydedileceği yol
+            bin_minutes: Zaman dilimi genişliği (dakika, 360'ı tam bölmeli)
         """
         try:
-            if self.df.empty or 'departure_time' not in self.df.columns or 'price' not in self.df.columns:
+            if self.aggregates is None and (
+                    self.df.empty or 'departure_minutes' not in self.df.columns or 'price' not in self.df.columns):
                 print("[WARNING] Saat ve fiyat verisi bulunamadı, ısı haritası oluşturulamadı")
                 return
 
-            def extract_hour(time_str):
-                """Kalkış saatinden saat bilgisini çıkarır"""
-                try:
-                    if pd.isna(time_str) or time_str == "N/A":
-                        return None
-                    time_str = str(time_str)
-                    if ':' in time_str:
-                        hour_str = time_str.split(':')[0].strip()
-                        hour = int(hour_str)
-                        if 0 <= hour <= 23:
-                            return hour
-                    return None
-                except:
-                    return None
-
-            self.df['hour'] = self.df['departure_time'].apply(extract_hour)
-            self.df['price_numeric'] = pd.to_numeric(self.df['price'], errors='coerce')
-            hourly_data = self.df.dropna(subset=['hour', 'price_numeric'])
-            
-            if hourly_data.empty:
+            price_matrix, slot_ticks = self.hourly_price_matrix(bin_minutes)
+            if price_matrix is None:
                 print("[WARNING] Saat verisi çıkarılamadı veya geçerli fiyat yok")
                 return
 
-            hourly_prices = hourly_data.groupby('hour')['price_numeric'].mean().reset_index()
-            price_matrix = np.zeros((4, 6))
-            
-            for i in range(4):
-                for j in range(6):
-                    hour = i * 6 + j
-                    hour_data = hourly_prices[hourly_prices['hour'] == hour]
-                    if not hour_data.empty:
-                        price_matrix[i, j] = hour_data['price_numeric'].iloc[0]
-                    else:
-                        price_matrix[i, j] = np.nan
-
-            plt.figure(figsize=(14, 8))
+            plt.figure(figsize=(max(14, len(slot_ticks) * 1.2), 8))
             
             mask = np.isnan(price_matrix)
             sns.heatmap(price_matrix, annot=True, fmt='.0f', cmap='YlOrRd', 
                        cbar_kws={'label': 'Ortalama Fiyat (TL)'}, mask=mask,
-                       vmin=price_matrix[~np.isnan(price_matrix)].min() if not np.all(np.isnan(price_matrix)) else 0,
-                       vmax=price_matrix[~np.isnan(price_matrix)].max() if not np.all(np.isnan(price_matrix)) else 1000)
+                       vmin=np.nanmin(price_matrix), vmax=np.nanmax(price_matrix))
             
             plt.title('Saat Bazında Fiyat Dağılımı - Isı Haritası', fontsize=16, fontweight='bold')
-            plt.xlabel('Saat Aralığı', fontsize=12)
+            plt.xlabel(f'Gün Bölümü İçindeki Dilim ({bin_minutes} dk)', fontsize=12)
             plt.ylabel('Gün Bölümü', fontsize=12)
             
-            hour_ticks = [f"{i*6:02d}:00-{(i+1)*6-1:02d}:59" for i in range(6)]
-            day_ticks = ['Gece (00-05)', 'Sabah (06-11)', 'Öğle (12-17)', 'Akşam (18-23)']
-            
-            plt.xticks(np.arange(6) + 0.5, hour_ticks, rotation=45, ha='right')
-            plt.yticks(np.arange(4) + 0.5, day_ticks)
+            plt.xticks(np.arange(len(slot_ticks)) + 0.5, slot_ticks, rotation=45, ha='right')
+            plt.yticks(np.arange(len(DAY_PARTS)) + 0.5, DAY_PARTS)
             
             plt.tight_layout()
             plt.savefig(filename, dpi=300, bbox_inches='tight')
@@ -223,4 +728,3 @@ class DataAnalyzer:
             print(f"[WARNING] Isı haritası oluşturma hatası: {str(e)}")
             import traceback
             print(f"[ERROR] Traceback: {traceback.format_exc()}")
-
@@ -0,0 +1,322 @@
+"""
+WebDriver binary çözümleme önbelleği
+
+ChromeDriverManager / GeckoDriverManager her çağrıda sürüm sorgusu yapar ve
+ağ olmadan çalışmaz. Bu modül çözülen driver yolunu tarayıcı sürümüne göre
+yerel bir JSON dosyasında saklar; önbellek geçerliyse ağa hiç çıkılmaz.
+"""
+import hashlib
+import json
+import os
+import plistlib
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from utils.logger import logger
+
+
+DEFAULT_CACHE_DIR = ".driver_cache"
+CACHE_FILENAME = "drivers.json"
+
+BROWSER_BINARIES = {
+    'chrome': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome'],
+    'firefox': ['firefox'],
+}
+# (hive, anahtar, değer) - webdriver-manager'ın okuduğu kayıtlar
+WINDOWS_REGISTRY_KEYS = {
+    'chrome': [
+        ('HKEY_CURRENT_USER', r"Software\Google\Chrome\BLBeacon", 'version'),
+        ('HKEY_LOCAL_MACHINE', r"Software\Google\Chrome\BLBeacon", 'version'),
+        ('HKEY_LOCAL_MACHINE', r"Software\Wow6432Node\Google\Chrome\BLBeacon", 'version'),
+    ],
+    'firefox': [
+        ('HKEY_LOCAL_MACHINE', r"SOFTWARE\Mozilla\Mozilla Firefox", 'CurrentVersion'),
+        ('HKEY_CURRENT_USER', r"SOFTWARE\Mozilla\Mozilla Firefox", 'CurrentVersion'),
+    ],
+}
+MAC_APP_PLISTS = {
+    'chrome': ['/Applications/Google Chrome.app/Contents/Info.plist'],
+    'firefox': ['/Applications/Firefox.app/Contents/Info.plist'],
+}
+VERSION_PATTERN = re.compile(r'(\d+(?:\.\d+)+)')
+DRIVER_BINARIES = {
+    'chrome': 'chromedriver',
+    'firefox': 'geckodriver',
+}
+
+_lock = threading.Lock()
+
+
+def is_offline(cache_config):
+    """Offline modun açık olup olmadığını döndürür (config veya ENUYGUN_OFFLINE)"""
+    env_value = os.environ.get('ENUYGUN_OFFLINE', '').strip().lower()
+    if env_value in ('1', 'true', 'yes'):
+        return True
+    return bool(cache_config.get('offline', False))
+
+
+def _binary_version(executables):
+    """İlk çalışan binary'nin `--version` çıktısından sürümü okur (Linux / macOS)"""
+    for candidate in executables:
+        executable = shutil.which(candidate) or (candidate if Path(candidate).exists() else None)
+        if not executable:
+            continue
+        try:
+            output = subprocess.run(
+                [executable, '--version'], capture_output=True, text=True, timeout=5
+            ).stdout
+        except Exception:
+            continue
+        match = VERSION_PATTERN.search(output or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def _windows_version(browser_name, binary=None):
+    """Sürümü kayıt defterinden (binary verildiyse dosya sürümünden) okur
+
+    Windows'ta `chrome --version` sürüm yazdırmaz, tarayıcıyı açabilir; bu
+    yüzden binary hiç çalıştırılmaz.
+    """
+    if binary:
+        literal = binary.replace("'", "''")
+        try:
+            output = subprocess.run(
+                ['powershell', '-NoProfile', '-Command',
+                 f"(Get-Item -LiteralPath '{literal}').VersionInfo.ProductVersion"],
+                capture_output=True, text=True, timeout=10,
+            ).stdout
+        except Exception:
+            output = ""
+        match = VERSION_PATTERN.search(output or "")
+        return match.group(1) if match else None
+
+    try:
+        import winreg
+    except ImportError:
+        return None
+    for hive, key_path, value_name in WINDOWS_REGISTRY_KEYS.get(browser_name, []):
+        try:
+            with winreg.OpenKey(getattr(winreg, hive), key_path) as key:
+                value = winreg.QueryValueEx(key, value_name)[0]
+        except OSError:
+            continue
+        match = VERSION_PATTERN.search(str(value))
+        if match:
+            return match.group(1)
+    return None
+
+
+def _mac_version(browser_name, binary=None):
+    """Sürümü .app paketinin Info.plist dosyasından okur"""
+    plists = list(MAC_APP_PLISTS.get(browser_name, []))
+    if binary and '.app/' in binary:
+        plists.insert(0, binary.split('.app/')[0] + '.app/Contents/Info.plist')
+    for plist_path in plists:
+        try:
+            with open(plist_path, 'rb') as f:
+                value = plistlib.load(f).get('CFBundleShortVersionString', '')
+        except Exception:
+            continue
+        match = VERSION_PATTERN.search(value)
+        if match:
+            return match.group(1)
+    return _binary_version([binary] if binary else BROWSER_BINARIES.get(browser_name, []))
+
+
+def detect_browser_version(browser_name, binary=None):
+    """Kurulu tarayıcının sürümünü webdriver-manager ile aynı kaynaklardan okur
+
+    Windows: kayıt defteri, macOS: Info.plist, Linux: `--version` çıktısı.
+
+    Args:
+        browser_name: "chrome" veya "firefox"
+        binary: Opsiyonel tarayıcı binary yolu
+
+    Returns:
+        str: Sürüm (örn: "126.0.6478.126") veya bulunamazsa None
+    """
+    if sys.platform.startswith('win'):
+        return _windows_version(browser_name, binary)
+    if sys.platform == 'darwin':
+        return _mac_version(browser_name, binary)
+    return _binary_version([binary] if binary else BROWSER_BINARIES.get(browser_name, []))
+
+
+def file_checksum(path, chunk_size=1024 * 1024):
+    """Dosyanın SHA-256 özetini döndürür"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DriverCache:
+    """Tarayıcı sürümü -> driver yolu önbelleği"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        """Önbelleği başlatır
+
+        Args:
+            cache_dir: Önbellek dizini (varsayılan: .driver_cache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / CACHE_FILENAME
+
+    def _load(self):
+        """Önbellek dosyasını okur"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Driver cache okunamadı, yok sayılıyor: {str(e)}")
+            return {}
+
+    def _save(self, entries):
+        """Önbellek dosyasını atomik olarak yazar"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def _key(browser_name, browser_version):
+        return f"{browser_name}:{browser_version}"
+
+    @staticmethod
+    def verify(entry):
+        """Kayıtlı driver dosyasının hâlâ aynı dosya olduğunu doğrular
+
+        Boyut stat ile kontrol edilir; mtime değişmişse checksum yeniden hesaplanır.
+
+        Returns:
+            bool: Kayıt geçerliyse True
+        """
+        path = entry.get('path')
+        if not path:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != entry.get('size'):
+            return False
+        if stat.st_mtime_ns == entry.get('mtime_ns'):
+            return True
+        return file_checksum(path) == entry.get('sha256')
+
+    def get(self, browser_name, browser_version):
+        """Sürüm için geçerli driver yolunu döndürür, yoksa (veya sürüm bilinmiyorsa) None"""
+        if not browser_version:
+            return None
+        entry = self._load().get(self._key(browser_name, browser_version))
+        if entry and self.verify(entry):
+            return entry['path']
+        return None
+
+    def latest(self, browser_name):
+        """Tarayıcı için sürümden bağımsız en son kaydedilen geçerli yolu döndürür"""
+        entries = [
+            entry for key, entry in self._load().items()
+            if key.startswith(f"{browser_name}:") and self.verify(entry)
+        ]
+        if not entries:
+            return None
+        return max(entries, key=lambda entry: entry.get('mtime_ns', 0))['path']
+
+    def put(self, browser_name, browser_version, path):
+        """Çözülen driver yolunu önbelleğe yazar (sürüm bilinmiyorsa yazmaz)
+
+        Returns:
+            bool: Kayıt yazıldıysa True
+        """
+        if not browser_version:
+            return False
+        stat = os.stat(path)
+        with _lock:
+            entries = self._load()
+            entries[self._key(browser_name, browser_version)] = {
+                'path': str(Path(path).absolute()),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': file_checksum(path),
+            }
+            self._save(entries)
+        return True
+
+    def remove(self, browser_name, browser_version):
+        """Sürümün kaydını siler (örn: driver tarayıcıyla oturum açamadıysa)"""
+        with _lock:
+            entries = self._load()
+            if entries.pop(self._key(browser_name, browser_version), None) is not None:
+                self._save(entries)
+
+
+def _install_driver(browser_name):
+    """webdriver-manager ile driver'ı çözer (ağ gerektirebilir)"""
+    if browser_name == 'chrome':
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    if browser_name == 'firefox':
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    raise ValueError(f"Desteklenmeyen tarayıcı: {browser_name}")
+
+
+def resolve_driver_path(browser_name, cache_config=None, refresh=False):
+    """Driver binary yolunu önbellek öncelikli çözer
+
+    Sıra: önbellek (sürüm eşleşmesi) -> offline ise son kayıt veya PATH ->
+    webdriver-manager (sonuç önbelleğe yazılır). Tarayıcı sürümü tespit
+    edilemezse önbellek okunmaz ve yazılmaz; aksi halde tarayıcı güncellenince
+    eski driver sonsuza dek kullanılırdı.
+
+    Args:
+        browser_name: "chrome" veya "firefox"
+        cache_config: config.yaml `browser.driver_cache` bölümü
+        refresh: True ise sürümün kaydı silinir ve driver yeniden çözülür
+            (örn: SessionNotCreatedException sonrası)
+
+    Returns:
+        str: Driver binary yolu
+    """
+    cache_config = cache_config or {}
+    cache = DriverCache(cache_config.get('path', DEFAULT_CACHE_DIR))
+    browser_version = detect_browser_version(browser_name, cache_config.get('browser_binary'))
+    use_cache = cache_config.get('enabled', True) and browser_version is not None
+    if browser_version is None:
+        logger.info(f"{browser_name} sürümü tespit edilemedi, driver cache kullanılmıyor")
+
+    if use_cache and refresh:
+        cache.remove(browser_name, browser_version)
+        logger.warning(f"Driver cache kaydı silindi: {browser_name} {browser_version}")
+    elif use_cache:
+        cached_path = cache.get(browser_name, browser_version)
+        if cached_path:
+            logger.info(f"Driver cache hit: {browser_name} {browser_version} -> {cached_path}")
+            return cached_path
+
+    if is_offline(cache_config):
+        fallback_path = cache.latest(browser_name) or shutil.which(DRIVER_BINARIES.get(browser_name, ''))
+        if fallback_path:
+            logger.warning(f"Offline mod: {browser_name} {browser_version} için kayıt yok, {fallback_path} kullanılıyor")
+            return fallback_path
+        raise RuntimeError(
+            f"Offline mod: {browser_name} için önbellekte veya PATH'te driver bulunamadı"
+        )
+
+    driver_path = _install_driver(browser_name)
+    if use_cache:
+        try:
+            cache.put(browser_name, browser_version, driver_path)
+        except Exception as e:
+            logger.warning(f"Driver cache yazılamadı: {str(e)}")
+    return driver_path
@@ -0,0 +1,183 @@
+"""
+Testler arasında paylaşılan sıcak WebDriver havuzu
+"""
+import queue
+import threading
+from contextlib import contextmanager
+from utils.command_profiler import unwrap_driver
+from utils.logger import logger
+
+
+# HTTP cache dışındaki origin verisi (Storage.clearDataForOrigin storageTypes)
+CLEARED_STORAGE_TYPES = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage,file_systems"
+
+class DriverPool:
+    """Önceden başlatılmış tarayıcıları testlere kiralayan havuz
+
+    Tarayıcılar ihtiyaç oldukça (en fazla size adet) oluşturulur. İade edilen
+    tarayıcının cookie, origin storage'ı ve sekmeleri temizlenip about:blank'e
+    dönülür (HTTP cache korunur); temizlenemeyen tarayıcı kapatılıp havuzdan çıkarılır.
+    """
+
+    def __init__(self, size=1, factory=None, origins=()):
+        """Havuzu başlatır
+
+        Args:
+            size: Aynı anda yaşayabilecek maksimum tarayıcı sayısı
+            factory: Yeni WebDriver oluşturan fonksiyon (varsayılan: browser_factory.create_driver)
+            origins: İadede her zaman storage'ı temizlenecek origin'ler
+        """
+        if factory is None:
+            from utils.browser_factory import create_driver as factory
+        self.size = max(1, int(size))
+        self.factory = factory
+        self.origins = tuple(origins)
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm_up(self, count=None):
+        """Belirtilen sayıda tarayıcıyı önceden başlatır
+
+        Args:
+            count: Başlatılacak tarayıcı sayısı (varsayılan: havuz boyutu)
+        """
+        count = self.size if count is None else min(count, self.size)
+        while len(self._all) < count:
+            driver = self._create()
+            if driver is None:
+                break
+            self._idle.put(driver)
+
+    def _create(self):
+        """Kapasite varsa yeni tarayıcı oluşturur, yoksa None döndürür"""
+        with self._lock:
+            if self._closed or len(self._all) >= self.size:
+                return None
+            driver = self.factory()
+            self._all.append(driver)
+            logger.info(f"Driver pool: yeni tarayıcı başlatıldı ({len(self._all)}/{self.size})")
+            return driver
+
+    def lease(self, timeout=None):
+        """Havuzdan bir tarayıcı kiralar
+
+        Args:
+            timeout: Boş tarayıcı beklemek için maksimum süre (None: sonsuz)
+
+        Returns:
+            WebDriver: Temiz durumdaki tarayıcı
+        """
+        if self._closed:
+            raise RuntimeError("Driver pool kapatıldı")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        driver = self._create()
+        if driver is not None:
+            return driver
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Driver pool: {timeout} saniyede boş tarayıcı bulunamadı")
+
+    def release(self, driver):
+        """Tarayıcıyı sıfırlayıp havuza iade eder
+
+        Args:
+            driver: lease() ile alınmış WebDriver instance'ı
+        """
+        if self._closed or not self.reset(driver, self.origins):
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def leased(self, timeout=None):
+        """with bloğu süresince tarayıcı kiralar ve sonunda iade eder"""
+        driver = self.lease(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    @staticmethod
+    def reset(driver, origins=()):
+        """Tarayıcı durumunu temizler (cookie, origin storage'ı, sekmeler)
+
+        HTTP cache bilerek korunur; sıcak havuzun amacı statik dosyaları
+        testler arasında yeniden indirmemektir. Açık sekmelerin origin'leri ve
+        verilen origin'ler için Storage.clearDataForOrigin çağrılır; tüm sekmeler
+        yeni boş bir sekmeyle değiştirildiği için sessionStorage de sıfırlanır.
+
+        Args:
+            driver: Sıfırlanacak WebDriver
+            origins: Ayrıca temizlenecek origin'ler (örn: "https://www.enuygun.com")
+
+        Returns:
+            bool: Sıfırlama başarılı ise True
+        """
+        try:
+            handles = driver.window_handles
+            visited = set(origins)
+            for handle in handles:
+                driver.switch_to.window(handle)
+                origin = driver.execute_script("return window.location.origin")
+                if origin and origin != "null":
+                    visited.add(origin)
+
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                for origin in visited:
+                    driver.execute_cdp_cmd('Storage.clearDataForOrigin',
+                                           {'origin': origin, 'storageTypes': CLEARED_STORAGE_TYPES})
+            except Exception:
+                # CDP yok (Firefox): sadece açık sekmelerin origin'leri temizlenebilir
+                driver.delete_all_cookies()
+                for handle in handles:
+                    driver.switch_to.window(handle)
+                    try:
+                        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                    except Exception:
+                        pass
+
+            driver.switch_to.new_window('tab')
+            fresh_handle = driver.current_window_handle
+            for handle in handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(fresh_handle)
+            driver.get("about:blank")
+
+            network_log = getattr(unwrap_driver(driver), '_network_log', None)
+            if network_log is not None:
+                network_log.clear()
+            return True
+        except Exception as e:
+            logger.warning(f"Driver pool: tarayıcı sıfırlanamadı, kapatılıyor: {str(e)}")
+            return False
+
+    def _discard(self, driver):
+        """Tarayıcıyı kapatır ve havuz kaydından siler"""
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Havuzdaki tüm tarayıcıları kapatır"""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._all)
+            self._all.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        logger.info(f"Driver pool: {len(drivers)} tarayıcı kapatıldı")
@@ -0,0 +1,165 @@
+"""
+Uçuş arama API yanıtını extract_all_flight_data şemasına çeviren yardımcılar
+
+Arama XHR'ının JSON yanıtı CDP Network.getResponseBody ile okunup
+config.yaml `network.api_mapping` alan yollarıyla uçuş sözlüklerine çevrilir;
+hangi isteklerin okunacağını `network.search_api_patterns` belirler.
+
+Bilinen tek yanıt yapısı replay sunucusunun sentetik şemasıdır
+(REPLAY_API_MAPPING). Canlı sitenin arama yanıtı kaydedilip eşlenmedikçe
+"api" çıkarımı canlı sitede çalışmaz: yanıt DevTools'tan JSON olarak
+kaydedilmeli, pattern ve alan yolları ona göre yazılmalı ve
+`python -m utils.flight_api kayit.json` ile kontrol edilmelidir.
+"""
+import argparse
+import base64
+import io
+import json
+from utils.logger import logger
+
+
+# Replay sunucusunun /api/flights/search yanıtına göre alan yolları (canlı site değil)
+REPLAY_API_MAPPING = {
+    'flights_path': 'data.flights',
+    'departure_time': 'departure.time',
+    'arrival_time': 'arrival.time',
+    'airline': 'airline.name',
+    'price': 'price.amount',
+    'stops': 'stops',
+    'duration_minutes': 'duration_minutes',
+}
+
+
+def get_path(data, path, default=None):
+    """Noktalı yol ile iç içe sözlük/liste değerini okur (örn: "price.amount")"""
+    current = data
+    for part in path.split('.') if path else []:
+        if isinstance(current, dict):
+            current = current.get(part)
+        elif isinstance(current, list) and part.isdigit() and int(part) < len(current):
+            current = current[int(part)]
+        else:
+            return default
+        if current is None:
+            return default
+    return current
+
+
+def format_duration(minutes):
+    """Dakikayı sitedeki gösterime çevirir (örn: 75 -> "1s 15dk")"""
+    if minutes is None:
+        return "N/A"
+    minutes = int(minutes)
+    return f"{minutes // 60}s {minutes % 60}dk"
+
+
+def connection_label(stops):
+    """Aktarma sayısını DOM çıkarımındaki etikete çevirir"""
+    if not stops:
+        return "Direct"
+    return f"{int(stops)} Stop"
+
+
+def _field(flight, mapping, field, default=None):
+    """Eşlemede yolu tanımlı olmayan alan için default döndürür"""
+    path = mapping.get(field)
+    return get_path(flight, path, default) if path else default
+
+
+def map_api_flights(payload, mapping):
+    """Arama API yanıtını uçuş sözlüklerine çevirir
+
+    Args:
+        payload: JSON yanıtı (dict)
+        mapping: Alan -> noktalı yol eşlemesi (config network.api_mapping);
+            flights_path zorunlu, eksik alanlar N/A/Unknown/None kalır
+
+    Returns:
+        list: departure_time, arrival_time, airline, price, connection, duration,
+            flight_index alanlı sözlükler
+
+    Raises:
+        ValueError: mapping'de flights_path yoksa
+    """
+    if not mapping or not mapping.get('flights_path'):
+        raise ValueError("API eşlemesinde flights_path tanımlı değil (config: network.api_mapping)")
+    flights = get_path(payload, mapping['flights_path'], [])
+    if not isinstance(flights, list):
+        return []
+
+    flight_data = []
+    for flight in flights:
+        price = _field(flight, mapping, 'price')
+        try:
+            price = int(float(price)) if price is not None else None
+        except (TypeError, ValueError):
+            price = None
+        flight_data.append({
+            'departure_time': _field(flight, mapping, 'departure_time', "N/A"),
+            'arrival_time': _field(flight, mapping, 'arrival_time', "N/A"),
+            'airline': _field(flight, mapping, 'airline', "Unknown"),
+            'price': price,
+            'connection': connection_label(_field(flight, mapping, 'stops', 0)),
+            'duration': format_duration(_field(flight, mapping, 'duration_minutes')),
+            'flight_index': len(flight_data) + 1,
+        })
+    return flight_data
+
+
+def decode_response_body(response):
+    """Network.getResponseBody sonucunu JSON'a çevirir (çözülemezse None)"""
+    body = response.get('body', '')
+    if response.get('base64Encoded'):
+        body = base64.b64decode(body).decode('utf-8', errors='replace')
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def capture_search_payloads(network_log):
+    """Son uçuş arama XHR'larının yanıt gövdelerini CDP ile okur
+
+    Args:
+        network_log: Driver'a bağlı NetworkLog
+
+    Returns:
+        list: Çözülen JSON yanıtları (yakalanamazsa boş liste)
+    """
+    payloads = []
+    for request_id in network_log.latest_search_request_ids():
+        try:
+            response = network_log.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            logger.debug(f"Yanıt gövdesi okunamadı ({request_id}): {str(e)}")
+            continue
+        payload = decode_response_body(response)
+        if payload is not None:
+            payloads.append(payload)
+    return payloads
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Kaydedilmiş bir arama API yanıtını config'deki network.api_mapping ile dener"
+    )
+    parser.add_argument("payload", help="DevTools'tan kaydedilmiş JSON yanıt dosyası")
+    parser.add_argument("--limit", type=int, default=5, help="Yazdırılacak kayıt sayısı")
+    args = parser.parse_args()
+
+    from utils.browser_factory import load_config
+    mapping = load_config().get('network', {}).get('api_mapping')
+    with io.open(args.payload, 'r', encoding='utf-8') as f:
+        records = map_api_flights(json.load(f), mapping)
+
+    print(f"[INFO] {len(records)} uçuş eşlendi")
+    for record in records[:args.limit]:
+        print(record)
+    incomplete = [record for record in records
+                  if record['departure_time'] == "N/A" or record['airline'] == "Unknown" or record['price'] is None]
+    if not records or incomplete:
+        print(f"[WARNING] {len(incomplete)} kayıtta alan eksik - api_mapping yollarını yanıta göre düzeltin")
+
+
+if __name__ == "__main__":
+    main()
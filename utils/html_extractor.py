@@ -0,0 +1,217 @@
+"""
+page_source snapshot'larından uçuş verisini tarayıcı olmadan çıkaran lxml tabanlı parser
+
+ResultsPage'in kart/alan selector planı bir kez etree.XPath'e derlenir (CSS
+selector'lar cssselect ile querySelector gibi sadece alt elemanlarda arayan
+XPath'e çevrilir) ve canlı DOM çıkarımıyla aynı _build_flight_info indirgeyicisi
+kullanılır. Böylece tek bir driver.page_source alınıp ayrıştırma bir worker
+thread/süreçte yapılırken tarayıcı sonraki aramaya geçebilir; kayıtlı HTML
+dosyaları da toplu olarak yeniden işlenebilir.
+
+lxml ve cssselect opsiyoneldir; kurulu değilse ImportError açıklayıcı mesajla fırlatılır.
+
+Kullanım:
+    python -m utils.html_extractor replay/snapshots/*.html --workers 4 --output reports/snapshots.csv
+"""
+import argparse
+import csv
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from utils.logger import logger
+
+try:
+    from lxml import etree, html as lxml_html
+    from cssselect import HTMLTranslator
+except ImportError:
+    etree = lxml_html = HTMLTranslator = None
+
+
+def _require_lxml():
+    if lxml_html is None or HTMLTranslator is None:
+        raise ImportError("Offline HTML ayrıştırma için lxml ve cssselect gerekli: pip install lxml cssselect")
+
+
+def _normalize_text(element):
+    """innerText'e yakın metin: boşlukları tek boşluğa indirir"""
+    return " ".join(element.text_content().split())
+
+
+class HtmlFlightExtractor:
+    """Derlenmiş selector planıyla HTML'den uçuş kayıtları çıkaran parser"""
+
+    def __init__(self, card_plan, field_plan, reducer):
+        """Selector planlarını derler
+
+        Args:
+            card_plan: [by, selector, container içi css | None] listesi (ResultsPage._flight_card_plan)
+            field_plan: {alan: [[by, selector], ...]} (ResultsPage._flight_field_plan)
+            reducer: Aday değerlerden uçuş sözlüğü üreten fonksiyon (ResultsPage._build_flight_info)
+        """
+        _require_lxml()
+        self.reducer = reducer
+        self._translator = HTMLTranslator()
+        self.card_plan = [
+            (self._compile(by, selector), self._compile('css selector', inner) if inner else None, selector)
+            for by, selector, inner in card_plan
+        ]
+        self.field_plan = {
+            field: [self._compile(by, selector) for by, selector in selectors]
+            for field, selectors in field_plan.items()
+        }
+
+    def _compile(self, by, selector):
+        """Selector'ı derlenmiş XPath'e çevirir (CSS: querySelector gibi root hariç alt elemanlar)"""
+        if by == 'xpath':
+            return etree.XPath(selector)
+        return etree.XPath(self._translator.css_to_xpath(selector, prefix='descendant::'))
+
+    def _find_cards(self, document):
+        for matcher, inner, selector in self.card_plan:
+            try:
+                matches = matcher(document)
+            except Exception:
+                continue
+            if not matches:
+                continue
+            cards = inner(matches[0]) if inner is not None else matches
+            if cards:
+                logger.debug(f"Offline parser kart selector'ı: {selector} ({len(cards)} kart)")
+                return cards
+        return []
+
+    def _card_candidates(self, card):
+        candidates = {}
+        for field, matchers in self.field_plan.items():
+            values = []
+            for matcher in matchers:
+                try:
+                    matches = matcher(card)
+                except Exception:
+                    matches = []
+                if matches:
+                    values.append((_normalize_text(matches[0]), matches[0].get('data-price')))
+                else:
+                    values.append(None)
+            candidates[field] = values
+        return candidates
+
+    def extract(self, html_text):
+        """HTML metninden uçuş kayıtlarını çıkarır
+
+        Args:
+            html_text: page_source veya kayıtlı HTML içeriği
+
+        Returns:
+            list: extract_all_flight_data ile aynı şemada uçuş sözlükleri
+        """
+        if not html_text or not html_text.strip():
+            return []
+        document = lxml_html.fromstring(html_text)
+        flight_data = []
+        for i, card in enumerate(self._find_cards(document)):
+            flight_info = self.reducer(self._card_candidates(card))
+            flight_info['flight_index'] = i + 1
+            if flight_info.get('departure_time') != "N/A" or flight_info.get('airline') != "Unknown":
+                flight_data.append(flight_info)
+        return flight_data
+
+    def extract_file(self, path):
+        """Kayıtlı HTML dosyasından uçuş kayıtlarını çıkarır"""
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return self.extract(f.read())
+
+
+_default_extractor = None
+
+
+def default_extractor():
+    """ResultsPage selector planıyla derlenmiş, süreç başına tek extractor"""
+    global _default_extractor
+    if _default_extractor is None:
+        from pages.results_page import ResultsPage
+        _default_extractor = HtmlFlightExtractor(
+            ResultsPage._flight_card_plan(), ResultsPage._flight_field_plan(), ResultsPage._build_flight_info
+        )
+    return _default_extractor
+
+
+def extract_html(html_text):
+    """Varsayılan extractor ile HTML metnini ayrıştırır (executor'a gönderilebilir)"""
+    return default_extractor().extract(html_text)
+
+
+def _extract_file_task(path):
+    try:
+        return path, default_extractor().extract_file(path), None
+    except Exception as e:
+        return path, [], str(e)
+
+
+def extract_files(paths, workers=4, use_processes=True, chunksize=8):
+    """Kayıtlı HTML dosyalarını paralel ayrıştırır
+
+    Args:
+        paths: HTML dosya yolları
+        workers: Worker sayısı
+        use_processes: True ise süreç havuzu (CPU paralelliği), False ise thread havuzu
+        chunksize: Süreç havuzunda worker başına gönderilen dosya grubu
+
+    Yields:
+        tuple: (dosya yolu, uçuş kayıtları, hata mesajı veya None) - giriş sırasıyla
+    """
+    _require_lxml()
+    paths = list(paths)
+    if workers <= 1:
+        for path in paths:
+            yield _extract_file_task(path)
+        return
+    if use_processes:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_extract_file_task, paths, chunksize=chunksize)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_extract_file_task, paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayıtlı sonuç sayfalarından toplu uçuş verisi çıkarma")
+    parser.add_argument("patterns", nargs="+", help="HTML dosyaları veya glob kalıpları")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--threads", action="store_true", help="Süreç yerine thread havuzu kullan")
+    parser.add_argument("--output", default=None, help="Birleşik CSV çıktısı (opsiyonel)")
+    args = parser.parse_args()
+
+    paths = sorted({path for pattern in args.patterns for path in (glob.glob(pattern) or [pattern])})
+    started = time.time()
+    pages = records = failures = 0
+    writer = None
+    csvfile = open(args.output, 'w', newline='', encoding='utf-8') if args.output else None
+    try:
+        for path, flight_data, error in extract_files(paths, args.workers, not args.threads):
+            pages += 1
+            if error:
+                failures += 1
+                print(f"[WARNING] {path}: {error}")
+                continue
+            records += len(flight_data)
+            if csvfile is not None and flight_data:
+                if writer is None:
+                    writer = csv.DictWriter(csvfile, fieldnames=['source_file'] + list(flight_data[0].keys()),
+                                            extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerows(dict(record, source_file=path) for record in flight_data)
+    finally:
+        if csvfile is not None:
+            csvfile.close()
+
+    elapsed = time.time() - started
+    print(f"[OK] {pages} sayfa, {records} uçuş kaydı, {failures} hata - {elapsed:.2f}s "
+          f"({pages / elapsed * 60 if elapsed else 0:.0f} sayfa/dk)")
+    if args.output:
+        print(f"[OK] CSV: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
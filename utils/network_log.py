@@ -0,0 +1,305 @@
+"""
+Chrome performance log (CDP Network olayları) okuma yardımcıları
+
+create_driver performance log'u açtığında (goog:loggingPrefs) driver.get_log
+ile Network.* olayları okunur. get_log tamponu boşalttığı için tüm tüketiciler
+driver başına tek bir NetworkLog örneğini paylaşır (get_network_log).
+"""
+import json
+from utils.command_profiler import unwrap_driver
+from utils.logger import logger
+
+
+# Engellenen isteklerin boyutu bilinmediği için kullanılan kaba tahminler (byte)
+DEFAULT_ESTIMATED_BYTES = {
+    'Image': 25_000,
+    'Font': 40_000,
+    'Media': 250_000,
+    'Script': 60_000,
+    'Stylesheet': 20_000,
+    'Other': 5_000,
+}
+
+# Uçuş arama XHR'larını tanıyan URL parçaları (config: network.search_api_patterns).
+# Varsayılan boş: sonuç beklemesi tüm XHR/Fetch isteklerine bakar, pattern
+# verilirse sadece eşleşenlere daralır; API çıkarımı pattern olmadan çalışmaz
+DEFAULT_SEARCH_API_PATTERNS = []
+
+# Ağ boşta sayılırken bakılan CDP kaynak tipleri
+XHR_RESOURCE_TYPES = ('XHR', 'Fetch')
+
+# Tamamlanmış istek kaydı üst sınırı (config: network.max_requests); havuzdaki
+# uzun ömürlü driver'larda tablo sınırsız büyümesin diye en eskiler atılır
+DEFAULT_MAX_REQUESTS = 2000
+
+
+def parse_performance_entries(entries):
+    """driver.get_log('performance') kayıtlarını CDP olaylarına çevirir
+
+    Args:
+        entries: get_log çıktısı (her birinin 'message' alanı JSON string)
+
+    Returns:
+        list: {'method': ..., 'params': {...}} sözlükleri
+    """
+    events = []
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get('method', '').startswith('Network.'):
+            events.append({'method': message['method'], 'params': message.get('params', {})})
+    return events
+
+
+class NetworkLog:
+    """requestId bazında istek durumlarını tutan performance log okuyucu
+
+    Raporlanmış ve tüketilmiş arama dışı kayıtlar silinir, eski arama grupları
+    yenisi tüketilince atılır; kalan tamamlanmış kayıtlar max_requests ile
+    sınırlıdır. DriverPool.reset tabloyu clear ile tamamen boşaltır.
+    """
+
+    def __init__(self, driver, settings=None):
+        """
+        Args:
+            driver: Selenium WebDriver instance'ı
+            settings: config.yaml `network` bölümü (search_api_patterns, card_stable_ms, ...)
+        """
+        self.driver = unwrap_driver(driver)
+        self.settings = dict(settings or {})
+        self.search_api_patterns = list(self.settings.get('search_api_patterns', DEFAULT_SEARCH_API_PATTERNS))
+        self.max_requests = int(self.settings.get('max_requests', DEFAULT_MAX_REQUESTS))
+        self.available = True
+        self.clear()
+
+    def clear(self):
+        """Tüm istek kayıtlarını ve tüketim durumunu sıfırlar (örn: havuza iadede)"""
+        self.requests = {}
+        self._reported = set()
+        self._consumed_search = set()
+        self._last_search_batch = []
+
+    def _forget(self, request_ids):
+        for request_id in request_ids:
+            self.requests.pop(request_id, None)
+            self._reported.discard(request_id)
+            self._consumed_search.discard(request_id)
+
+    def _is_search(self, record):
+        return any(pattern in record['url'] for pattern in self.search_api_patterns)
+
+    def xhr_requests(self, patterns=None):
+        """XHR/Fetch istek kayıtlarını döndürür
+
+        Args:
+            patterns: Verilirse sadece URL'i bu parçalardan birini içerenler
+
+        Returns:
+            dict: requestId -> istek kaydı
+        """
+        return {
+            request_id: record for request_id, record in self.requests.items()
+            if record['type'] in XHR_RESOURCE_TYPES
+            and (not patterns or any(pattern in record['url'] for pattern in patterns))
+        }
+
+    def pending_xhr_requests(self, patterns=None):
+        """Yanıtı henüz tamamlanmamış XHR/Fetch isteklerinin sayısı"""
+        return sum(1 for record in self.xhr_requests(patterns).values() if record['state'] == 'pending')
+
+    def _prune(self):
+        """Kayıt sayısı max_requests'i aşarsa en eski tamamlanmış kayıtları atar"""
+        excess = len(self.requests) - self.max_requests
+        if excess <= 0:
+            return
+        keep = set(self._last_search_batch)
+        stale = [request_id for request_id, record in self.requests.items()
+                 if record['state'] != 'pending' and request_id not in keep][:excess]
+        self._forget(stale)
+
+    def poll(self):
+        """Yeni performance log kayıtlarını okur ve istek tablosunu günceller
+
+        Returns:
+            list: Okunan CDP olayları (log kapalıysa boş liste)
+        """
+        if not self.available:
+            return []
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log okunamadı: {str(e)}")
+            self.available = False
+            return []
+        events = parse_performance_entries(entries)
+        for event in events:
+            self.apply(event)
+        self._prune()
+        return events
+
+    def apply(self, event):
+        """Tek bir CDP Network olayını istek tablosuna işler"""
+        method, params = event['method'], event['params']
+        request_id = params.get('requestId')
+        if request_id is None:
+            return
+
+        if method == 'Network.requestWillBeSent':
+            request = params.get('request', {})
+            self.requests[request_id] = {
+                'url': request.get('url', ''),
+                'method': request.get('method', 'GET'),
+                'type': params.get('type', 'Other'),
+                'state': 'pending',
+                'started': params.get('timestamp'),
+                'finished': None,
+                'status': None,
+                'encoded_bytes': 0,
+                'blocked_reason': None,
+            }
+            return
+
+        record = self.requests.setdefault(request_id, {
+            'url': '', 'method': 'GET', 'type': params.get('type', 'Other'), 'state': 'pending',
+            'started': None, 'finished': None, 'status': None, 'encoded_bytes': 0, 'blocked_reason': None,
+        })
+        if method == 'Network.responseReceived':
+            response = params.get('response', {})
+            record['status'] = response.get('status')
+            record['type'] = params.get('type', record['type'])
+            record['url'] = record['url'] or response.get('url', '')
+        elif method == 'Network.loadingFinished':
+            record['state'] = 'finished'
+            record['finished'] = params.get('timestamp')
+            record['encoded_bytes'] = params.get('encodedDataLength', 0)
+        elif method == 'Network.loadingFailed':
+            record['state'] = 'failed'
+            record['finished'] = params.get('timestamp')
+            record['type'] = params.get('type', record['type'])
+            record['blocked_reason'] = params.get('blockedReason')
+
+    def search_requests(self):
+        """Henüz tüketilmemiş uçuş arama isteklerini döndürür
+
+        Returns:
+            dict: requestId -> istek kaydı (URL'i search_api_patterns ile eşleşenler)
+        """
+        return {
+            request_id: record for request_id, record in self.requests.items()
+            if request_id not in self._consumed_search and self._is_search(record)
+        }
+
+    def pending_search_requests(self):
+        """Hâlâ yanıt beklenen uçuş arama isteklerinin sayısı"""
+        return sum(1 for record in self.search_requests().values() if record['state'] == 'pending')
+
+    def consume_search_requests(self):
+        """Mevcut arama isteklerini işlenmiş sayar (sonraki bekleme yeni istekleri bekler)
+
+        Yeni grup gelince bir önceki tüketilmiş grubun kayıtları silinir.
+        """
+        batch = self.search_requests()
+        if batch:
+            self._forget([request_id for request_id in self._last_search_batch if request_id not in batch])
+            self._last_search_batch = list(batch)
+        self._consumed_search.update(batch)
+
+    def latest_search_request_ids(self):
+        """Yanıtı alınmış en son arama isteklerinin requestId listesi
+
+        Henüz tüketilmemiş tamamlanmış istekler varsa onlar, yoksa son
+        consume_search_requests ile işlenen grup döndürülür.
+        """
+        self.poll()
+        unconsumed = [request_id for request_id, record in self.search_requests().items()
+                      if record['state'] == 'finished']
+        candidates = unconsumed or self._last_search_batch
+        return [request_id for request_id in candidates
+                if self.requests.get(request_id, {}).get('state') == 'finished']
+
+    def blocking_report(self, estimated_bytes=None):
+        """Son rapordan bu yana engellenen istekleri özetler
+
+        Engellenen isteklerin boyutu tarayıcıya hiç gelmediği için bilinemez;
+        aynı tipte yüklenen isteklerin ortalaması, yoksa sabit tahmin kullanılır.
+
+        Args:
+            estimated_bytes: Tip -> tahmini byte (varsayılan: DEFAULT_ESTIMATED_BYTES)
+
+        Returns:
+            dict: blocked_requests, loaded_requests, loaded_bytes,
+                estimated_saved_bytes, by_type
+        """
+        self.poll()
+        estimates = dict(DEFAULT_ESTIMATED_BYTES, **(estimated_bytes or {}))
+        # Hâlâ bekleyen istekler bir sonraki rapora kalır
+        new_ids = [request_id for request_id, record in self.requests.items()
+                   if request_id not in self._reported and record['state'] != 'pending']
+        records = [self.requests[request_id] for request_id in new_ids]
+        # Arama dışı kayıtlar raporlandıktan sonra gerekmez; arama kayıtları
+        # yanıt gövdesi okunana kadar (consume_search_requests) tutulur
+        self._reported.update(request_id for request_id, record in zip(new_ids, records) if self._is_search(record))
+        self._forget(request_id for request_id, record in zip(new_ids, records) if not self._is_search(record))
+
+        loaded_by_type = {}
+        for record in records:
+            if record['state'] == 'finished':
+                loaded_by_type.setdefault(record['type'], []).append(record['encoded_bytes'])
+
+        by_type = {}
+        saved = 0
+        for record in records:
+            if record['state'] != 'failed' or not record['blocked_reason']:
+                continue
+            loaded = loaded_by_type.get(record['type'])
+            estimate = sum(loaded) // len(loaded) if loaded else estimates.get(record['type'], estimates['Other'])
+            stats = by_type.setdefault(record['type'], {'requests': 0, 'estimated_bytes': 0})
+            stats['requests'] += 1
+            stats['estimated_bytes'] += estimate
+            saved += estimate
+
+        return {
+            'blocked_requests': sum(stats['requests'] for stats in by_type.values()),
+            'loaded_requests': sum(len(sizes) for sizes in loaded_by_type.values()),
+            'loaded_bytes': sum(sum(sizes) for sizes in loaded_by_type.values()),
+            'estimated_saved_bytes': saved,
+            'by_type': by_type,
+        }
+
+
+def attach_network_log(driver, settings=None):
+    """Driver için ayarlı bir NetworkLog oluşturup bağlar (create_driver çağırır)"""
+    real_driver = unwrap_driver(driver)
+    real_driver._network_log = NetworkLog(real_driver, settings)
+    return real_driver._network_log
+
+
+def get_network_log(driver):
+    """Driver'a bağlı paylaşılan NetworkLog örneğini döndürür"""
+    real_driver = unwrap_driver(driver)
+    network_log = getattr(real_driver, '_network_log', None)
+    if network_log is None:
+        network_log = attach_network_log(real_driver)
+    return network_log
+
+
+def log_blocking_savings(driver, page_name):
+    """İstek engelleme açıksa sayfa yüklemesinde kazanılan istek/byte'ı yazdırır
+
+    Args:
+        driver: Selenium WebDriver instance'ı
+        page_name: Rapor satırındaki sayfa adı (örn: "home", "results")
+
+    Returns:
+        dict: blocking_report çıktısı (engelleme kapalıysa None)
+    """
+    block_config = getattr(unwrap_driver(driver), '_request_blocking', None)
+    if not block_config:
+        return None
+    report = get_network_log(driver).blocking_report(block_config.get('estimated_bytes'))
+    print(f"[INFO] [{page_name}] Engellenen istek: {report['blocked_requests']} "
+          f"(~{report['estimated_saved_bytes'] / 1024:.0f} KB tahmini tasarruf), "
+          f"yüklenen: {report['loaded_requests']} istek / {report['loaded_bytes'] / 1024:.0f} KB")
+    return report
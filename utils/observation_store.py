@@ -0,0 +1,271 @@
+"""
+Çalıştırmalar arası sorgulanabilir SQLite fiyat gözlem deposu
+
+Her çıkarılan uçuş bir satırdır; rota, arama günü, uçuş (gidiş) tarihi, havayolu,
+kalkış saati ve tarama zamanı ile anahtarlanır. Tarihler ISO (YYYY-MM-DD)
+saklanır, böylece aralık sorguları indekslerle çalışır. Aylar süren sweep'ler
+yüzlerce CSV'yi yeniden okumadan tek sorguyla DataAnalyzer'a verilebilir.
+
+Kullanım:
+    with ObservationStore() as store:
+        store.add_observations(records, route="İstanbul-Ankara", travel_date="01.06.2030")
+        analyzer = store.to_analyzer(route="İstanbul-Ankara", travel_date_from="2030-06-01")
+"""
+import datetime
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List
+from utils.logger import logger
+
+
+DEFAULT_PATH = "reports/observations.sqlite3"
+
+FLIGHT_COLUMNS = ['departure_time', 'arrival_time', 'airline', 'price', 'connection', 'duration', 'flight_index']
+KEY_COLUMNS = ['route', 'search_date', 'travel_date', 'return_date', 'scraped_at']
+COLUMNS = KEY_COLUMNS + FLIGHT_COLUMNS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    route TEXT NOT NULL,
+    search_date TEXT NOT NULL,
+    travel_date TEXT NOT NULL,
+    return_date TEXT,
+    scraped_at TEXT NOT NULL,
+    departure_time TEXT NOT NULL DEFAULT '',
+    arrival_time TEXT,
+    airline TEXT NOT NULL DEFAULT '',
+    price INTEGER,
+    connection TEXT,
+    duration TEXT,
+    flight_index INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (route, search_date, travel_date, airline, departure_time, scraped_at, flight_index)
+);
+CREATE INDEX IF NOT EXISTS idx_observations_route_travel ON observations (route, travel_date);
+CREATE INDEX IF NOT EXISTS idx_observations_airline ON observations (airline);
+"""
+
+# UNIQUE anahtarındaki opsiyonel alanlar için boş değer yerine yazılan işaretler.
+# SQLite UNIQUE'te NULL'ları birbirinden farklı saydığı için NULL'lu satırlar
+# INSERT OR IGNORE ile her seferinde tekrar eklenirdi; okurken yine None döner.
+KEY_SENTINELS = {'airline': '', 'departure_time': '', 'flight_index': 0}
+
+
+def iso_date(value, date_format="%d.%m.%Y"):
+    """Tarihi ISO (YYYY-MM-DD) metnine çevirir
+
+    Args:
+        value: date/datetime, ISO metin veya date_format biçiminde metin (örn: "01.06.2030")
+        date_format: ISO olmayan metinlerin biçimi (config dates.format)
+
+    Returns:
+        str: ISO tarih veya value boşsa None
+    """
+    if value in (None, ""):
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date().isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    value = str(value).strip()
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        return datetime.datetime.strptime(value, date_format).date().isoformat()
+
+
+def _price(value):
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+class ObservationStore:
+    """SQLite tabanlı fiyat gözlem deposu"""
+
+    def __init__(self, path=None, date_format="%d.%m.%Y", batch_size=500):
+        """Veritabanını açar, şema ve indeksleri oluşturur
+
+        Args:
+            path: SQLite dosyası (varsayılan: reports/observations.sqlite3, ":memory:" da olur)
+            date_format: ISO olmayan tarih metinlerinin biçimi
+            batch_size: executemany başına satır sayısı
+        """
+        self.path = path or DEFAULT_PATH
+        self.date_format = date_format
+        self.batch_size = batch_size
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate_nullable_keys()
+        logger.info(f"Gözlem deposu açıldı: {self.path}")
+
+    def _migrate_nullable_keys(self):
+        """Eski şemadaki (anahtar kolonları NULL olabilen) dosyaları işaretlere çevirir
+
+        İşarete çevrilemeyen satırlar aynı anahtarlı bir satırın tekrarıdır ve silinir.
+        """
+        nullable = [row['name'] for row in self.conn.execute("PRAGMA table_info(observations)")
+                    if row['name'] in KEY_SENTINELS and not row['notnull']]
+        if not nullable:
+            return
+        with self.conn:
+            for column in nullable:
+                self.conn.execute(f"UPDATE OR IGNORE observations SET {column} = ? WHERE {column} IS NULL",
+                                  (KEY_SENTINELS[column],))
+            removed = sum(self.conn.execute(f"DELETE FROM observations WHERE {column} IS NULL").rowcount
+                          for column in nullable)
+        if removed:
+            logger.info(f"Gözlem deposu: {removed} tekrar eden kayıt silindi")
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml'daki observation_store ve dates ayarlarıyla depo açar"""
+        settings = config.get('observation_store', {})
+        return cls(settings.get('path', DEFAULT_PATH), config.get('dates', {}).get('format', "%d.%m.%Y"),
+                   settings.get('batch_size', 500))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _row(self, record, defaults):
+        row = {column: record.get(column, defaults.get(column)) for column in COLUMNS}
+        row['travel_date'] = iso_date(record.get('travel_date') or record.get('departure_date')
+                                      or defaults.get('travel_date'), self.date_format)
+        if not row['route'] or not row['travel_date']:
+            raise ValueError("Gözlem için route ve travel_date gerekli")
+        row['return_date'] = iso_date(row['return_date'], self.date_format)
+        row['search_date'] = iso_date(row['search_date'], self.date_format)
+        row['price'] = _price(row['price'])
+        for column, sentinel in KEY_SENTINELS.items():
+            if row[column] is None:
+                row[column] = sentinel
+        return tuple(row[column] for column in COLUMNS)
+
+    def add_observations(self, records: Iterable[Dict[str, Any]], route=None, travel_date=None,
+                         return_date=None, search_date=None, scraped_at=None) -> int:
+        """Uçuş kayıtlarını tek transaction içinde, batch'ler halinde ekler
+
+        Kayıttaki route / departure_date / return_date alanları (sweep_runner)
+        parametrelerden önceliklidir. Aynı anahtarla tekrar eklenen satırlar yok sayılır.
+
+        Args:
+            records: extract_all_flight_data şemasında uçuş sözlükleri
+            route: Rota (örn: "İstanbul-Ankara")
+            travel_date: Gidiş tarihi
+            return_date: Dönüş tarihi
+            search_date: Arama günü (varsayılan: bugün)
+            scraped_at: Tarama zamanı (varsayılan: şimdi, ISO saniye)
+
+        Returns:
+            int: Eklenen satır sayısı
+        """
+        now = datetime.datetime.now()
+        defaults = {
+            'route': route,
+            'travel_date': travel_date,
+            'return_date': return_date,
+            'search_date': search_date or now.date(),
+            'scraped_at': scraped_at or now.isoformat(timespec='seconds'),
+        }
+        sql = (f"INSERT OR IGNORE INTO observations ({', '.join(COLUMNS)}) "
+               f"VALUES ({', '.join('?' for _ in COLUMNS)})")
+
+        inserted = 0
+        batch = []
+        with self.conn:
+            for record in records:
+                batch.append(self._row(record, defaults))
+                if len(batch) >= self.batch_size:
+                    inserted += self.conn.executemany(sql, batch).rowcount
+                    batch = []
+            if batch:
+                inserted += self.conn.executemany(sql, batch).rowcount
+        logger.info(f"Gözlem deposuna {inserted} kayıt eklendi")
+        return inserted
+
+    def _where(self, route=None, airline=None, travel_date_from=None, travel_date_to=None,
+               search_date_from=None, search_date_to=None):
+        clauses, params = [], []
+        for column, operator, value in (
+            ('route', '=', route),
+            ('airline', '=', airline),
+            ('travel_date', '>=', iso_date(travel_date_from, self.date_format)),
+            ('travel_date', '<=', iso_date(travel_date_to, self.date_format)),
+            ('search_date', '>=', iso_date(search_date_from, self.date_format)),
+            ('search_date', '<=', iso_date(search_date_to, self.date_format)),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, columns: List[str] = None, limit: int = None, **filters) -> List[Dict[str, Any]]:
+        """Filtrelere uyan gözlemleri döndürür
+
+        Args:
+            columns: Seçilecek kolonlar (varsayılan: tümü)
+            limit: En fazla satır
+            **filters: route, airline, travel_date_from/to, search_date_from/to
+
+        Returns:
+            list: Uçuş sözlükleri (travel_date, scraped_at sırasıyla)
+        """
+        sql, params = self._select(columns, limit, **filters)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def _select(self, columns=None, limit=None, **filters):
+        unknown = set(columns or []) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen kolon(lar): {', '.join(sorted(unknown))}")
+        where, params = self._where(**filters)
+        selected = [f"NULLIF({column}, {KEY_SENTINELS[column]!r}) AS {column}" if column in KEY_SENTINELS else column
+                    for column in columns or COLUMNS]
+        sql = f"SELECT {', '.join(selected)} FROM observations{where} ORDER BY travel_date, scraped_at, flight_index"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return sql, params
+
+    def query_frame(self, columns: List[str] = None, limit: int = None, **filters):
+        """query ile aynı filtrelerle pandas DataFrame döndürür"""
+        import pandas as pd
+        sql, params = self._select(columns, limit, **filters)
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def to_analyzer(self, **filters):
+        """Filtrelere uyan gözlemlerden doğrudan DataAnalyzer oluşturur
+
+        Returns:
+            DataAnalyzer: Tipli şemaya normalize edilmiş analyzer
+        """
+        from utils.data_analysis import DataAnalyzer
+        return DataAnalyzer.from_frame(self.query_frame(**filters))
+
+    def daily_min_prices(self, route, travel_date=None) -> List[Dict[str, Any]]:
+        """Rota (ve opsiyonel gidiş tarihi) için arama günü başına en düşük fiyat
+
+        Returns:
+            list: {travel_date, search_date, min_price, observations} sözlükleri
+        """
+        where, params = self._where(route=route, travel_date_from=travel_date, travel_date_to=travel_date)
+        sql = (f"SELECT travel_date, search_date, MIN(price) AS min_price, COUNT(*) AS observations "
+               f"FROM observations{where} GROUP BY travel_date, search_date ORDER BY travel_date, search_date")
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def count(self, **filters) -> int:
+        """Filtrelere uyan gözlem sayısı"""
+        where, params = self._where(**filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM observations{where}", params).fetchone()[0]
@@ -0,0 +1,180 @@
+"""
+Büyük sweep çıktıları için kolonsal Parquet yazıcı/okuyucu (CSVHelper'ın yanında)
+
+airline / connection / route gibi düşük kardinaliteli kolonlar dictionary
+encoding ile, fiyat ve sıra int32 olarak sıkıştırılmış yazılır. Okurken sadece
+istenen kolonlar (column pushdown) ve filtreye uyan row group'lar (predicate
+pushdown, min/max istatistikleri) diskten okunur.
+
+pyarrow opsiyoneldir; kurulu değilse ImportError açıklayıcı mesajla fırlatılır.
+
+Kullanım:
+    python -m utils.parquet_helper reports/sweep_20300101_120000.csv
+"""
+import argparse
+import csv
+import os
+import time
+from typing import Any, Dict, List
+from utils.logger import logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pa_csv = pq = None
+
+
+DICTIONARY_COLUMNS = ['airline', 'connection', 'route', 'departure_city', 'destination_city']
+INT_COLUMNS = ['price', 'flight_index']
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError("Parquet desteği için pyarrow gerekli: pip install pyarrow")
+
+
+def _column_type(name):
+    if name in DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if name in INT_COLUMNS:
+        return pa.int32()
+    return pa.string()
+
+
+def flight_schema(columns):
+    """Kolon adlarından uçuş şeması üretir (dictionary / int32 / string)"""
+    _require_pyarrow()
+    return pa.schema([(name, _column_type(name)) for name in columns])
+
+
+def _int_or_none(value):
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+class ParquetHelper:
+    """Parquet işlemleri için yardımcı sınıf"""
+
+    @staticmethod
+    def save_flight_data(flight_data: List[Dict[str, Any]], filepath: str, compression: str = DEFAULT_COMPRESSION,
+                         row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        """Uçuş sözlüklerini Parquet dosyasına yazar (CSVHelper.save_flight_data karşılığı)
+
+        Args:
+            flight_data: Uçuş sözlüklerinin listesi
+            filepath: Parquet dosyasının tam yolu
+            compression: Sıkıştırma codec'i (zstd, snappy, gzip, none)
+            row_group_size: Row group başına satır (predicate pushdown birimi)
+        """
+        _require_pyarrow()
+        if not flight_data:
+            print("[WARNING] Kaydedilecek veri yok")
+            return
+
+        columns = sorted({key for flight in flight_data for key in flight})
+        arrays = {}
+        for name in columns:
+            values = [flight.get(name) for flight in flight_data]
+            if name in INT_COLUMNS:
+                values = [_int_or_none(value) for value in values]
+            elif name not in DICTIONARY_COLUMNS:
+                values = [None if value is None else str(value) for value in values]
+            arrays[name] = pa.array(values, type=_column_type(name))
+        table = pa.table(arrays, schema=flight_schema(columns))
+
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        pq.write_table(table, filepath, compression=compression, row_group_size=row_group_size,
+                       use_dictionary=[name for name in columns if name in DICTIONARY_COLUMNS])
+        print(f"[OK] {len(flight_data)} uçuş verisi Parquet'e kaydedildi: {filepath}")
+
+    @staticmethod
+    def csv_to_parquet(csv_path: str, parquet_path: str = None, compression: str = DEFAULT_COMPRESSION,
+                       row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> str:
+        """CSV dosyasını (örn: sweep çıktısı) DictReader'a girmeden Parquet'e çevirir
+
+        Args:
+            csv_path: Kaynak CSV
+            parquet_path: Hedef (varsayılan: aynı ad, .parquet)
+            compression: Sıkıştırma codec'i
+            row_group_size: Row group başına satır
+
+        Returns:
+            str: Yazılan Parquet dosyasının yolu
+        """
+        _require_pyarrow()
+        parquet_path = parquet_path or os.path.splitext(csv_path)[0] + ".parquet"
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f))
+        table = pa_csv.read_csv(
+            csv_path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={field.name: field.type for field in flight_schema(header)},
+                strings_can_be_null=True,
+                null_values=[""],
+            ),
+        )
+        pq.write_table(table, parquet_path, compression=compression, row_group_size=row_group_size,
+                       use_dictionary=[name for name in header if name in DICTIONARY_COLUMNS])
+        logger.info(f"CSV Parquet'e çevrildi: {csv_path} -> {parquet_path} ({table.num_rows} satır)")
+        return parquet_path
+
+    @staticmethod
+    def read_table(filepath: str, columns: List[str] = None, filters=None):
+        """Parquet dosyasını kolon ve predicate pushdown ile okur
+
+        Args:
+            filepath: Parquet dosyası
+            columns: Okunacak kolonlar (varsayılan: tümü); dosyada olmayanlar atlanır
+            filters: pyarrow filtreleri, örn: [('airline', '=', 'Pegasus'), ('price', '<=', 2000)]
+
+        Returns:
+            pyarrow.Table: Sadece istenen kolonlar ve filtreye uyan satırlar
+        """
+        _require_pyarrow()
+        if columns is not None:
+            available = set(pq.read_schema(filepath).names)
+            columns = [name for name in columns if name in available]
+        return pq.read_table(filepath, columns=columns, filters=filters)
+
+    @staticmethod
+    def read_frame(filepath: str, columns: List[str] = None, filters=None):
+        """read_table ile aynı; dictionary kolonlar pandas category olarak döner"""
+        return ParquetHelper.read_table(filepath, columns, filters).to_pandas()
+
+    @staticmethod
+    def read_flight_data(filepath: str, columns: List[str] = None, filters=None) -> List[Dict[str, Any]]:
+        """Parquet dosyasından uçuş sözlüklerini okur (CSVHelper.read_from_csv karşılığı)"""
+        try:
+            data = ParquetHelper.read_table(filepath, columns, filters).to_pylist()
+            logger.info(f"Data read from Parquet: {filepath} ({len(data)} rows)")
+            return data
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read Parquet file: {str(e)}")
+            return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV -> Parquet dönüştürücü")
+    parser.add_argument("csv_paths", nargs="+")
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION)
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    args = parser.parse_args()
+
+    for csv_path in args.csv_paths:
+        started = time.time()
+        parquet_path = ParquetHelper.csv_to_parquet(csv_path, compression=args.compression,
+                                                    row_group_size=args.row_group_size)
+        ratio = os.path.getsize(parquet_path) / max(os.path.getsize(csv_path), 1)
+        print(f"[OK] {csv_path} -> {parquet_path} ({time.time() - started:.2f}s, boyut oranı {ratio:.2f})")
+
+
+if __name__ == "__main__":
+    main()
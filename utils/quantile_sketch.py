@@ -0,0 +1,183 @@
+"""
+Akış halinde güncellenebilen ve birleştirilebilen KLL quantile sketch'i (saf Python)
+
+Fiyatlar kayıt kayıt eklenir, bellek ~k * log(n/k) değerle sınırlı kalır ve
+paralel worker'ların sketch'leri merge ile birleştirilir. İlk sıkıştırmaya
+kadar (yaklaşık k değer) sonuçlar pandas'ın lineer interpolasyonlu quantile'ı
+ile birebir aynıdır; sonrasında rank hatası ~1.7/k mertebesindedir.
+
+Referans: Karnin, Lang, Liberty - "Optimal Quantile Approximation in Streams" (KLL)
+"""
+import math
+import random
+from typing import Any, Dict, Iterable
+
+
+class KLLSketch:
+    """KLL quantile sketch'i"""
+
+    def __init__(self, k: int = 200, c: float = 2 / 3, seed: int = None):
+        """Boş sketch oluşturur
+
+        Args:
+            k: En üst seviye kapasitesi (büyüdükçe hata azalır, bellek artar)
+            c: Alt seviyelerde kapasite azalma oranı
+            seed: Sıkıştırma yazı-turası için tohum (tekrarlanabilir testler)
+        """
+        if k < 2:
+            raise ValueError(f"k en az 2 olmalı: {k}")
+        self.k = k
+        self.c = c
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.compactors = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * self.c ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def _compress(self):
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self._capacity(level):
+                if level + 1 >= len(self.compactors):
+                    self._grow()
+                items = sorted(self.compactors[level])
+                leftover = [items.pop()] if len(items) % 2 else []
+                self.compactors[level + 1].extend(items[self._rng.random() < 0.5::2])
+                self.compactors[level] = leftover
+                self._size = sum(len(compactor) for compactor in self.compactors)
+                if self._size < self._max_size:
+                    break
+
+    def update(self, value):
+        """Tek değer ekler (None / NaN / sayı olmayanlar yok sayılır)
+
+        Returns:
+            bool: Değer eklendiyse True
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return False
+        if math.isnan(value):
+            return False
+        self.compactors[0].append(value)
+        self.count += 1
+        self._size += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self._size >= self._max_size:
+            self._compress()
+        return True
+
+    def extend(self, values: Iterable):
+        """Birden çok değer ekler
+
+        Returns:
+            KLLSketch: self
+        """
+        for value in values:
+            self.update(value)
+        return self
+
+    def merge(self, other: "KLLSketch"):
+        """Başka bir sketch'i (örn: başka worker'ınki) bu sketch'e katar
+
+        Seviye kapasiteleri k ve c'ye bağlı olduğu için farklı parametreli
+        sketch'ler birleştirilemez.
+
+        Returns:
+            KLLSketch: self
+
+        Raises:
+            ValueError: k veya c farklıysa
+        """
+        if (other.k, other.c) != (self.k, self.c):
+            raise ValueError(f"Farklı parametreli sketch'ler birleştirilemez: k={self.k}/{other.k}, c={self.c}/{other.c}")
+        if not other.count:
+            return self
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._size = sum(len(compactor) for compactor in self.compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    @property
+    def exact(self):
+        """Hiç sıkıştırma olmadıysa True (sonuçlar tam)"""
+        return len(self.compactors) == 1
+
+    def _weighted_items(self):
+        items = sorted((value, 2 ** level) for level, compactor in enumerate(self.compactors) for value in compactor)
+        cumulative, total = [], 0
+        for _, weight in items:
+            total += weight
+            cumulative.append(total)
+        return items, cumulative, total
+
+    def quantile(self, q: float):
+        """q quantile'ını (0-1) döndürür
+
+        Returns:
+            float: Quantile değeri veya sketch boşsa None
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"q 0 ile 1 arasında olmalı: {q}")
+        if not self.count:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        if self.exact:
+            values = sorted(self.compactors[0])
+            position = (len(values) - 1) * q
+            lower = int(math.floor(position))
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] + (position - lower) * (values[upper] - values[lower])
+
+        items, cumulative, total = self._weighted_items()
+        target = q * total
+        for (value, _), weight_so_far in zip(items, cumulative):
+            if weight_so_far >= target:
+                return value
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, Any]:
+        """Birden çok quantile'ı {q: değer} sözlüğü olarak döndürür"""
+        return {q: self.quantile(q) for q in qs}
+
+    def rank(self, value) -> float:
+        """value'dan küçük veya eşit değerlerin tahmini oranı (0-1)"""
+        if not self.count:
+            return 0.0
+        items, _, total = self._weighted_items()
+        return sum(weight for item, weight in items if item <= value) / total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON'a yazılabilir durum (from_dict ile geri yüklenir)"""
+        return {'k': self.k, 'c': self.c, 'count': self.count, 'min': self.min, 'max': self.max,
+                'compactors': [list(compactor) for compactor in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], seed: int = None):
+        sketch = cls(state['k'], state['c'], seed)
+        sketch.compactors = [list(compactor) for compactor in state['compactors']] or [[]]
+        sketch.count, sketch.min, sketch.max = state['count'], state['min'], state['max']
+        sketch._size = sum(len(compactor) for compactor in sketch.compactors)
+        sketch._max_size = sum(sketch._capacity(level) for level in range(len(sketch.compactors)))
+        return sketch
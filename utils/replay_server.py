@@ -0,0 +1,252 @@
+"""
+enuygun.com için offline replay sunucusu
+
+Ana sayfa ve sonuç sayfasını, HomePage/ResultsPage'in hedeflediği DOM
+(autocomplete, tarih input'ları, saat slider'ı, havayolu filtresi, uçuş
+kartları) ile yerelde sunar. Sonuç kartları sayfadaki bir XHR ile
+/api/flights/search üzerinden yüklenir. Gecikme eklenebildiği için bekleme
+ve veri çıkarma adımları ağ olmadan tekrarlanabilir şekilde ölçülebilir.
+
+Kullanım:
+    python -m utils.replay_server --port 8765 --latency-ms 100 --api-latency-ms 400
+
+ve config.yaml'da site.url: "http://127.0.0.1:8765"
+"""
+import argparse
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+import yaml
+from utils.logger import logger
+
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "replay" / "templates"
+DEFAULT_SNAPSHOT_DIR = "replay/snapshots"
+
+CITIES = [
+    {"name": "İstanbul", "code": "IST", "airport": "İstanbul Havalimanı"},
+    {"name": "İstanbul", "code": "SAW", "airport": "Sabiha Gökçen Havalimanı"},
+    {"name": "Ankara", "code": "ESB", "airport": "Esenboğa Havalimanı"},
+    {"name": "İzmir", "code": "ADB", "airport": "Adnan Menderes Havalimanı"},
+    {"name": "Antalya", "code": "AYT", "airport": "Antalya Havalimanı"},
+    {"name": "Lefkoşa", "code": "ECN", "airport": "Ercan Havalimanı"},
+]
+
+AIRLINES = [
+    {"code": "TK", "testid": "THY", "name": "Türk Hava Yolları", "base_price": 2400},
+    {"code": "PC", "testid": "Pegasus", "name": "Pegasus", "base_price": 1700},
+    {"code": "VF", "testid": "AJet", "name": "AJet", "base_price": 1500},
+]
+
+
+def generate_flights(route, departure_date, count=60):
+    """Rota ve tarih için deterministik sentetik uçuş listesi üretir
+
+    Args:
+        route: Rota anahtarı (örn: "ist-esb")
+        departure_date: Gidiş tarihi (DD.MM.YYYY)
+        count: Üretilecek uçuş sayısı
+
+    Returns:
+        list: Search API yanıtındaki uçuş sözlükleri
+    """
+    rng = random.Random(f"{route}|{departure_date}")
+    origin, _, destination = route.upper().partition("-")
+    flights = []
+    for i in range(count):
+        airline = rng.choice(AIRLINES)
+        dep_minutes = rng.randrange(0, 24 * 60, 5)
+        stops = 0 if rng.random() < 0.75 else 1
+        duration = rng.randrange(60, 95, 5) + stops * rng.randrange(90, 240, 15)
+        arr_minutes = (dep_minutes + duration) % (24 * 60)
+        price = int(airline["base_price"] * rng.uniform(0.7, 2.2)) + stops * 150
+        flights.append({
+            "id": f"{route}-{i}",
+            "departure": {"time": f"{dep_minutes // 60:02d}:{dep_minutes % 60:02d}", "airport": origin},
+            "arrival": {"time": f"{arr_minutes // 60:02d}:{arr_minutes % 60:02d}", "airport": destination},
+            "airline": {"code": airline["code"], "testid": airline["testid"], "name": airline["name"]},
+            "price": {"amount": price, "currency": "TRY"},
+            "stops": stops,
+            "duration_minutes": duration,
+        })
+    flights.sort(key=lambda flight: flight["price"]["amount"])
+    return flights
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Replay sunucusu istek işleyicisi (ayarlar server nesnesinden okunur)"""
+
+    def log_message(self, format, *args):
+        logger.debug(f"Replay server: {format % args}")
+
+    def _send(self, body, content_type="text/html; charset=utf-8", status=200):
+        payload = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _delay(self, milliseconds):
+        if milliseconds > 0:
+            time.sleep(milliseconds / 1000.0)
+
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/") or "/"
+        self._delay(server.latency_ms)
+
+        snapshot = server.find_snapshot(path)
+        if snapshot is not None:
+            self._send(snapshot.read_bytes())
+            return
+
+        if path in ("/", "/ucak-bileti"):
+            self._send(server.render("home.html", {"__CITIES__": json.dumps(CITIES, ensure_ascii=False)}))
+        elif path.startswith("/ucak-bileti/arama"):
+            self._send(server.render("results.html", {}))
+        elif path == "/api/flights/search":
+            self._delay(server.api_latency_ms)
+            query = parse_qs(parsed.query)
+            route = query.get("route", ["ist-esb"])[0]
+            departure_date = query.get("gidis", [""])[0]
+            flights = generate_flights(route, departure_date, server.flights_per_search)
+            body = json.dumps({"status": "ok", "data": {"route": route, "flights": flights}}, ensure_ascii=False)
+            self._send(body, "application/json; charset=utf-8")
+        else:
+            self._send("<h1>404</h1>", status=404)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Arka planda çalışabilen offline enuygun.com stand-in sunucusu"""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=8765, latency_ms=0, api_latency_ms=300,
+                 flights_per_search=60, snapshot_dir=DEFAULT_SNAPSHOT_DIR):
+        """Sunucuyu oluşturur (başlatmaz)
+
+        Args:
+            host: Dinlenecek adres
+            port: Dinlenecek port (0: boş port seçilir)
+            latency_ms: Her isteğe eklenen gecikme
+            api_latency_ms: Search API yanıtına ek gecikme
+            flights_per_search: Arama başına üretilen uçuş sayısı
+            snapshot_dir: Kayıtlı HTML snapshot dizini (path -> <dir>/<path>.html)
+        """
+        super().__init__((host, port), ReplayHandler)
+        self.latency_ms = latency_ms
+        self.api_latency_ms = api_latency_ms
+        self.flights_per_search = flights_per_search
+        self.snapshot_dir = Path(snapshot_dir)
+        self._templates = {}
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def find_snapshot(self, path):
+        """İstek yolu için kayıtlı snapshot varsa döndürür"""
+        name = "index" if path == "/" else path.strip("/").replace("/", "__")
+        candidate = self.snapshot_dir / f"{name}.html"
+        return candidate if candidate.exists() else None
+
+    def render(self, template_name, replacements):
+        """Şablonu yer tutucuları değiştirerek döndürür"""
+        if template_name not in self._templates:
+            self._templates[template_name] = (TEMPLATE_DIR / template_name).read_text(encoding="utf-8")
+        html = self._templates[template_name]
+        for placeholder, value in replacements.items():
+            html = html.replace(placeholder, value)
+        return html
+
+    def start(self):
+        """Sunucuyu arka plan thread'inde başlatır ve kök URL'i döndürür"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Replay server çalışıyor: {self.url}")
+        return self.url
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self.shutdown()
+        self.server_close()
+
+
+def record_snapshot(driver, path, snapshot_dir=DEFAULT_SNAPSHOT_DIR):
+    """Canlı sayfanın page_source'unu replay snapshot'ı olarak kaydeder
+
+    Args:
+        driver: Selenium WebDriver instance'ı
+        path: Snapshot'ın sunulacağı istek yolu (örn: "/ucak-bileti/arama/ist-esb")
+        snapshot_dir: Snapshot dizini
+
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    name = "index" if path.strip("/") == "" else path.strip("/").replace("/", "__")
+    target = Path(snapshot_dir) / f"{name}.html"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(driver.page_source, encoding="utf-8")
+    return str(target)
+
+
+def server_from_config(config_path="config/config.yaml"):
+    """config.yaml `replay` bölümüne göre sunucu oluşturur"""
+    replay_config = {}
+    if Path(config_path).exists():
+        with io.open(config_path, 'r', encoding='utf-8') as f:
+            replay_config = (yaml.safe_load(f) or {}).get('replay', {})
+    return ReplayServer(
+        host=replay_config.get('host', "127.0.0.1"),
+        port=replay_config.get('port', 8765),
+        latency_ms=replay_config.get('latency_ms', 0),
+        api_latency_ms=replay_config.get('api_latency_ms', 300),
+        flights_per_search=replay_config.get('flights_per_search', 60),
+        snapshot_dir=replay_config.get('snapshot_dir', DEFAULT_SNAPSHOT_DIR),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="enuygun.com offline replay sunucusu")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--latency-ms", type=int)
+    parser.add_argument("--api-latency-ms", type=int)
+    parser.add_argument("--flights", type=int)
+    args = parser.parse_args()
+
+    server = server_from_config()
+    if args.host or args.port is not None:
+        host = args.host or server.server_address[0]
+        port = server.server_address[1] if args.port is None else args.port
+        server.server_close()
+        server = ReplayServer(host, port, server.latency_ms, server.api_latency_ms,
+                              server.flights_per_search, server.snapshot_dir)
+    if args.latency_ms is not None:
+        server.latency_ms = args.latency_ms
+    if args.api_latency_ms is not None:
+        server.api_latency_ms = args.api_latency_ms
+    if args.flights is not None:
+        server.flights_per_search = args.flights
+
+    print(f"[OK] Replay server: {server.url} (latency {server.latency_ms} ms, API {server.api_latency_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[INFO] Replay server durduruluyor...")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
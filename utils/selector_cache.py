@@ -0,0 +1,162 @@
+"""
+Fallback selector listelerinde hangi selector'ın kazandığını hatırlayan önbellek
+
+Sayfa tipi ve alan (örn: results/price) bazında her selector için hit/miss
+sayıları tutulur. Bir sonraki çalıştırmada son kazanan selector önce denenir,
+sık başarısız olanlar listenin sonuna itilir.
+"""
+import atexit
+import io
+import json
+import os
+import threading
+from pathlib import Path
+import yaml
+from utils.logger import logger
+
+
+DEFAULT_CACHE_PATH = ".cache/selector_cache.json"
+
+
+def selector_key(selector):
+    """(By, value) tuple'ını önbellek anahtarına çevirir"""
+    return f"{selector[0]}|{selector[1]}"
+
+
+class SelectorCache:
+    """Diskte saklanan selector çözümleme önbelleği"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, enabled=True):
+        """Önbelleği başlatır ve varsa diskteki kayıtları yükler
+
+        Args:
+            path: JSON önbellek dosyası
+            enabled: False ise sıralama değişmez ve kayıt tutulmaz
+        """
+        self.path = Path(path)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load() if enabled else {}
+
+    def _load(self):
+        """Önbellek dosyasını okur"""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Selector cache okunamadı, yok sayılıyor: {str(e)}")
+            return {}
+
+    def _entry(self, page, field):
+        return self._entries.setdefault(f"{page}/{field}", {'winner': None, 'selectors': {}})
+
+    def order(self, page, field, selectors):
+        """Selector listesini önbelleğe göre yeniden sıralar
+
+        Son kazanan ilk sıraya alınır; diğerleri (miss - hit) skoruna göre,
+        eşitlikte orijinal sırasıyla dizilir.
+
+        Args:
+            page: Sayfa tipi (örn: "results")
+            field: Alan adı (örn: "price")
+            selectors: (By, value) tuple listesi
+
+        Returns:
+            list: Yeniden sıralanmış selector listesi
+        """
+        if not self.enabled:
+            return list(selectors)
+        with self._lock:
+            entry = self._entries.get(f"{page}/{field}")
+        if not entry:
+            return list(selectors)
+
+        winner = entry.get('winner')
+        counts = entry.get('selectors', {})
+
+        def rank(indexed):
+            index, selector = indexed
+            key = selector_key(selector)
+            stats = counts.get(key, {})
+            return (
+                0 if key == winner else 1,
+                stats.get('misses', 0) - stats.get('hits', 0),
+                index,
+            )
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, page, field, selector, hit):
+        """Bir selector denemesinin sonucunu kaydeder
+
+        Args:
+            page: Sayfa tipi
+            field: Alan adı
+            selector: Denenen (By, value) tuple'ı
+            hit: Selector eşleştiyse True
+        """
+        if not self.enabled:
+            return
+        key = selector_key(selector)
+        with self._lock:
+            entry = self._entry(page, field)
+            stats = entry['selectors'].setdefault(key, {'hits': 0, 'misses': 0})
+            if hit:
+                stats['hits'] += 1
+                entry['winner'] = key
+            else:
+                stats['misses'] += 1
+            self._dirty = True
+
+    def stats(self, page=None):
+        """Hit/miss sayılarını döndürür
+
+        Args:
+            page: Sadece bu sayfa tipinin kayıtları (opsiyonel)
+
+        Returns:
+            dict: "page/field" -> {winner, selectors: {key: {hits, misses}}}
+        """
+        with self._lock:
+            snapshot = json.loads(json.dumps(self._entries))
+        if page is None:
+            return snapshot
+        return {key: value for key, value in snapshot.items() if key.startswith(f"{page}/")}
+
+    def save(self):
+        """Değişiklik varsa önbelleği diske atomik olarak yazar"""
+        if not self.enabled or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps(self._entries, indent=2, ensure_ascii=False)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Selector cache yazılamadı: {str(e)}")
+
+
+_shared_cache = None
+
+
+def get_selector_cache(config_path="config/config.yaml"):
+    """Süreç genelinde paylaşılan önbelleği döndürür (çıkışta diske yazılır)"""
+    global _shared_cache
+    if _shared_cache is None:
+        cache_config = {}
+        if Path(config_path).exists():
+            with io.open(config_path, 'r', encoding='utf-8') as f:
+                cache_config = (yaml.safe_load(f) or {}).get('selector_cache', {})
+        _shared_cache = SelectorCache(
+            path=cache_config.get('path', DEFAULT_CACHE_PATH),
+            enabled=cache_config.get('enabled', True),
+        )
+        atexit.register(_shared_cache.save)
+    return _shared_cache
@@ -0,0 +1,113 @@
+"""
+Implicit wait'e takılmadan fallback selector zincirlerini deneme yardımcıları
+
+create_driver implicit wait'i global olarak ayarladığı için başarısız her
+find_element çağrısı implicit_wait kadar bekler. probe() tüm zinciri tek bir
+JS querySelector/XPath taramasıyla dener; hiçbiri eşleşmezse zincirin tamamı
+için tek bir sınırlı explicit wait uygular.
+"""
+from contextlib import contextmanager
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Her selector için root altındaki ilk eşleşmeyi (yoksa null) döndürür
+_SWEEP_SCRIPT = """
+    var root = arguments[0] || document;
+    var selectors = arguments[1];
+    return selectors.map(function (selector) {
+        try {
+            if (selector[0] === 'xpath') {
+                return document.evaluate(selector[1], root, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return root.querySelector(selector[1]);
+        } catch (e) {
+            return null;
+        }
+    });
+"""
+
+_JS_STRATEGIES = (By.CSS_SELECTOR, By.XPATH)
+
+
+def current_implicit_wait(driver, default=0):
+    """Driver'ın mevcut implicit wait değerini (saniye) döndürür"""
+    try:
+        return driver.timeouts.implicit_wait
+    except Exception:
+        return default
+
+
+@contextmanager
+def implicit_wait_disabled(driver):
+    """Blok süresince implicit wait'i 0 yapar, çıkışta eski değere döndürür"""
+    previous = current_implicit_wait(driver)
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(previous)
+
+
+def _sweep(driver, selectors, root):
+    """Tüm selector'ları dener ve her biri için ilk eşleşmeyi döndürür"""
+    if all(selector[0] in _JS_STRATEGIES for selector in selectors):
+        return driver.execute_script(_SWEEP_SCRIPT, root, [list(selector) for selector in selectors])
+
+    matches = []
+    searcher = root if root is not None else driver
+    with implicit_wait_disabled(driver):
+        for selector in selectors:
+            found = searcher.find_elements(*selector)
+            matches.append(found[0] if found else None)
+    return matches
+
+
+def _first_accepted(matches, selectors, accept):
+    for selector, element in zip(selectors, matches):
+        if element is None:
+            continue
+        try:
+            if accept is None or accept(element):
+                return element, selector
+        except StaleElementReferenceException:
+            continue
+    return None
+
+
+def probe(driver, selectors, root=None, timeout=0, poll=0.2, accept=None):
+    """Selector zincirini implicit wait olmadan dener
+
+    Args:
+        driver: Selenium WebDriver instance'ı
+        selectors: Öncelik sırasıyla (By, value) tuple listesi
+        root: Aramanın yapılacağı WebElement (varsayılan: tüm doküman)
+        timeout: Hiçbiri eşleşmezse tüm zincir için toplam bekleme süresi
+        poll: Bekleme sırasında tarama aralığı (saniye)
+        accept: Eşleşen elementi kabul eden opsiyonel callable (örn: is_displayed)
+
+    Returns:
+        tuple: (element, eşleşen selector) veya (None, None)
+    """
+    selectors = list(selectors)
+    if not selectors:
+        return None, None
+
+    result = _first_accepted(_sweep(driver, selectors, root), selectors, accept)
+    if result or timeout <= 0:
+        return result or (None, None)
+
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll,
+            ignored_exceptions=(StaleElementReferenceException,)
+        ).until(lambda d: _first_accepted(_sweep(d, selectors, root), selectors, accept))
+    except TimeoutException:
+        return None, None
+
+
+def is_clickable(element):
+    """Element görünür ve etkin ise True (EC.element_to_be_clickable eşdeğeri)"""
+    return element.is_displayed() and element.is_enabled()
@@ -0,0 +1,283 @@
+"""
+Rota x tarih kombinasyonlarını paralel tarayıcı süreçleriyle tarayan runner
+
+Her worker süreci kendi WebDriver'ına sahiptir. Aramalar süreç havuzuna
+dağıtılır, extract_all_flight_data sonuçları tamamlandıkça tek bir CSV'ye
+akıtılır ve sonunda throughput raporu üretilir.
+
+Kullanım:
+    python -m utils.sweep_runner --workers 4 --offsets 7 14 21
+"""
+import argparse
+import datetime
+import itertools
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from multiprocessing.util import Finalize
+from urllib.parse import urlsplit
+from utils.csv_helper import BufferedCSVWriter
+from utils.observation_store import ObservationStore
+from utils.parquet_helper import ParquetHelper
+from utils.quantile_sketch import KLLSketch
+
+
+PRICE_QUANTILES = (0.1, 0.3, 0.5, 0.9)
+
+FLIGHT_FIELDS = [
+    'route', 'departure_city', 'destination_city', 'departure_date', 'return_date',
+    'flight_index', 'departure_time', 'arrival_time', 'airline', 'price', 'connection', 'duration',
+]
+
+
+@dataclass(frozen=True)
+class SweepJob:
+    """Tek bir arama (rota + tarih çifti)"""
+    departure_city: str
+    destination_city: str
+    departure_date: str
+    return_date: str
+
+    @property
+    def route(self):
+        return f"{self.departure_city}-{self.destination_city}"
+
+
+def build_route_matrix(cities, date_offsets, return_days, date_format="%d.%m.%Y", today=None):
+    """Şehir listesi ve gün ofsetlerinden arama matrisi oluşturur
+
+    Args:
+        cities: Şehir listesi (örn: config test_data.valid_cities)
+        date_offsets: Bugünden itibaren gidiş günü ofsetleri
+        return_days: Gidiş ile dönüş arasındaki gün sayısı
+        date_format: Tarih formatı
+        today: Referans tarih (varsayılan: bugün)
+
+    Returns:
+        list: SweepJob listesi (her sıralı şehir çifti x her ofset)
+    """
+    today = today or datetime.date.today()
+    jobs = []
+    for (departure, destination), offset in itertools.product(itertools.permutations(cities, 2), date_offsets):
+        departure_date = today + datetime.timedelta(days=offset)
+        return_date = departure_date + datetime.timedelta(days=return_days)
+        jobs.append(SweepJob(
+            departure, destination,
+            departure_date.strftime(date_format), return_date.strftime(date_format),
+        ))
+    return jobs
+
+
+_worker_driver = None
+_worker_config = None
+
+
+def _quit_worker_driver():
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except Exception:
+            pass
+        _worker_driver = None
+
+
+def _init_worker(config):
+    """Worker süreci başlangıcı - config'i alır, driver ilk işte açılır
+
+    ProcessPoolExecutor worker'ları os._exit ile çıktığı için atexit çalışmaz;
+    tarayıcı multiprocessing finalizer'ı ile executor kapanırken kapatılır.
+    """
+    global _worker_config
+    _worker_config = config
+    Finalize(None, _quit_worker_driver, exitpriority=10)
+
+
+def _get_worker_driver():
+    global _worker_driver
+    if _worker_driver is None:
+        from utils.browser_factory import create_driver
+        _worker_driver = create_driver()
+    return _worker_driver
+
+
+def _site_origins():
+    site = urlsplit(_worker_config['site']['url'])
+    return [f"{site.scheme}://{site.netloc}"]
+
+
+def _run_job(job, retries):
+    """Worker içinde tek bir aramayı (gerekirse tekrar deneyerek) çalıştırır
+
+    Returns:
+        dict: worker, job, attempts, duration, records ve hata bilgisi
+    """
+    from pages.home_page import HomePage
+    from pages.results_page import ResultsPage
+    from utils.driver_pool import DriverPool
+
+    started = time.time()
+    last_error = None
+    for attempt in range(1, retries + 2):
+        try:
+            driver = _get_worker_driver()
+            home = HomePage(driver)
+            results = ResultsPage(driver)
+            home.search_with_config(
+                _worker_config, job.departure_city, job.destination_city,
+                job.departure_date, job.return_date,
+            )
+            results.wait_for_results()
+            records = results.extract_all_flight_data()
+            if not records:
+                raise Exception("Uçuş verisi çıkarılamadı")
+
+            for record in records:
+                record.update(asdict(job))
+                record['route'] = job.route
+            DriverPool.reset(driver, _site_origins())
+            return {
+                'worker': os.getpid(), 'job': job, 'attempts': attempt,
+                'duration': time.time() - started, 'records': records, 'error': None,
+                'sketch': KLLSketch().extend(record.get('price') for record in records),
+            }
+        except Exception as e:
+            last_error = str(e)
+            # Bozuk durumdaki tarayıcıyı bir sonraki denemede sıfırdan aç
+            if _worker_driver is None or not DriverPool.reset(_worker_driver, _site_origins()):
+                _quit_worker_driver()
+
+    return {
+        'worker': os.getpid(), 'job': job, 'attempts': retries + 1,
+        'duration': time.time() - started, 'records': [], 'error': last_error, 'sketch': None,
+    }
+
+
+def run_sweep(jobs, output_path, workers=2, retries=1, store=None, writer_options=None, config=None):
+    """Aramaları süreç havuzunda çalıştırır ve sonuçları CSV'ye akıtır
+
+    Args:
+        jobs: SweepJob listesi
+        output_path: Birleşik CSV dosyası
+        workers: Worker süreci (= tarayıcı) sayısı
+        retries: İş başına ek deneme sayısı
+        store: Sonuçların ayrıca yazılacağı ObservationStore (opsiyonel)
+        writer_options: BufferedCSVWriter seçenekleri (buffer_rows, flush_interval, fsync)
+        config: Worker'lara verilecek config (varsayılan: config.yaml)
+
+    Returns:
+        dict: Throughput raporu
+    """
+    if config is None:
+        from utils.browser_factory import load_config
+        config = load_config()
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    started = time.time()
+    per_worker = defaultdict(lambda: {'jobs': 0, 'records': 0, 'busy_seconds': 0.0, 'retries': 0})
+    failures = []
+    total_records = 0
+    scraped_at = datetime.datetime.now().isoformat(timespec='seconds')
+    price_sketch = KLLSketch()
+
+    with BufferedCSVWriter(output_path, FLIGHT_FIELDS, append=False, **(writer_options or {})) as writer, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as executor:
+        futures = [executor.submit(_run_job, job, retries) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            stats = per_worker[result['worker']]
+            stats['jobs'] += 1
+            stats['records'] += len(result['records'])
+            stats['busy_seconds'] += result['duration']
+            stats['retries'] += result['attempts'] - 1
+
+            if result['error']:
+                failures.append({'job': asdict(result['job']), 'error': result['error']})
+                print(f"[WARNING] {result['job'].route} {result['job'].departure_date} başarısız: {result['error']}")
+            else:
+                writer.write_rows(result['records'])
+                price_sketch.merge(result['sketch'])
+                if store is not None:
+                    store.add_observations(result['records'], scraped_at=scraped_at)
+                total_records += len(result['records'])
+                print(f"[OK] [{done}/{len(jobs)}] {result['job'].route} {result['job'].departure_date}: "
+                      f"{len(result['records'])} uçuş ({result['duration']:.1f}s, worker {result['worker']})")
+
+    elapsed = time.time() - started
+    return {
+        'jobs': len(jobs),
+        'succeeded': len(jobs) - len(failures),
+        'failed': len(failures),
+        'records': total_records,
+        'elapsed_seconds': round(elapsed, 2),
+        'searches_per_minute': round(len(jobs) / elapsed * 60, 2) if elapsed else 0.0,
+        'records_per_minute': round(total_records / elapsed * 60, 2) if elapsed else 0.0,
+        'workers': {str(pid): dict(stats) for pid, stats in per_worker.items()},
+        'failures': failures,
+        'output': output_path,
+        'price_quantiles': {f"p{int(q * 100)}": price_sketch.quantile(q) for q in PRICE_QUANTILES},
+    }
+
+
+def print_report(report):
+    """Throughput raporunu konsola yazar"""
+    print("=" * 70)
+    print("[SWEEP] Throughput Raporu")
+    print("=" * 70)
+    print(f"   • Arama: {report['succeeded']}/{report['jobs']} başarılı, {report['failed']} başarısız")
+    print(f"   • Toplam uçuş kaydı: {report['records']}")
+    print(f"   • Süre: {report['elapsed_seconds']}s")
+    print(f"   • Throughput: {report['searches_per_minute']} arama/dk, {report['records_per_minute']} kayıt/dk")
+    for pid, stats in report['workers'].items():
+        print(f"   • Worker {pid}: {stats['jobs']} arama, {stats['records']} kayıt, "
+              f"{stats['busy_seconds']:.1f}s meşgul, {stats['retries']} tekrar")
+    quantiles = report.get('price_quantiles') or {}
+    if quantiles.get('p30') is not None:
+        print("   • Fiyat dağılımı (tüm rotalar): " + ", ".join(f"{name} {value:.0f}TL" for name, value in quantiles.items()))
+        print(f"   • Uygun fiyat eşiği (p30): {quantiles['p30']:.0f}TL")
+    print(f"   • CSV: {report['output']}")
+    print("=" * 70)
+
+
+def main():
+    from utils.browser_factory import load_config
+    config = load_config()
+    sweep_config = config.get('sweep', {})
+
+    parser = argparse.ArgumentParser(description="Paralel rota/tarih tarayıcı")
+    parser.add_argument("--workers", type=int, default=sweep_config.get('workers', 2))
+    parser.add_argument("--retries", type=int, default=sweep_config.get('retries', 1))
+    parser.add_argument("--offsets", type=int, nargs="+", default=sweep_config.get('date_offsets', [config['dates']['days_ahead_departure']]))
+    parser.add_argument("--cities", nargs="+", default=config['test_data']['valid_cities'])
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--store", action="store_true", default=config.get('observation_store', {}).get('enabled', False),
+                        help="Sonuçları SQLite gözlem deposuna da yaz")
+    parser.add_argument("--parquet", action="store_true", help="Bitince CSV'nin kolonsal Parquet kopyasını da yaz")
+    args = parser.parse_args()
+
+    jobs = build_route_matrix(args.cities, args.offsets, config['dates']['days_ahead_return'], config['dates']['format'])
+    output = args.output or os.path.join(
+        sweep_config.get('output_dir', 'reports'),
+        f"sweep_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+    )
+    print(f"[INFO] {len(jobs)} arama, {args.workers} worker ile çalıştırılıyor...")
+    store = ObservationStore.from_config(config) if args.store else None
+    try:
+        writer_options = {
+            'buffer_rows': sweep_config.get('csv_buffer_rows', 500),
+            'flush_interval': sweep_config.get('csv_flush_seconds', 5),
+            'fsync': sweep_config.get('csv_fsync', "close"),
+        }
+        print_report(run_sweep(jobs, output, workers=args.workers, retries=args.retries, store=store,
+                               writer_options=writer_options, config=config))
+        if args.parquet:
+            print(f"[OK] Parquet: {ParquetHelper.csv_to_parquet(output)}")
+    finally:
+        if store is not None:
+            print(f"[OK] Gözlem deposu: {store.path} ({store.count()} kayıt)")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
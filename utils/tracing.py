@@ -0,0 +1,226 @@
+"""
+Kritik yol adımları için hafif süre ölçümü (tracing)
+
+Tracer aktifken her span için duvar saati süresi, gönderilen WebDriver komut
+sayısı, time.sleep ile geçen süre ve WebDriverWait ile aktif bekleme süresi
+kaydedilir. Tracer aktif değilken @traced dekoratörü hiçbir şey yapmaz.
+time.sleep ve WebDriverWait süreç genelinde sarılır, ancak sadece tracer'ı
+başlatan thread'deki çağrılar ölçülür; diğer thread'ler doğrudan geçer.
+
+Kullanım:
+    tracer = Tracer("case3")
+    with tracer.activate():
+        home.open(url)               # @traced ile işaretli metotlar otomatik span açar
+        with tracer.span("custom step"):
+            ...
+    tracer.write_json("reports/trace_case3.json")
+    print(tracer.summary_table())
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.command_profiler import add_command_listener
+
+
+_active_tracer = None
+_real_sleep = time.sleep
+_real_until = WebDriverWait.until
+_real_until_not = WebDriverWait.until_not
+
+
+def active_tracer():
+    """Aktif Tracer'ı döndürür (yoksa None)"""
+    return _active_tracer
+
+
+def _current_tracer():
+    """Aktif tracer bu thread'de başlatıldıysa onu, değilse None döndürür"""
+    tracer = _active_tracer
+    if tracer is not None and tracer._thread_id == threading.get_ident():
+        return tracer
+    return None
+
+
+def _count_command(driver_command, elapsed):
+    tracer = _current_tracer()
+    if tracer is not None:
+        tracer.commands += 1
+        tracer.command_types[driver_command] += 1
+
+
+def install_command_hook(driver):
+    """Driver'ın ortak execute hook'una tracing sayacını bağlar
+
+    WebElement komutları da parent driver'ın execute'unu kullandığı için
+    find_element, text, get_attribute vb. hepsi sayılır.
+    """
+    add_command_listener(driver, _count_command)
+
+
+def _traced_sleep(seconds):
+    tracer = _current_tracer()
+    start = time.perf_counter()
+    try:
+        _real_sleep(seconds)
+    finally:
+        # WebDriverWait'in kendi poll uykuları bekleme süresine dahil
+        if tracer is not None and tracer._wait_depth == 0:
+            tracer.sleep_seconds += time.perf_counter() - start
+
+
+def _timed_wait(real_method):
+    def wrapper(self, *args, **kwargs):
+        tracer = _current_tracer()
+        if tracer is None:
+            return real_method(self, *args, **kwargs)
+        tracer._wait_depth += 1
+        start = time.perf_counter()
+        try:
+            return real_method(self, *args, **kwargs)
+        finally:
+            tracer._wait_depth -= 1
+            if tracer._wait_depth == 0:
+                tracer.wait_seconds += time.perf_counter() - start
+    return wrapper
+
+
+class Tracer:
+    """Span'leri ve kümülatif sayaçları tutan tracer"""
+
+    def __init__(self, name="trace"):
+        self.name = name
+        self.spans = []
+        self.commands = 0
+        self.command_types = defaultdict(int)
+        self.sleep_seconds = 0.0
+        self.wait_seconds = 0.0
+        self._wait_depth = 0
+        self._stack = []
+        self._origin = None
+        self._thread_id = None
+
+    def start(self, driver=None):
+        """Tracer'ı aktif yapar; bu thread'deki time.sleep ve WebDriverWait ölçüme alınır
+
+        Args:
+            driver: Komut sayımı için hook takılacak driver (opsiyonel)
+        """
+        global _active_tracer
+        _active_tracer = self
+        self._thread_id = threading.get_ident()
+        self._origin = self._origin or time.perf_counter()
+        install_command_hook(driver)
+        time.sleep = _traced_sleep
+        WebDriverWait.until = _timed_wait(_real_until)
+        WebDriverWait.until_not = _timed_wait(_real_until_not)
+        return self
+
+    def stop(self):
+        """Tracer'ı devre dışı bırakır ve orijinal fonksiyonları geri yükler"""
+        global _active_tracer
+        if _active_tracer is self:
+            _active_tracer = None
+        time.sleep = _real_sleep
+        WebDriverWait.until = _real_until
+        WebDriverWait.until_not = _real_until_not
+
+    @contextmanager
+    def activate(self, driver=None):
+        """start/stop'u with bloğu olarak kullanır"""
+        self.start(driver)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @contextmanager
+    def span(self, name):
+        """Bir adımı ölçer (iç içe kullanılabilir, değerler kapsayıcıdır)"""
+        start = time.perf_counter()
+        commands, sleep_s, wait_s = self.commands, self.sleep_seconds, self.wait_seconds
+        record = {'name': name, 'depth': len(self._stack),
+                  'parent': self._stack[-1]['name'] if self._stack else None}
+        self._stack.append(record)
+        error = None
+        try:
+            yield record
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - start
+            sleep_delta = self.sleep_seconds - sleep_s
+            wait_delta = self.wait_seconds - wait_s
+            record.update({
+                'start_s': round(start - (self._origin or start), 4),
+                'wall_s': round(wall, 4),
+                'commands': self.commands - commands,
+                'sleep_s': round(sleep_delta, 4),
+                'wait_s': round(wait_delta, 4),
+                'active_s': round(max(wall - sleep_delta - wait_delta, 0.0), 4),
+                'error': error,
+            })
+            self.spans.append(record)
+
+    def to_dict(self):
+        """Trace'i JSON'a uygun sözlük olarak döndürür"""
+        return {
+            'name': self.name,
+            'total_commands': self.commands,
+            'command_types': dict(self.command_types),
+            'total_sleep_s': round(self.sleep_seconds, 4),
+            'total_wait_s': round(self.wait_seconds, 4),
+            'spans': sorted(self.spans, key=lambda span: span['start_s']),
+        }
+
+    def write_json(self, path):
+        """Trace'i JSON dosyasına yazar ve yolu döndürür"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    def summary_table(self):
+        """Span'leri isim bazında toplayan metin tablosu döndürür"""
+        totals = {}
+        for span in sorted(self.spans, key=lambda span: span['start_s']):
+            row = totals.setdefault(span['name'], {'calls': 0, 'wall_s': 0.0, 'commands': 0,
+                                                   'sleep_s': 0.0, 'wait_s': 0.0, 'active_s': 0.0})
+            row['calls'] += 1
+            for key in ('wall_s', 'commands', 'sleep_s', 'wait_s', 'active_s'):
+                row[key] += span[key]
+
+        header = f"{'Adım':<40} {'Çağrı':>6} {'Süre(s)':>9} {'Komut':>7} {'Sleep(s)':>9} {'Wait(s)':>9} {'Aktif(s)':>9}"
+        lines = [header, "-" * len(header)]
+        for name, row in totals.items():
+            lines.append(f"{name[:40]:<40} {row['calls']:>6} {row['wall_s']:>9.2f} {row['commands']:>7} "
+                         f"{row['sleep_s']:>9.2f} {row['wait_s']:>9.2f} {row['active_s']:>9.2f}")
+        return "\n".join(lines)
+
+
+def traced(name=None):
+    """Metodu aktif tracer varsa span içinde çalıştıran dekoratör
+
+    Args:
+        name: Span adı (varsayılan: Sınıf.metot)
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _current_tracer()
+            if tracer is None:
+                return func(*args, **kwargs)
+            if args:
+                install_command_hook(getattr(args[0], 'driver', None))
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,262 @@
+"""
+Sabit time.sleep yerine koşul bazlı bekleme yardımcıları
+
+Koşullar expected_conditions ile aynı biçimdedir (driver alan callable);
+wait_until ile kısa aralıklarla yoklanır ve sağlandığı anda döner.
+"""
+import time
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+DEFAULT_POLL = 0.1
+OVERLAY_SELECTOR = ".modal-backdrop, .overlay, .popup-overlay, .onetrust-pc-dark-filter"
+AUTOCOMPLETE_SELECTOR = "[role='listbox'], [class*='autocomplete']"
+AUTOCOMPLETE_OPTION_SELECTOR = "li, div[role='option'], [class*='option'], [class*='item']"
+
+
+def wait_until(driver, condition, timeout=5, poll=DEFAULT_POLL, raise_on_timeout=False):
+    """Koşul sağlanana kadar bekler
+
+    Args:
+        driver: Selenium WebDriver instance'ı
+        condition: driver alan ve truthy değer döndüren callable
+        timeout: Maksimum bekleme süresi (saniye)
+        poll: Yoklama aralığı (saniye)
+        raise_on_timeout: True ise zaman aşımında TimeoutException fırlatır
+
+    Returns:
+        Koşulun döndürdüğü değer, zaman aşımında False
+    """
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll,
+            ignored_exceptions=(StaleElementReferenceException,)
+        ).until(condition)
+    except TimeoutException:
+        if raise_on_timeout:
+            raise
+        return False
+
+
+def _resolve(driver, target):
+    """Locator tuple'ını elemente çevirir, WebElement'i olduğu gibi döndürür"""
+    if isinstance(target, tuple):
+        return driver.find_element(*target)
+    return target
+
+
+class document_ready:
+    """document.readyState 'complete' olduğunda sağlanır"""
+
+    def __call__(self, driver):
+        return driver.execute_script("return document.readyState") == "complete"
+
+
+class element_stable:
+    """Elementin konumu/boyutu art arda yoklamalarda değişmediğinde sağlanır
+
+    Scroll ve animasyon sonrasında tıklamadan önce kullanılır.
+    """
+
+    def __init__(self, target, settle_polls=2):
+        self.target = target
+        self.settle_polls = settle_polls
+        self._last_rect = None
+        self._same_count = 0
+
+    def __call__(self, driver):
+        element = _resolve(driver, self.target)
+        rect = driver.execute_script(
+            "var r = arguments[0].getBoundingClientRect();"
+            "return [Math.round(r.top), Math.round(r.left), Math.round(r.width), Math.round(r.height)];",
+            element
+        )
+        if rect == self._last_rect:
+            self._same_count += 1
+        else:
+            self._last_rect = rect
+            self._same_count = 0
+        return element if self._same_count >= self.settle_polls - 1 else False
+
+
+def _fold(text):
+    """Büyük/küçük harf ve Türkçe İ farkını yok sayan karşılaştırma metni"""
+    return text.lower().replace("\u0307", "")
+
+
+class input_value_committed:
+    """Input değeri beklenen değerlerden birini içerdiğinde (veya boş olmadığında) sağlanır
+
+    Args:
+        target: Input elementi veya locator
+        expected: Beklenen metin ya da alternatif metinler listesi (örn: yazılan şehir
+            ve autocomplete'te tıklanan seçenek); verilmezse boş olmaması yeter
+    """
+
+    def __init__(self, target, expected=None):
+        self.target = target
+        if isinstance(expected, str):
+            expected = [expected]
+        self.expected = [_fold(text) for text in expected or [] if text]
+
+    def __call__(self, driver):
+        element = _resolve(driver, self.target)
+        value = _fold((element.get_attribute("value") or "").strip())
+        if not value:
+            return False
+        if self.expected and not any(text in value for text in self.expected):
+            return False
+        return element
+
+
+class autocomplete_populated:
+    """Görünür bir autocomplete listesi en az bir seçenek içerdiğinde sağlanır
+
+    Returns:
+        WebElement: Seçenekleri içeren liste elementi
+    """
+
+    def __init__(self, list_selector=AUTOCOMPLETE_SELECTOR, option_selector=AUTOCOMPLETE_OPTION_SELECTOR):
+        self.list_selector = list_selector
+        self.option_selector = option_selector
+
+    def __call__(self, driver):
+        return driver.execute_script("""
+            var lists = document.querySelectorAll(arguments[0]);
+            for (var i = 0; i < lists.length; i++) {
+                var list = lists[i];
+                if (list.offsetParent === null) continue;
+                if (list.querySelector(arguments[1])) return list;
+            }
+            return null;
+        """, self.list_selector, self.option_selector) or False
+
+
+class overlay_gone:
+    """Görünür modal/overlay kalmadığında sağlanır"""
+
+    def __init__(self, selector=OVERLAY_SELECTOR):
+        self.selector = selector
+
+    def __call__(self, driver):
+        return driver.execute_script("""
+            var overlays = document.querySelectorAll(arguments[0]);
+            for (var i = 0; i < overlays.length; i++) {
+                var style = window.getComputedStyle(overlays[i]);
+                if (overlays[i].offsetParent !== null && style.visibility !== 'hidden' && style.display !== 'none') {
+                    return false;
+                }
+            }
+            return true;
+        """, self.selector)
+
+
+class url_changed:
+    """Mevcut URL verilen URL'den farklı olduğunda veya yeni sekme açıldığında sağlanır"""
+
+    def __init__(self, old_url, old_handle_count=None):
+        self.old_url = old_url
+        self.old_handle_count = old_handle_count
+
+    def __call__(self, driver):
+        if self.old_handle_count is not None and len(driver.window_handles) > self.old_handle_count:
+            return True
+        return driver.current_url != self.old_url
+
+
+class dom_quiet:
+    """Sayfada belirtilen süre boyunca DOM değişikliği olmadığında sağlanır
+
+    İlk çağrıda sayfaya bir MutationObserver enjekte eder; sonraki yoklamalar
+    sadece son değişiklik zamanını okur.
+    """
+
+    _SCRIPT = """
+        var quietMs = arguments[0];
+        if (!window.__enuygunMutationObserver) {
+            window.__enuygunLastMutation = Date.now();
+            window.__enuygunMutationObserver = new MutationObserver(function () {
+                window.__enuygunLastMutation = Date.now();
+            });
+            window.__enuygunMutationObserver.observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true, characterData: true
+            });
+            return false;
+        }
+        return Date.now() - window.__enuygunLastMutation >= quietMs;
+    """
+
+    def __init__(self, quiet_ms=300):
+        self.quiet_ms = quiet_ms
+
+    def __call__(self, driver):
+        return driver.execute_script(self._SCRIPT, self.quiet_ms)
+
+
+class search_results_settled:
+    """Ağ network_idle_ms boyunca boşta kalıp kart sayısı stable_ms boyunca değişmediğinde sağlanır
+
+    Ağ boşta: performance log'da yanıtı bekleyen XHR/Fetch isteği yok. URL
+    pattern'ı gerekmez; url_patterns verilirse sadece eşleşen istekler sayılır.
+    Performance log yoksa (Firefox veya log alınamıyor) sadece kart sayısı
+    kararlılığına bakılır.
+
+    Returns:
+        int: Son kart sayısı (kart yoksa, XHR görüldüyse ve api_grace geçtiyse True)
+    """
+
+    def __init__(self, network_log, card_selector, stable_ms=600, api_grace=3.0, network_idle_ms=500,
+                 url_patterns=None):
+        self.network_log = network_log
+        self.card_selector = card_selector
+        self.stable_ms = stable_ms
+        self.api_grace = api_grace
+        self.network_idle_ms = network_idle_ms
+        self.url_patterns = list(url_patterns or [])
+        self.requests_seen = False
+        self._started = time.monotonic()
+        self._idle_since = None
+        self._last_count = None
+        self._count_since = None
+
+    def _network_idle(self, now):
+        if self.network_log is None or not self.network_log.available:
+            return True
+        self.network_log.poll()
+        if not self.network_log.available:
+            return True
+        if self.network_log.xhr_requests(self.url_patterns):
+            self.requests_seen = True
+        if self.network_log.pending_xhr_requests(self.url_patterns):
+            self._idle_since = None
+            return False
+        if self._idle_since is None:
+            self._idle_since = now
+        return (now - self._idle_since) * 1000 >= self.network_idle_ms
+
+    def __call__(self, driver):
+        now = time.monotonic()
+        network_idle = self._network_idle(now)
+        count = driver.execute_script("return document.querySelectorAll(arguments[0]).length", self.card_selector)
+        if count != self._last_count:
+            self._last_count, self._count_since = count, now
+            return False
+        if not network_idle or (now - self._count_since) * 1000 < self.stable_ms:
+            return False
+        if count:
+            return count
+        # Sonuçsuz arama: sayfa yükleme XHR'ları arama sanılmasın diye api_grace de beklenir
+        return self.requests_seen and now - self._started >= self.api_grace
+
+
+def scroll_into_view(driver, element, timeout=1):
+    """Elementi ortaya kaydırır ve konumu sabitlenene kadar bekler"""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    wait_until(driver, element_stable(element), timeout=timeout, poll=0.05)
+    return element
+
+
+def settle(driver, quiet_ms=300, timeout=2):
+    """DOM belirtilen süre boyunca değişmeyene kadar (en fazla timeout) bekler"""
+    return wait_until(driver, dom_quiet(quiet_ms), timeout=timeout)